@@ -0,0 +1,29 @@
+import copy
+import threading
+from contextlib import suppress
+from typing import Any, Hashable, Optional
+
+from cachetools import TTLCache
+
+# cachetools的缓存不是线程安全的，读写时需持有锁
+_lock = threading.Lock()
+
+
+def normalize_text(text: str) -> str:
+    """规范化文本，去除首尾及重复的空白字符，使相同的问题共用缓存"""
+    return " ".join(text.split())
+
+
+def cache_get(cache: TTLCache, key: Hashable) -> Optional[Any]:
+    """获取缓存内容的副本，不存在或已过期时返回None，调用方修改结果不会影响缓存"""
+    with _lock:
+        value = cache.get(key)
+    return copy.deepcopy(value)
+
+
+def cache_set(cache: TTLCache, key: Hashable, value: Any) -> None:
+    """缓存一个值的副本，超出容量时淘汰最久未使用的条目"""
+    value = copy.deepcopy(value)
+    # 容量为0时cachetools拒绝写入，即不缓存
+    with _lock, suppress(ValueError):
+        cache[key] = value
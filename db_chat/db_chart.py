@@ -1,10 +1,17 @@
 import os
-import psycopg2
+import threading
+from psycopg2 import pool
 import pandas as pd
 import matplotlib.pyplot as plt
 from typing import Dict, Any
 import json
-from nlp_to_sql import process_natural_language_query
+from cachetools import TTLCache
+from cache import cache_get, cache_set
+from nlp_to_sql import (
+    cache_nlp_result,
+    is_complete_chart_config,
+    process_natural_language_query,
+)
 
 # 配置matplotlib支持中文显示
 plt.rcParams['font.sans-serif'] = ['Microsoft YaHei']  # 用来正常显示中文标签
@@ -19,29 +26,80 @@ DB_CONFIG = {
     'port': '5432'
 }
 
+# 连接池大小
+POOL_MIN_CONN = int(os.getenv("DB_POOL_MIN_CONN", "1"))
+POOL_MAX_CONN = int(os.getenv("DB_POOL_MAX_CONN", "10"))
+
+# 查询结果缓存，相同的SQL在有效期内直接返回缓存的结果
+query_cache = TTLCache(
+    maxsize=int(os.getenv("QUERY_CACHE_SIZE", "128")),
+    ttl=float(os.getenv("QUERY_CACHE_TTL", "60"))
+)
+
+# 等待空闲连接的最长秒数，未设置时一直等待
+POOL_TIMEOUT = float(os.environ["DB_POOL_TIMEOUT"]) if os.getenv("DB_POOL_TIMEOUT") else None
+
+_pool = None
+_pool_lock = threading.Lock()
+# 借出的连接数不超过连接池上限，连接池用尽时getconn会直接报错而不是等待
+_pool_slots = threading.BoundedSemaphore(POOL_MAX_CONN)
+
+def get_pool() -> pool.ThreadedConnectionPool:
+    """获取数据库连接池，首次使用时创建"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = pool.ThreadedConnectionPool(POOL_MIN_CONN, POOL_MAX_CONN, **DB_CONFIG)
+    return _pool
+
 def connect_to_db():
-    """连接到PostgreSQL数据库"""
+    """从连接池获取PostgreSQL数据库连接，连接都被占用时等待归还，用完后需调用release_connection归还；
+    连接失败或等待超时返回None"""
+    if not _pool_slots.acquire(timeout=POOL_TIMEOUT):
+        print(f"数据库连接错误: 等待空闲连接超时({POOL_TIMEOUT}秒)")
+        return None
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
-        return conn
+        return get_pool().getconn()
     except Exception as e:
+        _pool_slots.release()
         print(f"数据库连接错误: {e}")
         return None
 
+def release_connection(conn, close: bool = False) -> None:
+    """将连接归还连接池，close为True或连接已断开时关闭"""
+    try:
+        get_pool().putconn(conn, close=close or bool(conn.closed))
+    finally:
+        _pool_slots.release()
+
 def execute_query(query: str) -> pd.DataFrame:
-    """执行SQL查询并返回DataFrame"""
+    """执行SQL查询并返回DataFrame，相同的查询在缓存有效期内直接返回缓存结果的副本"""
+    # 以原始SQL文本为键，规范化空白会合并字符串常量不同的查询
+    key = query
+    df = cache_get(query_cache, key)
+    if df is not None:
+        return df
+    
     conn = connect_to_db()
     if conn is None:
         return None
     
     try:
         df = pd.read_sql_query(query, conn)
+        cache_set(query_cache, key, df)
         return df
     except Exception as e:
         print(f"查询执行错误:{e}")
         return None
     finally:
-        conn.close()
+        # 结束查询开启的事务再归还连接，连接已损坏时关闭
+        try:
+            conn.rollback()
+            broken = False
+        except Exception:
+            broken = True
+        release_connection(conn, close=broken)
 
 def create_bar_chart(df: pd.DataFrame, x_column: str, y_column: str, title: str = None) -> str:
     """创建柱状图并保存为图片"""
@@ -68,11 +126,15 @@ def process_chart_request(query: str) -> Dict[str, Any]:
     
     sql_query = nlp_result["sql_query"]
     chart_config = nlp_result["chart_config"]
+    if not is_complete_chart_config(chart_config):
+        return {"error": "无法生成图表配置"}
     
     # 执行SQL查询
     df = execute_query(sql_query)
     if df is None:
         return {"error": "无法获取数据"}
+    # SQL执行成功后才缓存问题的处理结果
+    cache_nlp_result(query, nlp_result)
     
     # 创建图表
     chart_path = create_bar_chart(
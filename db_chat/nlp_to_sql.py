@@ -4,9 +4,13 @@ from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_openai import ChatOpenAI
+import functools
 import json
+import os
 from langchain_community.chat_models import ChatOllama
 from IPython.display import Image, display
+from cachetools import TTLCache
+from cache import cache_get, cache_set, normalize_text
 
 
 class TableSchema:
@@ -73,6 +77,15 @@ SQL查询：
 }}
 """
 
+# 绘制图表所需的配置字段
+CHART_CONFIG_KEYS = ("x_column", "y_column", "title")
+
+# 问题到SQL和图表配置的缓存，相同的问题在有效期内不再调用LLM
+nlp_cache = TTLCache(
+    maxsize=int(os.getenv("NLP_CACHE_SIZE", "256")),
+    ttl=float(os.getenv("NLP_CACHE_TTL", "3600"))
+)
+
 class State(TypedDict):
     messages: Annotated[list, add_messages]
     sql_query: str
@@ -199,9 +212,31 @@ def create_nlp_to_sql_graph():
         pass
     return graph_builder.compile()
 
+@functools.lru_cache(maxsize=None)
+def get_nlp_to_sql_graph():
+    """获取编译好的图，只在首次调用时创建，之后的请求共用同一个图和LLM客户端"""
+    return create_nlp_to_sql_graph()
+
+def is_complete_chart_config(chart_config: Dict[str, Any]) -> bool:
+    """图表配置是否包含绘图所需的全部字段，解析失败时的默认表格配置不完整"""
+    return all(chart_config.get(k) for k in CHART_CONFIG_KEYS)
+
+def cache_nlp_result(query: str, result: Dict[str, Any]) -> None:
+    """缓存问题的处理结果，调用方需确认SQL已成功执行，图表配置不完整时不缓存"""
+    if is_complete_chart_config(result["chart_config"]):
+        cache_set(nlp_cache, normalize_text(query), result)
+
 def process_natural_language_query(query: str) -> Dict[str, Any]:
-    """处理自然语言查询"""
-    graph = create_nlp_to_sql_graph()
+    """处理自然语言查询，相同的问题在缓存有效期内直接返回缓存的结果
+
+    结果不会自动缓存，SQL执行成功后由调用方通过cache_nlp_result缓存。
+    """
+    key = normalize_text(query)
+    result = cache_get(nlp_cache, key)
+    if result is not None:
+        return result
+    
+    graph = get_nlp_to_sql_graph()
     
     # 初始化状态
     initial_state = {
@@ -67,15 +67,19 @@ class ChatRequest(BaseModel):
 class ChatResponse(BaseModel):
     messages: List[Dict[str, str]]
 
-def stream_chat(messages: List[Dict[str, str]]):
-    """同步流式聊天处理函数"""
+# 同时生成回复的最大数量，超出的请求排队等待，检索不受此限制
+MAX_CONCURRENT_CHATS = int(os.getenv("MAX_CONCURRENT_CHATS", "8"))
+chat_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHATS)
+
+async def stream_chat(messages: List[Dict[str, str]]):
+    """异步流式聊天处理函数"""
     try:
         # 获取最后一条用户消息
         last_message = messages[-1]["content"]
         logger.info(f"收到用户消息: {last_message}")
         
         # 从知识库中检索相关文档
-        docs = vectorstore_manager.search(last_message, k=3)
+        docs = await vectorstore_manager.asearch(last_message, k=3)
         logger.info(f"检索到 {len(docs)} 条相关文档")
         
         # 构建系统提示，包含检索到的知识
@@ -104,14 +108,19 @@ def stream_chat(messages: List[Dict[str, str]]):
             else:
                 chain_messages.append(AIMessage(content=msg["content"]))
         
-        logger.info("开始生成回复")
-        # 同步流式输出
-        for chunk in llm.stream(chain_messages):
-            if chunk.content:
-                yield f"data: {json.dumps({'content': chunk.content})}\n\n"
+        async with chat_semaphore:
+            logger.info("开始生成回复")
+            # 异步流式输出，每个片段发送给客户端后才读取下一个，客户端读取慢时不会在内存中堆积
+            async for chunk in llm.astream(chain_messages):
+                if chunk.content:
+                    yield f"data: {json.dumps({'content': chunk.content})}\n\n"
         
         logger.info("回复生成完成")
-                
+    
+    except asyncio.CancelledError:
+        # 客户端断开连接，停止生成并释放名额
+        logger.info("客户端已断开，停止生成回复")
+        raise
     except Exception as e:
         error_msg = f"错误：{str(e)}"
         logger.error(error_msg, exc_info=True)
@@ -131,7 +140,12 @@ async def chat(request: ChatRequest):
     logger.info("收到新的聊天请求")
     return StreamingResponse(
         stream_chat(request.messages),
-        media_type="text/event-stream"
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # 禁止反向代理缓冲，保证片段及时送达
+            "X-Accel-Buffering": "no",
+        }
     )
 
 @app.get("/health")
@@ -140,7 +154,7 @@ async def health_check():
     健康检查接口
     """
     logger.info("收到健康检查请求")
-    return {"status": "healthy"}
+    return {"status": "healthy", "cache": vectorstore_manager.cache_stats()}
 
 if __name__ == "__main__":
     logger.info("启动API服务")
@@ -1,53 +1,259 @@
+import hashlib
+import json
 import os
-from typing import List, Optional
+import threading
+from contextlib import suppress
+from itertools import chain, islice
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+from cachetools import TTLCache
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.document_loaders import DirectoryLoader, TextLoader
+from langchain_core.documents import Document
 from langchain_community.vectorstores import Chroma
 from langchain_community.embeddings import HuggingFaceEmbeddings
 
+def normalize_query(query: str) -> str:
+    """规范化查询，去除首尾及重复的空白字符，使相同的问题共用缓存"""
+    return " ".join(query.split())
+
+# 依次尝试的文件编码
+ENCODINGS = ['utf-8', 'gbk', 'gb2312', 'gb18030']
+
+def discover_files(dir_path: str, suffix: str = ".txt") -> Iterator[str]:
+    """逐个返回目录下的文本文件路径，按路径排序，不一次性列出整个目录树"""
+    for root, dirs, files in os.walk(dir_path):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(suffix):
+                yield os.path.join(root, name)
+
+def load_and_split(
+    file_path: str,
+    known_hash: Optional[str],
+    text_splitter: RecursiveCharacterTextSplitter
+) -> Tuple[str, str, Optional[List[Document]]]:
+    """读取并切分单个文件，导入多个文件时在进程池中运行
+    
+    Args:
+        file_path: 文件路径
+        known_hash: 上次导入时的内容哈希，内容未变化时不切分
+        text_splitter: 文本切分器
+        
+    Returns:
+        (文件路径, 内容哈希, 切分后的文档)，内容未变化时文档为None
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    content_hash = hashlib.sha256(raw).hexdigest()
+    if content_hash == known_hash:
+        return file_path, content_hash, None
+    # 逐个文件检测编码
+    for encoding in ENCODINGS:
+        try:
+            text = raw.decode(encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        raise UnicodeDecodeError(
+            ENCODINGS[-1], raw, 0, len(raw), f"无法读取文件，请确保文件是文本文件: {file_path}"
+        )
+    splits = text_splitter.split_documents(
+        [Document(page_content=text, metadata={'source': file_path})]
+    )
+    return file_path, content_hash, splits
+
 class VectorStoreManager:
-    def __init__(self, persist_directory: str = "./chroma_db"):
+    def __init__(
+        self,
+        persist_directory: str = "./chroma_db",
+        cache_size: int = 256,
+        cache_ttl: float = 600,
+        batch_size: int = 256,
+        max_workers: Optional[int] = None
+    ):
         """初始化向量库管理器
         
         Args:
             persist_directory: 向量库持久化存储目录
+            cache_size: 查询向量和检索结果缓存的最大条目数，为0时不缓存
+            cache_ttl: 缓存的有效期（秒）
+            batch_size: 导入时每批计算向量并写入的文档块数量
+            max_workers: 导入时切分文件的进程数，默认为CPU核数
         """
         self.persist_directory = persist_directory
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        # 查询向量只取决于查询文本，检索结果还取决于向量库的版本
+        self.caches: Dict[str, TTLCache] = {
+            "embedding": TTLCache(cache_size, cache_ttl),
+            "result": TTLCache(cache_size, cache_ttl),
+        }
+        # cachetools的缓存不是线程安全的，读写时需持有锁
+        self._cache_lock = threading.Lock()
+        self._cache_counts = {name: {"hits": 0, "misses": 0} for name in self.caches}
+        # 向量库内容每次变化时加一，使之前缓存的检索结果失效
+        self.collection_version = 0
         self.embeddings = HuggingFaceEmbeddings(model_name="shibing624/text2vec-base-chinese")
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=500,
             chunk_overlap=50,
             length_function=len
         )
+        is_new = not os.path.exists(self.persist_directory)
         self.vectorstore = self._init_vectorstore()
+        # 记录已导入文件的内容哈希和文档块ID，用于跳过未变化的文件
+        self.manifest_path = os.path.join(self.persist_directory, "ingest_manifest.json")
+        self.manifest = self._load_manifest()
+        self.files: Dict[str, dict] = self.manifest["files"]
+        if is_new:
+            # 如果不存在，从文本目录创建新的向量数据库
+            self.add_directory('../txts')
     
     def _init_vectorstore(self) -> Chroma:
         """初始化向量数据库"""
-        if os.path.exists(self.persist_directory):
-            return Chroma(
-                persist_directory=self.persist_directory,
-                embedding_function=self.embeddings
-            )
-        
-        # 如果不存在，创建新的向量数据库
-        loader = DirectoryLoader(
-            '../txts',
-            glob="**/*.txt",
-            show_progress=True,
-            loader_cls=TextLoader,
-            loader_kwargs={'encoding': 'utf-8'}
+        return Chroma(
+            persist_directory=self.persist_directory,
+            embedding_function=self.embeddings
         )
-        documents = loader.load()
-        splits = self.text_splitter.split_documents(documents)
+    
+    def _load_manifest(self) -> dict:
+        """读取导入记录"""
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding='utf-8') as f:
+                return json.load(f)
+        return {
+            # 没有导入记录但已有文档块的旧向量库，导入新文件前需按来源删除已有的文档块，避免重复
+            "legacy": bool(self.vectorstore.get(limit=1)["ids"]),
+            "files": {},
+        }
+    
+    def _save_manifest(self) -> None:
+        """先写临时文件再替换，中断时不会留下损坏的记录"""
+        os.makedirs(self.persist_directory, exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False)
+        os.replace(tmp_path, self.manifest_path)
+    
+    def ingest(self, file_paths: Iterable[str], prune_dir: Optional[str] = None) -> Dict[str, int]:
+        """增量导入文件：内容未变化的文件跳过，变化的文件替换原有文档块
         
-        return Chroma.from_documents(
-            documents=splits,
-            embedding=self.embeddings,
-            persist_directory=self.persist_directory
-        )
+        多个文件在进程池中读取和切分，单个文件直接在当前进程中处理，切分结果按批计算向量并写入向量库，每批写入后保存导入记录，
+        中断后重新导入只会处理剩余的文件。
+        
+        Args:
+            file_paths: 要导入的文件路径
+            prune_dir: 若指定，删除该目录下已导入但不再存在的文件的文档块
+            
+        Returns:
+            Dict[str, int]: 新增、更新、跳过、删除及失败的文件数
+        """
+        stats = {"added": 0, "updated": 0, "skipped": 0, "removed": 0, "failed": 0}
+        seen = set()
+        pending_docs: List[Document] = []
+        pending_ids: List[str] = []
+        # 被替换的旧文档块，新的文档块写入后再删除，写入失败时旧的文档块仍可检索
+        pending_deletes: List[str] = []
+        changed = False
+        
+        def flush() -> None:
+            nonlocal pending_docs, pending_ids, pending_deletes, changed
+            if pending_docs or pending_deletes:
+                if pending_docs:
+                    self.vectorstore.add_documents(pending_docs, ids=pending_ids)
+                # 同一文件重复导入时旧ID可能与刚写入的ID相同，不能删除
+                new_ids = set(pending_ids)
+                stale = [i for i in pending_deletes if i not in new_ids]
+                if stale:
+                    self.vectorstore.delete(ids=stale)
+                pending_docs, pending_ids, pending_deletes = [], [], []
+                changed = True
+            self._save_manifest()
+        
+        def process(result: Tuple[str, str, Optional[List[Document]]]) -> None:
+            file_path, content_hash, splits = result
+            key = os.path.abspath(file_path)
+            if splits is None:
+                stats["skipped"] += 1
+                return
+            old = self.files.get(key)
+            if old is not None:
+                pending_deletes.extend(old["ids"])
+                stats["updated"] += 1
+            else:
+                if self.manifest["legacy"]:
+                    pending_deletes.extend(self._source_ids(file_path))
+                stats["added"] += 1
+            # 相同内容的不同文件也使用不同的ID
+            id_prefix = hashlib.sha256(f"{key}\0{content_hash}".encode()).hexdigest()[:32]
+            ids = [f"{id_prefix}:{i}" for i in range(len(splits))]
+            self.files[key] = {"hash": content_hash, "ids": ids}
+            pending_docs.extend(splits)
+            pending_ids.extend(ids)
+            if len(pending_docs) >= self.batch_size:
+                flush()
+        
+        def tasks() -> Iterator[tuple]:
+            for file_path in file_paths:
+                key = os.path.abspath(file_path)
+                seen.add(key)
+                known = self.files.get(key)
+                yield file_path, known["hash"] if known else None, self.text_splitter
+        
+        try:
+            remaining = tasks()
+            head = list(islice(remaining, 2))
+            if len(head) < 2:
+                # 只有一个文件时不值得启动进程池
+                for args in head:
+                    self._handle(args[0], lambda: load_and_split(*args), process, stats)
+            else:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    window = (self.max_workers or os.cpu_count() or 1) * 4
+                    inflight = {}
+                    for args in chain(head, remaining):
+                        inflight[executor.submit(load_and_split, *args)] = args[0]
+                        # 限制同时排队的文件数，切分结果及时写入，不在内存中堆积
+                        if len(inflight) >= window:
+                            done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                            self._collect(done, inflight, process, stats)
+                    self._collect(list(inflight), inflight, process, stats)
+            
+            if prune_dir is not None:
+                prefix = os.path.join(os.path.abspath(prune_dir), "")
+                for key in [k for k in self.files if k.startswith(prefix) and k not in seen]:
+                    self.vectorstore.delete(ids=self.files.pop(key)["ids"])
+                    stats["removed"] += 1
+                    changed = True
+        finally:
+            flush()
+            if changed:
+                self._invalidate_results()
+        return stats
+    
+    def _collect(self, futures, inflight: dict, process, stats: Dict[str, int]) -> None:
+        """处理已完成的切分任务"""
+        for future in futures:
+            self._handle(inflight.pop(future), future.result, process, stats)
+    
+    def _handle(self, file_path: str, get_result, process, stats: Dict[str, int]) -> None:
+        """处理单个文件的切分结果，读取失败的文件计入失败数"""
+        try:
+            process(get_result())
+        except UnicodeDecodeError:
+            print(f"无法读取文件，请确保文件是文本文件: {file_path}")
+            stats["failed"] += 1
+        except OSError as e:
+            print(f"读取文件时出错: {file_path}: {str(e)}")
+            stats["failed"] += 1
+    
+    def _source_ids(self, source: str) -> List[str]:
+        """获取指定来源的所有文档块ID"""
+        return self.vectorstore.get(where={"source": source})["ids"]
     
     def add_file(self, file_path: str) -> bool:
-        """添加单个文件到向量库
+        """添加单个文件到向量库，文件内容未变化时跳过
         
         Args:
             file_path: 文件路径
@@ -60,20 +266,9 @@ class VectorStoreManager:
             return False
             
         try:
-            # 尝试不同编码
-            for encoding in ['utf-8', 'gbk', 'gb2312', 'gb18030']:
-                try:
-                    loader = TextLoader(file_path, encoding=encoding)
-                    documents = loader.load()
-                    break
-                except UnicodeDecodeError:
-                    continue
-            else:
-                print(f"无法读取文件，请确保文件是文本文件: {file_path}")
+            stats = self.ingest([file_path])
+            if stats["failed"]:
                 return False
-            
-            splits = self.text_splitter.split_documents(documents)
-            self.vectorstore.add_documents(splits)
             print(f"成功添加文件: {file_path}")
             return True
             
@@ -82,7 +277,7 @@ class VectorStoreManager:
             return False
     
     def add_directory(self, dir_path: str) -> bool:
-        """添加整个目录到向量库
+        """增量添加整个目录到向量库，只处理新增、修改和删除的文件
         
         Args:
             dir_path: 目录路径
@@ -95,27 +290,11 @@ class VectorStoreManager:
             return False
             
         try:
-            # 尝试不同编码
-            for encoding in ['utf-8', 'gbk', 'gb2312', 'gb18030']:
-                try:
-                    loader = DirectoryLoader(
-                        dir_path,
-                        glob="**/*.txt",
-                        show_progress=True,
-                        loader_cls=TextLoader,
-                        loader_kwargs={'encoding': encoding}
-                    )
-                    documents = loader.load()
-                    break
-                except UnicodeDecodeError:
-                    continue
-            else:
-                print(f"无法读取文件，请确保文件是文本文件: {dir_path}")
-                return False
-            
-            splits = self.text_splitter.split_documents(documents)
-            self.vectorstore.add_documents(splits)
-            print(f"成功添加目录: {dir_path}")
+            stats = self.ingest(discover_files(dir_path), prune_dir=dir_path)
+            print(
+                f"成功添加目录: {dir_path}（新增 {stats['added']}，更新 {stats['updated']}，"
+                f"跳过 {stats['skipped']}，删除 {stats['removed']}，失败 {stats['failed']}）"
+            )
             return True
             
         except Exception as e:
@@ -132,7 +311,75 @@ class VectorStoreManager:
         Returns:
             List[dict]: 搜索结果列表
         """
-        docs = self.vectorstore.similarity_search(query, k=k)
+        query = normalize_query(query)
+        key = (query, k, self.collection_version)
+        results = self._cache_get("result", key)
+        if results is None:
+            embedding = self._cache_get("embedding", query)
+            if embedding is None:
+                embedding = self.embeddings.embed_query(query)
+                self._cache_set("embedding", query, embedding)
+            docs = self.vectorstore.similarity_search_by_vector(embedding, k=k)
+            results = self._to_results(docs)
+            self._cache_set("result", key, results)
+        return list(results)
+    
+    async def asearch(self, query: str, k: int = 3) -> List[dict]:
+        """异步搜索相似文档，不阻塞事件循环
+        
+        Args:
+            query: 搜索关键词
+            k: 返回的文档数量
+            
+        Returns:
+            List[dict]: 搜索结果列表
+        """
+        query = normalize_query(query)
+        key = (query, k, self.collection_version)
+        results = self._cache_get("result", key)
+        if results is None:
+            embedding = self._cache_get("embedding", query)
+            if embedding is None:
+                embedding = await self.embeddings.aembed_query(query)
+                self._cache_set("embedding", query, embedding)
+            docs = await self.vectorstore.asimilarity_search_by_vector(embedding, k=k)
+            results = self._to_results(docs)
+            self._cache_set("result", key, results)
+        return list(results)
+    
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """获取查询向量和检索结果缓存的命中统计
+        
+        Returns:
+            Dict[str, Dict[str, int]]: 各缓存的命中次数、未命中次数和条目数
+        """
+        with self._cache_lock:
+            return {
+                name: {**self._cache_counts[name], "size": len(cache)}
+                for name, cache in self.caches.items()
+            }
+    
+    def _cache_get(self, name: str, key: Hashable) -> Optional[Any]:
+        """从指定缓存取值，不存在或已过期时返回None，并统计命中/未命中次数"""
+        with self._cache_lock:
+            value = self.caches[name].get(key)
+            self._cache_counts[name]["misses" if value is None else "hits"] += 1
+            return value
+    
+    def _cache_set(self, name: str, key: Hashable, value: Any) -> None:
+        """写入指定缓存，超出容量时淘汰最久未使用的条目"""
+        # 容量为0时cachetools拒绝写入，即不缓存
+        with self._cache_lock, suppress(ValueError):
+            self.caches[name][key] = value
+    
+    def _invalidate_results(self) -> None:
+        """向量库内容变化后，使已缓存的检索结果失效"""
+        self.collection_version += 1
+        with self._cache_lock:
+            self.caches["result"].clear()
+    
+    def _to_results(self, docs) -> List[dict]:
+        """将检索到的文档转换为字典列表"""
         results = []
         for doc in docs:
             results.append({
@@ -0,0 +1,136 @@
+import asyncio
+from collections.abc import AsyncIterator, Mapping, Sequence
+from contextlib import asynccontextmanager
+from typing import Any, Optional
+
+from psycopg import AsyncConnection, AsyncCursor
+from psycopg.rows import DictRow, dict_row
+
+from langgraph.cache.base import FullKey, Namespace
+from langgraph.cache.postgres.base import BasePostgresCache
+from langgraph.checkpoint.postgres import _ainternal
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+
+class AsyncPostgresCache(BasePostgresCache):
+    """An asynchronous node result cache backed by a Postgres table.
+
+    Synchronous methods are only allowed from a thread other than the one
+    running the event loop the cache was created on.
+
+    Args:
+        conn (Union[AsyncConnection, AsyncConnectionPool]): The Postgres connection or pool.
+        serde (Optional[SerializerProtocol]): The serializer to use for cached values.
+    """
+
+    lock: asyncio.Lock
+
+    def __init__(
+        self,
+        conn: _ainternal.Conn,
+        *,
+        serde: Optional[SerializerProtocol] = None,
+    ) -> None:
+        super().__init__(serde=serde)
+        self.conn = conn
+        self.lock = asyncio.Lock()
+        self.loop = asyncio.get_running_loop()
+
+    @classmethod
+    @asynccontextmanager
+    async def from_conn_string(
+        cls, conn_string: str, *, serde: Optional[SerializerProtocol] = None
+    ) -> AsyncIterator["AsyncPostgresCache"]:
+        """Create a new AsyncPostgresCache instance from a connection string.
+
+        Args:
+            conn_string (str): The Postgres connection info string.
+
+        Returns:
+            AsyncPostgresCache: A new AsyncPostgresCache instance.
+        """
+        async with await AsyncConnection.connect(
+            conn_string, autocommit=True, prepare_threshold=0, row_factory=dict_row
+        ) as conn:
+            yield cls(conn, serde=serde)
+
+    async def setup(self) -> None:
+        """Set up the cache table asynchronously.
+
+        This method creates the necessary table in the Postgres database if it
+        doesn't already exist and runs database migrations. It MUST be called
+        directly by the user the first time the cache is used.
+        """
+        async with self._cursor() as cur:
+            await cur.execute(self.MIGRATIONS[0])
+            results = await cur.execute(
+                "SELECT v FROM node_cache_migrations ORDER BY v DESC LIMIT 1"
+            )
+            row = await results.fetchone()
+            version = -1 if row is None else row["v"]
+            for v, migration in zip(
+                range(version + 1, len(self.MIGRATIONS)),
+                self.MIGRATIONS[version + 1 :],
+            ):
+                await cur.execute(migration)
+                await cur.execute(f"INSERT INTO node_cache_migrations (v) VALUES ({v})")
+
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        if not keys:
+            return {}
+        by_str, args = self._select_args(keys)
+        async with self._cursor() as cur:
+            await cur.execute(self.SELECT_SQL, args)
+            rows = await cur.fetchall()
+        return self._load_rows(by_str, rows)
+
+    async def aset(self, pairs: Mapping[FullKey, tuple[Any, Optional[int]]]) -> None:
+        if not pairs:
+            return
+        params = self._upsert_params(pairs)
+        async with self._cursor() as cur:
+            await cur.executemany(self.UPSERT_SQL, params)
+
+    async def aclear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        query, args = self._clear_sql(namespaces)
+        async with self._cursor() as cur:
+            await cur.execute(query, args)
+
+    async def asweep(self) -> None:
+        """Delete all expired entries."""
+        async with self._cursor() as cur:
+            await cur.execute(self.DELETE_EXPIRED_SQL)
+
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        self._check_thread()
+        return asyncio.run_coroutine_threadsafe(self.aget(keys), self.loop).result()
+
+    def set(self, pairs: Mapping[FullKey, tuple[Any, Optional[int]]]) -> None:
+        self._check_thread()
+        return asyncio.run_coroutine_threadsafe(self.aset(pairs), self.loop).result()
+
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        self._check_thread()
+        return asyncio.run_coroutine_threadsafe(
+            self.aclear(namespaces), self.loop
+        ).result()
+
+    def _check_thread(self) -> None:
+        try:
+            # only bg threads can block on the event loop
+            if asyncio.get_running_loop() is self.loop:
+                raise asyncio.InvalidStateError(
+                    "Synchronous calls to AsyncPostgresCache are only allowed from a "
+                    "different thread. From the main thread, use the async interface."
+                )
+        except RuntimeError:
+            pass
+
+    @asynccontextmanager
+    async def _cursor(self) -> AsyncIterator[AsyncCursor[DictRow]]:
+        async with _ainternal.get_connection(self.conn) as conn:
+            async with self.lock, conn.cursor(binary=True, row_factory=dict_row) as cur:
+                yield cur
+
+
+__all__ = ["AsyncPostgresCache"]
@@ -0,0 +1,104 @@
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from langgraph.cache.base import BaseCache, FullKey, Namespace
+
+"""
+To add a new migration, add a new string to the MIGRATIONS list.
+The position of the migration in the list is the version number.
+"""
+MIGRATIONS = [
+    """CREATE TABLE IF NOT EXISTS node_cache_migrations (
+    v INTEGER PRIMARY KEY
+);""",
+    """CREATE TABLE IF NOT EXISTS node_cache (
+    ns TEXT NOT NULL,
+    key TEXT NOT NULL,
+    expires_at TIMESTAMPTZ,
+    type TEXT NOT NULL,
+    blob BYTEA NOT NULL,
+    PRIMARY KEY (ns, key)
+);""",
+    # not CONCURRENTLY, which can't run in the transaction of a migration
+    """
+    CREATE INDEX IF NOT EXISTS node_cache_expires_at_idx ON node_cache(expires_at)
+    WHERE expires_at IS NOT NULL;
+    """,
+]
+
+NS_SEP = "\x1f"
+
+SELECT_SQL = """
+select ns, key, type, blob
+from node_cache
+where (ns, key) in (select * from unnest(%s::text[], %s::text[]))
+    and (expires_at is null or expires_at > now())
+"""
+
+UPSERT_SQL = """
+insert into node_cache (ns, key, expires_at, type, blob)
+values (%s, %s, %s, %s, %s)
+on conflict (ns, key) do update
+set expires_at = excluded.expires_at, type = excluded.type, blob = excluded.blob
+"""
+
+DELETE_EXPIRED_SQL = (
+    "delete from node_cache where expires_at is not null and expires_at <= now()"
+)
+
+
+class BasePostgresCache(BaseCache[Any]):
+    MIGRATIONS = MIGRATIONS
+    SELECT_SQL = SELECT_SQL
+    UPSERT_SQL = UPSERT_SQL
+    DELETE_EXPIRED_SQL = DELETE_EXPIRED_SQL
+
+    def _select_args(
+        self, keys: Sequence[FullKey]
+    ) -> tuple[dict[tuple[str, str], FullKey], tuple[list[str], list[str]]]:
+        by_str = {(NS_SEP.join(ns), key): (ns, key) for ns, key in keys}
+        return by_str, ([ns for ns, _ in by_str], [key for _, key in by_str])
+
+    def _load_rows(
+        self,
+        by_str: dict[tuple[str, str], FullKey],
+        rows: Sequence[Mapping[str, Any]],
+    ) -> dict[FullKey, Any]:
+        return {
+            by_str[(row["ns"], row["key"])]: self.serde.loads_typed(
+                (row["type"], row["blob"])
+            )
+            for row in rows
+        }
+
+    def _upsert_params(
+        self, pairs: Mapping[FullKey, tuple[Any, Optional[int]]]
+    ) -> list[tuple[str, str, Optional[datetime], str, bytes]]:
+        now = datetime.now(timezone.utc)
+        params = []
+        for (ns, key), (value, ttl) in pairs.items():
+            type_, blob = self.serde.dumps_typed(value)
+            params.append(
+                (
+                    NS_SEP.join(ns),
+                    key,
+                    now + timedelta(seconds=ttl) if ttl else None,
+                    type_,
+                    blob,
+                )
+            )
+        return params
+
+    def _clear_sql(
+        self, namespaces: Optional[Sequence[Namespace]]
+    ) -> tuple[str, tuple[Any, ...]]:
+        if namespaces is None or not all(namespaces):
+            return "delete from node_cache", ()
+        clauses = []
+        args: list[str] = []
+        for ns in namespaces:
+            prefix = NS_SEP.join(ns)
+            clauses.append("ns = %s or starts_with(ns, %s)")
+            args.extend((prefix, prefix + NS_SEP))
+        return "delete from node_cache where " + " or ".join(clauses), tuple(args)
@@ -357,6 +357,24 @@ class PostgresSaver(BasePostgresSaver):
                 ),
             )
 
+    def put_writes_batch(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint.
+
+        All writes are saved in a single pipeline.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            writes (List[Tuple[str, str, List[Tuple[str, Any]]]]): List of (task_id, task_path, writes) for each task.
+        """
+        params = self._dump_writes_batch(config, writes)
+        with self._cursor(pipeline=True) as cur:
+            for query, query_params in params.items():
+                cur.executemany(query, query_params)
+
     @contextmanager
     def _cursor(self, *, pipeline: bool = False) -> Iterator[Cursor[DictRow]]:
         """Create a database cursor as a context manager.
@@ -314,6 +314,24 @@ class AsyncPostgresSaver(BasePostgresSaver):
         async with self._cursor(pipeline=True) as cur:
             await cur.executemany(query, params)
 
+    async def aput_writes_batch(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint asynchronously.
+
+        All writes are saved in a single pipeline.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            writes (List[Tuple[str, str, List[Tuple[str, Any]]]]): List of (task_id, task_path, writes) for each task.
+        """
+        params = await asyncio.to_thread(self._dump_writes_batch, config, writes)
+        async with self._cursor(pipeline=True) as cur:
+            for query, query_params in params.items():
+                await cur.executemany(query, query_params)
+
     @asynccontextmanager
     async def _cursor(
         self, *, pipeline: bool = False
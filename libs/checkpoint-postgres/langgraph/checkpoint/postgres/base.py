@@ -241,6 +241,33 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
             for idx, (channel, value) in enumerate(writes)
         ]
 
+    def _dump_writes_batch(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, str, Sequence[tuple[str, Any]]]],
+    ) -> dict[str, list[tuple[str, str, str, str, str, int, str, str, bytes]]]:
+        """Group the writes of several tasks by the query that stores them."""
+        params: dict[
+            str, list[tuple[str, str, str, str, str, int, str, str, bytes]]
+        ] = {}
+        for task_id, task_path, task_writes in writes:
+            query = (
+                self.UPSERT_CHECKPOINT_WRITES_SQL
+                if all(w[0] in WRITES_IDX_MAP for w in task_writes)
+                else self.INSERT_CHECKPOINT_WRITES_SQL
+            )
+            params.setdefault(query, []).extend(
+                self._dump_writes(
+                    config["configurable"]["thread_id"],
+                    config["configurable"]["checkpoint_ns"],
+                    config["configurable"]["checkpoint_id"],
+                    task_id,
+                    task_path,
+                    task_writes,
+                )
+            )
+        return params
+
     def _load_metadata(self, metadata: dict[str, Any]) -> CheckpointMetadata:
         return self.jsonplus_serde.loads(self.jsonplus_serde.dumps(metadata))
 
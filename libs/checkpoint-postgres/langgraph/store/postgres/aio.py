@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from collections.abc import AsyncIterator, Iterable, Sequence
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Iterable, Sequence
 from contextlib import asynccontextmanager
 from types import TracebackType
 from typing import Any, Callable, Optional, Union, cast
@@ -21,12 +21,18 @@ from langgraph.store.base import (
 )
 from langgraph.store.base.batch import AsyncBatchedBaseStore
 from langgraph.store.postgres.base import (
+    BULK_PUT_MERGE_SQL,
+    BULK_PUT_MERGE_WITH_VECTORS_SQL,
+    BULK_PUT_STAGING_SQL,
+    BULK_PUT_VECTORS_STAGING_SQL,
     PLACEHOLDER,
     BasePostgresStore,
+    EmbeddingCache,
     PoolConfig,
     PostgresIndexConfig,
     Row,
     TTLConfig,
+    _chunked,
     _decode_ns_bytes,
     _ensure_index_config,
     _group_ops,
@@ -122,6 +128,7 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
         "supports_pipeline",
         "index_config",
         "embeddings",
+        "embedding_cache",
         "ttl_config",
         "_ttl_sweeper_task",
         "_ttl_stop_event",
@@ -153,8 +160,12 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
         self.index_config = index
         if self.index_config:
             self.embeddings, self.index_config = _ensure_index_config(self.index_config)
+            self.embedding_cache = EmbeddingCache(
+                self.index_config.get("embedding_cache_size", 1000)
+            )
         else:
             self.embeddings = None
+            self.embedding_cache = None
 
         self.ttl_config = ttl
         self._ttl_sweeper_task: Optional[asyncio.Task[None]] = None
@@ -272,6 +283,90 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
                         "INSERT INTO vector_migrations (v) VALUES (%s)", (v,)
                     )
 
+    async def abulk_put(
+        self,
+        items: Union[Iterable[PutOp], AsyncIterable[PutOp]],
+        *,
+        batch_size: int = 1000,
+        embed_batch_size: int = 100,
+        max_concurrency: int = 4,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """Insert or update a large number of items, eg. to backfill the store.
+
+        Items are written in chunks of `batch_size`, each streamed with `COPY`
+        into a staging table and merged into the store in a single statement and
+        transaction, so a failure only loses the chunk being written. Texts to
+        index are embedded in batches of `embed_batch_size`, running up to
+        `max_concurrency` embedding calls at a time.
+
+        Args:
+            items: The items to put, as an iterable or async iterable. Items
+                with the same namespace and key in a chunk are deduplicated,
+                keeping the last one. Items without a `ttl` get the default TTL
+                of the store, if configured.
+            batch_size: Number of items to write per chunk.
+            embed_batch_size: Number of texts to embed per embedding call.
+            max_concurrency: Maximum number of concurrent embedding calls.
+            on_progress: Called after each chunk with the number of items
+                written so far.
+
+        Returns:
+            The number of items written.
+        """
+        if self.pipe:
+            raise ValueError("bulk_put is not supported with a pipeline, as COPY isn't")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def aembed_batch(texts: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await self.embeddings.aembed_documents(texts)  # type: ignore[union-attr]
+
+        async def aembed(texts: list[str]) -> list[list[float]]:
+            batches = await asyncio.gather(
+                *(
+                    aembed_batch(texts[i : i + embed_batch_size])
+                    for i in range(0, len(texts), embed_batch_size)
+                )
+            )
+            return [vector for vectors in batches for vector in vectors]
+
+        total = 0
+        async for chunk in _achunked(items, batch_size):
+            rows, txt_params = self._prepare_bulk_put(chunk)
+            vectors: list[list[float]] = []
+            if txt_params:
+                async with self._cursor() as cur:
+                    vectors = await self._aembed_documents(
+                        [param[-1] for param in txt_params], cur, aembed
+                    )
+            async with (
+                _ainternal.get_connection(self.conn) as conn,
+                self.lock,
+                conn.transaction(),
+                conn.cursor() as cur,
+            ):
+                await cur.execute(BULK_PUT_STAGING_SQL)
+                async with cur.copy(
+                    "COPY store_bulk_put (prefix, key, value, ttl_minutes) FROM STDIN"
+                ) as copy:
+                    for row in rows:
+                        await copy.write_row(row)
+                if self.index_config:
+                    await cur.execute(BULK_PUT_VECTORS_STAGING_SQL)
+                    async with cur.copy(
+                        "COPY store_bulk_put_vectors (prefix, key, field_name, embedding) FROM STDIN"
+                    ) as copy:
+                        for (ns, k, pathname, _), vector in zip(txt_params, vectors):
+                            await copy.write_row((ns, k, pathname, vector))
+                    await cur.execute(BULK_PUT_MERGE_WITH_VECTORS_SQL)
+                else:
+                    await cur.execute(BULK_PUT_MERGE_SQL)
+            total += len(rows)
+            if on_progress is not None:
+                on_progress(total)
+        return total
+
     async def sweep_ttl(self) -> int:
         """Delete expired store items based on TTL.
 
@@ -457,8 +552,8 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
                     f"Please provide an EmbeddingConfig when initializing the {self.__class__.__name__}."
                 )
             query, txt_params = embedding_request
-            vectors = await self.embeddings.aembed_documents(
-                [param[-1] for param in txt_params]
+            vectors = await self._aembed_documents(
+                [param[-1] for param in txt_params], cur
             )
             queries.append(
                 (
@@ -483,8 +578,8 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
         queries, embedding_requests = self._prepare_batch_search_queries(search_ops)
 
         if embedding_requests and self.embeddings:
-            vectors = await self.embeddings.aembed_documents(
-                [query for _, query in embedding_requests]
+            vectors = await self._aembed_documents(
+                [query for _, query in embedding_requests], cur
             )
             for (idx, _), vector in zip(embedding_requests, vectors):
                 _paramslist = queries[idx][1]
@@ -503,6 +598,24 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
             ]
             results[idx] = items
 
+    async def _aembed_documents(
+        self,
+        texts: Sequence[str],
+        cur: AsyncCursor[DictRow],
+        aembed: Optional[Callable[[list[str]], Awaitable[list[list[float]]]]] = None,
+    ) -> list[list[float]]:
+        """Embed the texts, reusing cached embeddings of identical texts."""
+        keys, vectors, missing = self._get_cached_embeddings(texts)
+        if query := self._get_embedding_cache_query(missing):
+            await cur.execute(*query)
+            self._load_cached_embeddings(await cur.fetchall(), vectors, missing)
+        if missing:
+            aembed = aembed or self.embeddings.aembed_documents  # type: ignore[union-attr]
+            embedded = await aembed(list(missing.values()))
+            if query := self._save_embeddings(dict(zip(missing, embedded)), vectors):
+                await cur.execute(*query)
+        return [vectors[key] for key in keys]
+
     async def _batch_list_namespaces_ops(
         self,
         list_ops: Sequence[tuple[int, ListNamespacesOp]],
@@ -561,3 +674,20 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
                     conn.cursor(binary=True) as cur,
                 ):
                     yield cur
+
+
+async def _achunked(
+    items: Union[Iterable[PutOp], AsyncIterable[PutOp]], size: int
+) -> AsyncIterator[list[PutOp]]:
+    if not isinstance(items, AsyncIterable):
+        for chunk in _chunked(items, size):
+            yield chunk
+        return
+    chunk: list[PutOp] = []
+    async for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
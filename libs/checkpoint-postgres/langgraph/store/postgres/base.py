@@ -1,9 +1,11 @@
 import asyncio
 import concurrent.futures
+import hashlib
+import itertools
 import json
 import logging
 import threading
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from collections.abc import Iterable, Iterator, Sequence
 from contextlib import contextmanager
 from datetime import datetime
@@ -41,6 +43,7 @@ from langgraph.store.base import (
     SearchItem,
     SearchOp,
     TTLConfig,
+    _validate_namespace,
     ensure_embeddings,
     get_text_at_path,
     tokenize_path,
@@ -137,10 +140,65 @@ CREATE INDEX CONCURRENTLY IF NOT EXISTS store_vectors_embedding_idx ON store_vec
             ),
         },
     ),
+    Migration(
+        """
+CREATE TABLE IF NOT EXISTS store_embedding_cache (
+    content_hash text PRIMARY KEY,
+    embedding real[] NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+""",
+    ),
 ]
 
 
+# staging tables for bulk_put, dropped at the end of each chunk's transaction
+BULK_PUT_STAGING_SQL = """
+CREATE TEMP TABLE store_bulk_put (
+    prefix text NOT NULL,
+    key text NOT NULL,
+    value jsonb NOT NULL,
+    ttl_minutes real
+) ON COMMIT DROP;
+"""
+
+BULK_PUT_VECTORS_STAGING_SQL = """
+CREATE TEMP TABLE store_bulk_put_vectors (
+    prefix text NOT NULL,
+    key text NOT NULL,
+    field_name text NOT NULL,
+    embedding real[] NOT NULL
+) ON COMMIT DROP;
+"""
+
+BULK_PUT_MERGE_SQL = """
+INSERT INTO store (prefix, key, value, created_at, updated_at, expires_at, ttl_minutes)
+SELECT prefix, key, value, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP,
+    NOW() + ttl_minutes * INTERVAL '1 minute', ttl_minutes
+FROM store_bulk_put
+ON CONFLICT (prefix, key) DO UPDATE
+SET value = EXCLUDED.value,
+    updated_at = CURRENT_TIMESTAMP,
+    expires_at = EXCLUDED.expires_at,
+    ttl_minutes = EXCLUDED.ttl_minutes
+"""
+
+BULK_PUT_MERGE_WITH_VECTORS_SQL = f"""
+WITH items AS (
+{BULK_PUT_MERGE_SQL.strip()}
+RETURNING prefix
+)
+INSERT INTO store_vectors (prefix, key, field_name, embedding, created_at, updated_at)
+SELECT prefix, key, field_name, embedding, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+FROM store_bulk_put_vectors
+ON CONFLICT (prefix, key, field_name) DO UPDATE
+SET embedding = EXCLUDED.embedding,
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+
 C = TypeVar("C", bound=Union[_pg_internal.Conn, _ainternal.Conn])
+T = TypeVar("T")
 
 
 class PoolConfig(TypedDict, total=False):
@@ -224,6 +282,56 @@ class PostgresIndexConfig(IndexConfig, total=False):
     - 'inner_product': Dot product
     - 'cosine': Cosine similarity
     """
+    embedding_cache_size: int
+    """Number of embeddings kept in memory, keyed by a hash of the embedding
+    model and the embedded text, so that re-putting unchanged text or repeating
+    a search query doesn't call the embedding model again. Set to 0 to disable.
+    Defaults to 1000."""
+    embedding_cache_table: bool
+    """Also cache embeddings in the `store_embedding_cache` table, shared by all
+    stores using the database. Ignored, with a warning, if the embedding model
+    can't be identified, see `embedding_model_id`. Defaults to False."""
+    embedding_model_id: str
+    """Identifies the embedding model in the keys of cached embeddings. Required
+    to use the `store_embedding_cache` table if `embed` is a lambda or a function
+    defined inside another function, as those can't be told apart by name.
+    Defaults to the name of the model, function or class."""
+
+
+class EmbeddingCache:
+    """In-memory LRU cache of embeddings, keyed by content hash."""
+
+    __slots__ = ("maxsize", "entries", "lock", "hits", "misses")
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.entries: OrderedDict[str, list[float]] = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, keys: Iterable[str]) -> dict[str, list[float]]:
+        """Return the cached embeddings for the given keys, skipping missing ones."""
+        found: dict[str, list[float]] = {}
+        with self.lock:
+            for key in keys:
+                if (vector := self.entries.get(key)) is not None:
+                    self.entries.move_to_end(key)
+                    found[key] = vector
+                    self.hits += 1
+                else:
+                    self.misses += 1
+        return found
+
+    def put(self, vectors: dict[str, list[float]]) -> None:
+        if self.maxsize <= 0:
+            return
+        with self.lock:
+            for key, vector in vectors.items():
+                self.entries[key] = vector
+                self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
 
 
 class BasePostgresStore(Generic[C]):
@@ -232,6 +340,8 @@ class BasePostgresStore(Generic[C]):
     conn: C
     _deserializer: Optional[Callable[[Union[bytes, orjson.Fragment]], dict[str, Any]]]
     index_config: Optional[PostgresIndexConfig]
+    embedding_cache: Optional[EmbeddingCache]
+    ttl_config: Optional[TTLConfig]
 
     def _get_batch_GET_ops_queries(
         self,
@@ -333,7 +443,7 @@ class BasePostgresStore(Generic[C]):
             # First handle main store insertions
             for op in inserts:
                 if op.ttl is not None:
-                    expires_at_str = f"NOW() + INTERVAL '{op.ttl*60} seconds'"
+                    expires_at_str = f"NOW() + INTERVAL '{op.ttl * 60} seconds'"
                     ttl_minutes = op.ttl
                 else:
                     expires_at_str = "NULL"
@@ -353,26 +463,10 @@ class BasePostgresStore(Generic[C]):
 
             # Then handle embeddings if configured
             if self.index_config:
-                for op in inserts:
-                    if op.index is False:
-                        continue
-                    value = op.value
-                    ns = _namespace_to_text(op.namespace)
-                    k = op.key
-
-                    if op.index is None:
-                        paths = cast(dict, self.index_config)["__tokenized_fields"]
-                    else:
-                        paths = [(ix, tokenize_path(ix)) for ix in op.index]
-
-                    for path, tokenized_path in paths:
-                        texts = get_text_at_path(value, tokenized_path)
-                        for i, text in enumerate(texts):
-                            pathname = f"{path}.{i}" if len(texts) > 1 else path
-                            vector_values.append(
-                                "(%s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
-                            )
-                            embedding_request_params.append((ns, k, pathname, text))
+                embedding_request_params = self._get_texts_to_embed(inserts)
+                vector_values = [
+                    "(%s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+                ] * len(embedding_request_params)
 
             values_str = ",".join(values)
             query = f"""
@@ -399,6 +493,127 @@ class BasePostgresStore(Generic[C]):
 
         return queries, embedding_request
 
+    def _get_texts_to_embed(
+        self, inserts: Iterable[PutOp]
+    ) -> list[tuple[str, str, str, str]]:
+        """Extract the (namespace, key, field name, text) to embed for each put."""
+        texts_to_embed: list[tuple[str, str, str, str]] = []
+        for op in inserts:
+            if op.index is False:
+                continue
+            value = op.value
+            ns = _namespace_to_text(op.namespace)
+            k = op.key
+
+            if op.index is None:
+                paths = cast(dict, self.index_config)["__tokenized_fields"]
+            else:
+                paths = [(ix, tokenize_path(ix)) for ix in op.index]
+
+            for path, tokenized_path in paths:
+                texts = get_text_at_path(value, tokenized_path)
+                for i, text in enumerate(texts):
+                    pathname = f"{path}.{i}" if len(texts) > 1 else path
+                    texts_to_embed.append((ns, k, pathname, text))
+        return texts_to_embed
+
+    def _prepare_bulk_put(
+        self, ops: Sequence[PutOp]
+    ) -> tuple[
+        list[tuple[str, str, Jsonb, Optional[float]]], list[tuple[str, str, str, str]]
+    ]:
+        """Build the rows to copy into the staging table for a chunk of a bulk
+        put, along with the texts to embed."""
+        dedupped_ops: dict[tuple[tuple[str, ...], str], PutOp] = {}
+        for op in ops:
+            if op.value is None:
+                raise ValueError(
+                    "bulk_put can't delete items, got a PutOp without a value"
+                )
+            _validate_namespace(op.namespace)
+            dedupped_ops[(op.namespace, op.key)] = op
+        # items without a TTL expire after the default TTL, as with put()
+        default_ttl = self.ttl_config.get("default_ttl") if self.ttl_config else None
+        rows = [
+            (
+                _namespace_to_text(op.namespace),
+                op.key,
+                Jsonb(op.value),
+                op.ttl if op.ttl is not None else default_ttl,
+            )
+            for op in dedupped_ops.values()
+        ]
+        if self.index_config:
+            return rows, self._get_texts_to_embed(dedupped_ops.values())
+        else:
+            return rows, []
+
+    def _get_cached_embeddings(
+        self, texts: Sequence[str]
+    ) -> tuple[list[str], dict[str, list[float]], dict[str, str]]:
+        """Hash the texts to embed, and look them up in the in-memory cache.
+
+        Returns the key of each text, the embeddings found by key, and the
+        distinct texts still to embed by key.
+        """
+        model = cast(PostgresIndexConfig, self.index_config)["__embedding_model"]
+        keys = [
+            hashlib.sha256(f"{model}\0{text}".encode()).hexdigest() for text in texts
+        ]
+        vectors = cast(EmbeddingCache, self.embedding_cache).get(dict.fromkeys(keys))
+        missing = {key: text for key, text in zip(keys, texts) if key not in vectors}
+        return keys, vectors, missing
+
+    def _get_embedding_cache_query(
+        self, missing: dict[str, str]
+    ) -> Optional[tuple[str, list]]:
+        """Build the query to fetch embeddings from the `store_embedding_cache`
+        table, if enabled."""
+        if not missing or not cast(PostgresIndexConfig, self.index_config).get(
+            "embedding_cache_table"
+        ):
+            return None
+        return (
+            "SELECT content_hash, embedding FROM store_embedding_cache WHERE content_hash = ANY(%s)",
+            [list(missing)],
+        )
+
+    def _load_cached_embeddings(
+        self,
+        rows: Iterable[Any],
+        vectors: dict[str, list[float]],
+        missing: dict[str, str],
+    ) -> None:
+        """Move embeddings fetched from the `store_embedding_cache` table from
+        `missing` to `vectors`."""
+        loaded = {row["content_hash"]: row["embedding"] for row in rows}
+        cast(EmbeddingCache, self.embedding_cache).put(loaded)
+        vectors.update(loaded)
+        for key in loaded:
+            missing.pop(key, None)
+
+    def _save_embeddings(
+        self,
+        embedded: dict[str, list[float]],
+        vectors: dict[str, list[float]],
+    ) -> Optional[tuple[str, list]]:
+        """Cache newly computed embeddings, returning the query to also save them
+        to the `store_embedding_cache` table, if enabled."""
+        cast(EmbeddingCache, self.embedding_cache).put(embedded)
+        vectors.update(embedded)
+        if not embedded or not cast(PostgresIndexConfig, self.index_config).get(
+            "embedding_cache_table"
+        ):
+            return None
+        return (
+            f"""
+                INSERT INTO store_embedding_cache (content_hash, embedding)
+                VALUES {",".join(["(%s, %s)"] * len(embedded))}
+                ON CONFLICT (content_hash) DO NOTHING
+            """,
+            [p for key, vector in embedded.items() for p in (key, vector)],
+        )
+
     def _prepare_batch_search_queries(
         self,
         search_ops: Sequence[tuple[int, SearchOp]],
@@ -710,6 +925,7 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
         "supports_pipeline",
         "index_config",
         "embeddings",
+        "embedding_cache",
         "_ttl_sweeper_thread",
         "_ttl_stop_event",
     )
@@ -735,8 +951,12 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
         self.index_config = index
         if self.index_config:
             self.embeddings, self.index_config = _ensure_index_config(self.index_config)
+            self.embedding_cache = EmbeddingCache(
+                self.index_config.get("embedding_cache_size", 1000)
+            )
         else:
             self.embeddings = None
+            self.embedding_cache = None
         self.ttl_config = ttl
         self._ttl_sweeper_thread: Optional[threading.Thread] = None
         self._ttl_stop_event = threading.Event()
@@ -793,6 +1013,102 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
                 else:
                     yield cls(conn, index=index, ttl=ttl)
 
+    def bulk_put(
+        self,
+        items: Iterable[PutOp],
+        *,
+        batch_size: int = 1000,
+        embed_batch_size: int = 100,
+        max_concurrency: int = 4,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """Insert or update a large number of items, eg. to backfill the store.
+
+        Items are written in chunks of `batch_size`, each streamed with `COPY`
+        into a staging table and merged into the store in a single statement and
+        transaction, so a failure only loses the chunk being written. Texts to
+        index are embedded in batches of `embed_batch_size`, running up to
+        `max_concurrency` embedding calls at a time.
+
+        Args:
+            items: The items to put. Items with the same namespace and key in a
+                chunk are deduplicated, keeping the last one. Items without a
+                `ttl` get the default TTL of the store, if configured.
+            batch_size: Number of items to write per chunk.
+            embed_batch_size: Number of texts to embed per embedding call.
+            max_concurrency: Maximum number of concurrent embedding calls.
+            on_progress: Called after each chunk with the number of items
+                written so far.
+
+        Returns:
+            The number of items written.
+
+        ???+ example "Example"
+            ```python
+            from langgraph.store.base import PutOp
+
+            store.bulk_put(
+                (PutOp(("memories", row.user_id), row.id, row.memory) for row in rows),
+                on_progress=lambda n: print(f"{n} memories migrated"),
+            )
+            ```
+        """
+        if self.pipe:
+            raise ValueError("bulk_put is not supported with a pipeline, as COPY isn't")
+        total = 0
+        with concurrent.futures.ThreadPoolExecutor(max_concurrency) as executor:
+
+            def embed(texts: list[str]) -> list[list[float]]:
+                batches = [
+                    texts[i : i + embed_batch_size]
+                    for i in range(0, len(texts), embed_batch_size)
+                ]
+                return [
+                    vector
+                    for vectors in executor.map(
+                        self.embeddings.embed_documents,  # type: ignore[union-attr]
+                        batches,
+                    )
+                    for vector in vectors
+                ]
+
+            for chunk in _chunked(items, batch_size):
+                rows, txt_params = self._prepare_bulk_put(chunk)
+                vectors: list[list[float]] = []
+                if txt_params:
+                    with self._cursor() as cur:
+                        vectors = self._embed_documents(
+                            [param[-1] for param in txt_params], cur, embed
+                        )
+                with (
+                    _pg_internal.get_connection(self.conn) as conn,
+                    self.lock,
+                    conn.transaction(),
+                    conn.cursor() as cur,
+                ):
+                    cur.execute(BULK_PUT_STAGING_SQL)
+                    with cur.copy(
+                        "COPY store_bulk_put (prefix, key, value, ttl_minutes) FROM STDIN"
+                    ) as copy:
+                        for row in rows:
+                            copy.write_row(row)
+                    if self.index_config:
+                        cur.execute(BULK_PUT_VECTORS_STAGING_SQL)
+                        with cur.copy(
+                            "COPY store_bulk_put_vectors (prefix, key, field_name, embedding) FROM STDIN"
+                        ) as copy:
+                            for (ns, k, pathname, _), vector in zip(
+                                txt_params, vectors
+                            ):
+                                copy.write_row((ns, k, pathname, vector))
+                        cur.execute(BULK_PUT_MERGE_WITH_VECTORS_SQL)
+                    else:
+                        cur.execute(BULK_PUT_MERGE_SQL)
+                total += len(rows)
+                if on_progress is not None:
+                    on_progress(total)
+        return total
+
     def sweep_ttl(self) -> int:
         """Delete expired store items based on TTL.
 
@@ -1010,9 +1326,7 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
                 )
             query, txt_params = embedding_request
             # Update the params to replace the raw text with the vectors
-            vectors = self.embeddings.embed_documents(
-                [param[-1] for param in txt_params]
-            )
+            vectors = self._embed_documents([param[-1] for param in txt_params], cur)
             queries.append(
                 (
                     query,
@@ -1036,8 +1350,8 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
         queries, embedding_requests = self._prepare_batch_search_queries(search_ops)
 
         if embedding_requests and self.embeddings:
-            embeddings = self.embeddings.embed_documents(
-                [query for _, query in embedding_requests]
+            embeddings = self._embed_documents(
+                [query for _, query in embedding_requests], cur
             )
             for (idx, _), embedding in zip(embedding_requests, embeddings):
                 _paramslist = queries[idx][1]
@@ -1055,6 +1369,24 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
                 for row in rows
             ]
 
+    def _embed_documents(
+        self,
+        texts: Sequence[str],
+        cur: Cursor[DictRow],
+        embed: Optional[Callable[[list[str]], list[list[float]]]] = None,
+    ) -> list[list[float]]:
+        """Embed the texts, reusing cached embeddings of identical texts."""
+        keys, vectors, missing = self._get_cached_embeddings(texts)
+        if query := self._get_embedding_cache_query(missing):
+            cur.execute(*query)
+            self._load_cached_embeddings(cur.fetchall(), vectors, missing)
+        if missing:
+            embed = embed or self.embeddings.embed_documents  # type: ignore[union-attr]
+            embedded = embed(list(missing.values()))
+            if query := self._save_embeddings(dict(zip(missing, embedded)), vectors):
+                cur.execute(*query)
+        return [vectors[key] for key in keys]
+
     def _batch_list_namespaces_ops(
         self,
         list_ops: Sequence[tuple[int, ListNamespacesOp]],
@@ -1246,6 +1578,12 @@ def _row_to_search_item(
     )
 
 
+def _chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
 def _group_ops(ops: Iterable[Op]) -> tuple[dict[type, list[tuple[int, Op]]], int]:
     grouped_ops: dict[type, list[tuple[int, Op]]] = defaultdict(list)
     tot = 0
@@ -1335,10 +1673,44 @@ def _ensure_index_config(
             tot += len(toks)
     index_config["__tokenized_fields"] = tokenized
     index_config["__estimated_num_vectors"] = tot
+    model_id, stable = _embedding_model_id(index_config)
+    if not stable and index_config.get("embedding_cache_table"):
+        logger.warning(
+            "Not caching embeddings in the store_embedding_cache table, as the "
+            f"embedding function {model_id} can't be told apart from others by "
+            "name. Set embedding_model_id in the index config to enable it."
+        )
+        index_config["embedding_cache_table"] = False
+    index_config["__embedding_model"] = model_id
     embeddings = ensure_embeddings(
         index_config.get("embed"),
     )
     return embeddings, index_config
 
 
+def _embedding_model_id(index_config: PostgresIndexConfig) -> tuple[str, bool]:
+    """Identify the embedding model, so that cached embeddings are only reused
+    for the model and dimensions that computed them.
+
+    Returns the id, and whether it's the same in every process and unique to
+    the model, which isn't the case for lambdas and functions defined inside
+    other functions, eg. all closures returned by a factory share their name."""
+    embed = index_config.get("embed")
+    stable = True
+    if model_id := index_config.get("embedding_model_id"):
+        model = model_id
+    elif isinstance(embed, str):
+        model = embed
+    else:
+        # functions are identified by name, Embeddings objects by class
+        obj = embed if hasattr(embed, "__qualname__") else type(embed)
+        model = f"{obj.__module__}.{obj.__qualname__}"
+        for attr in ("model", "model_name"):
+            if isinstance(name := getattr(embed, attr, None), str):
+                model += f":{name}"
+                break
+        stable = "<lambda>" not in model and "<locals>" not in model
+    return f"{model}:{index_config['dims']}", stable
+
+
 PLACEHOLDER = object()
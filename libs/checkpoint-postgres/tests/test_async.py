@@ -21,6 +21,7 @@ from langgraph.checkpoint.postgres.aio import (
     AsyncPostgresSaver,
     AsyncShallowPostgresSaver,
 )
+from langgraph.checkpoint.serde.types import SCHEDULED
 from tests.conftest import DEFAULT_POSTGRES_URI
 
 
@@ -296,3 +297,34 @@ async def test_null_chars(saver_name: str, test_data) -> None:
         assert [c async for c in saver.alist(None, filter={"my_key": "abc"})][
             0
         ].metadata["my_key"] == "abc"
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe", "shallow"])
+async def test_put_writes_batch(saver_name: str, test_data) -> None:
+    async with _saver(saver_name) as saver:
+        config = await saver.aput(
+            test_data["configs"][1],
+            test_data["checkpoints"][1],
+            test_data["metadata"][1],
+            {},
+        )
+        await saver.aput_writes_batch(
+            config,
+            [
+                ("task-1", "~__pregel_pull, a", [("foo", 1), ("bar", 2)]),
+                ("task-2", "~__pregel_push, 0", [(SCHEDULED, None)]),
+            ],
+        )
+        # special writes are replaced, regular writes are kept
+        await saver.aput_writes_batch(
+            config,
+            [
+                ("task-1", "~__pregel_pull, a", [("foo", 3)]),
+                ("task-2", "~__pregel_push, 0", [(SCHEDULED, 1)]),
+            ],
+        )
+        assert (await saver.aget_tuple(config)).pending_writes == [
+            ("task-1", "foo", 1),
+            ("task-1", "bar", 2),
+            ("task-2", SCHEDULED, 1),
+        ]
@@ -7,6 +7,7 @@ from collections.abc import AsyncIterator
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import Any, Optional
+from unittest.mock import patch
 
 import pytest
 from langchain_core.embeddings import Embeddings
@@ -354,6 +355,7 @@ async def _create_vector_store(
     distance_type: str,
     fake_embeddings: CharacterEmbeddings,
     text_fields: Optional[list[str]] = None,
+    embedding_cache_table: bool = False,
 ) -> AsyncIterator[AsyncPostgresStore]:
     """Create a store with vector search enabled."""
     if sys.version_info < (3, 10):
@@ -378,6 +380,7 @@ async def _create_vector_store(
         },
         "distance_type": distance_type,
         "text_fields": text_fields,
+        "embedding_cache_table": embedding_cache_table,
     }
 
     async with await AsyncConnection.connect(
@@ -487,6 +490,79 @@ async def test_vector_update_with_embedding(vector_store: AsyncPostgresStore) ->
     assert not any(r.key == "doc4" for r in results_new)
 
 
+@pytest.mark.parametrize("embedding_cache_table", [False, True])
+async def test_embedding_cache(
+    fake_embeddings: CharacterEmbeddings, embedding_cache_table: bool
+) -> None:
+    """Test that unchanged texts and repeated queries aren't embedded again."""
+    async with _create_vector_store(
+        "vector",
+        "cosine",
+        fake_embeddings,
+        embedding_cache_table=embedding_cache_table,
+    ) as store:
+        with patch.object(
+            fake_embeddings, "aembed_documents", wraps=fake_embeddings.aembed_documents
+        ) as embed:
+            await store.aput(("test",), "doc1", {"text": "zany zebra Xerxes"})
+            await store.aput(("test",), "doc1", {"text": "zany zebra Xerxes"})
+            await store.aput(("test",), "doc2", {"text": "zany zebra Xerxes"})
+            assert embed.call_count == 1
+
+            results = await store.asearch(("test",), query="Zany Xerxes")
+            assert {r.key for r in results} == {"doc1", "doc2"}
+            results = await store.asearch(("test",), query="Zany Xerxes")
+            assert {r.key for r in results} == {"doc1", "doc2"}
+            assert embed.call_count == 2
+
+            # a store with an empty in-memory cache reads the table, if enabled
+            store.embedding_cache.entries.clear()
+            await store.aput(("test",), "doc3", {"text": "zany zebra Xerxes"})
+            assert embed.call_count == (2 if embedding_cache_table else 3)
+
+
+async def test_bulk_put(fake_embeddings: CharacterEmbeddings) -> None:
+    """Test bulk writes with embeddings, in several chunks."""
+    async with _create_vector_store(
+        "vector", "cosine", fake_embeddings, text_fields=["text"]
+    ) as store:
+        progress: list[int] = []
+        written = await store.abulk_put(
+            (
+                PutOp(("test", str(i % 2)), f"doc{i}", {"text": f"doc {i}"})
+                for i in range(25)
+            ),
+            batch_size=10,
+            embed_batch_size=4,
+            on_progress=progress.append,
+        )
+        assert written == 25
+        assert progress == [10, 20, 25]
+        item = await store.aget(("test", "1"), "doc3")
+        assert item is not None
+        assert item.value == {"text": "doc 3"}
+        results = await store.asearch(("test",), query="doc 3", limit=30)
+        assert len(results) == 25
+        assert results[0].key == "doc3"
+
+        # existing items are updated, keeping the last put of each key
+        written = await store.abulk_put(
+            [
+                PutOp(("test", "1"), "doc3", {"text": "updated"}),
+                PutOp(("test", "1"), "doc3", {"text": "zany zebra"}),
+            ]
+        )
+        assert written == 1
+        item = await store.aget(("test", "1"), "doc3")
+        assert item is not None
+        assert item.value == {"text": "zany zebra"}
+        results = await store.asearch(("test",), query="zany zebra", limit=1)
+        assert results[0].key == "doc3"
+
+        with pytest.raises(ValueError):
+            await store.abulk_put([PutOp(("test", "1"), "doc3", None)])
+
+
 async def test_vector_search_with_filters(vector_store: AsyncPostgresStore) -> None:
     """Test combining vector search with filters."""
     docs = [
@@ -689,3 +765,22 @@ async def test_store_ttl(store):
     # Now has been (TTL_SECONDS-2)*2 > TTL_SECONDS + TTL_SECONDS/2
     results = await store.asearch(ns, query="bar", refresh_ttl=False)
     assert len(results) == 0
+
+
+async def test_bulk_put_default_ttl(store: AsyncPostgresStore) -> None:
+    """Items bulk written without a TTL get the default TTL, as with put."""
+    await store.abulk_put(
+        [
+            PutOp(("foo",), "default", {"foo": "bar"}),
+            PutOp(("foo",), "explicit", {"foo": "bar"}, ttl=2 * TTL_MINUTES),
+        ]
+    )
+    async with store._cursor() as cur:
+        await cur.execute(
+            "SELECT key, ttl_minutes, expires_at FROM store WHERE prefix = 'foo' ORDER BY key"
+        )
+        rows = await cur.fetchall()
+    assert [row["key"] for row in rows] == ["default", "explicit"]
+    assert rows[0]["ttl_minutes"] == pytest.approx(TTL_MINUTES)
+    assert rows[1]["ttl_minutes"] == pytest.approx(2 * TTL_MINUTES)
+    assert all(row["expires_at"] is not None for row in rows)
@@ -0,0 +1,167 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from uuid import uuid4
+
+import pytest
+from psycopg import AsyncConnection, Connection
+from psycopg.rows import dict_row
+
+from langgraph.cache.postgres import PostgresCache
+from langgraph.cache.postgres.aio import AsyncPostgresCache
+from langgraph.cache.postgres.base import MIGRATIONS
+from tests.conftest import DEFAULT_POSTGRES_URI
+
+ENTRIES = {
+    (("a", "b"), "k1"): ([("x", 1)], None),
+    (("a", "c"), "k2"): ({"v": 2}, 60),
+    (("d",), "k3"): ("expired", 60),
+}
+
+
+@contextmanager
+def _database() -> Iterator[str]:
+    """Create a unique database, so that migrations run from scratch."""
+    database = f"test_{uuid4().hex[:16]}"
+    with Connection.connect(DEFAULT_POSTGRES_URI, autocommit=True) as conn:
+        conn.execute(f"CREATE DATABASE {database}")
+    try:
+        yield DEFAULT_POSTGRES_URI + database
+    finally:
+        with Connection.connect(DEFAULT_POSTGRES_URI, autocommit=True) as conn:
+            conn.execute(f"DROP DATABASE {database}")
+
+
+@asynccontextmanager
+async def _async_cache() -> AsyncIterator[AsyncPostgresCache]:
+    with _database() as uri:
+        async with AsyncPostgresCache.from_conn_string(uri) as cache:
+            await cache.setup()
+            yield cache
+
+
+@pytest.mark.parametrize("autocommit", [True, False])
+def test_setup(autocommit: bool) -> None:
+    with _database() as uri:
+        # migrations also run in a transaction, eg. on a connection without autocommit
+        with Connection.connect(
+            uri, autocommit=autocommit, row_factory=dict_row
+        ) as conn:
+            cache = PostgresCache(conn)
+            cache.setup()
+            conn.commit()
+            # migrations are only run once
+            cache.setup()
+            conn.commit()
+            with cache._cursor() as cur:
+                cur.execute("SELECT v FROM node_cache_migrations ORDER BY v")
+                assert [row["v"] for row in cur.fetchall()] == list(
+                    range(len(MIGRATIONS))
+                )
+                cur.execute(
+                    "SELECT indexname FROM pg_indexes WHERE tablename = 'node_cache'"
+                )
+                assert "node_cache_expires_at_idx" in {
+                    row["indexname"] for row in cur.fetchall()
+                }
+
+
+def test_get_set_clear() -> None:
+    with _database() as uri, PostgresCache.from_conn_string(uri) as cache:
+        cache.setup()
+        assert cache.get([]) == {}
+        cache.set({})
+        cache.set(ENTRIES)
+        # expire one of the entries
+        with cache._cursor() as cur:
+            cur.execute(
+                "UPDATE node_cache SET expires_at = now() - interval '1 second' "
+                "WHERE key = 'k3'"
+            )
+
+        assert cache.get(
+            [(("a", "b"), "k1"), (("a", "c"), "k2"), (("d",), "k3"), (("a",), "k1")]
+        ) == {
+            (("a", "b"), "k1"): [["x", 1]],
+            (("a", "c"), "k2"): {"v": 2},
+        }
+
+        # setting an entry again replaces its value and expiry
+        cache.set({(("a", "b"), "k1"): ("updated", 60)})
+        assert cache.get([(("a", "b"), "k1")]) == {(("a", "b"), "k1"): "updated"}
+
+        # expired entries are deleted by sweep
+        cache.sweep()
+        with cache._cursor() as cur:
+            cur.execute("SELECT key FROM node_cache ORDER BY key")
+            assert [row["key"] for row in cur.fetchall()] == ["k1", "k2"]
+
+        # clearing a namespace also clears the namespaces nested in it
+        cache.clear([("a", "b")])
+        assert cache.get([(("a", "b"), "k1"), (("a", "c"), "k2")]) == {
+            (("a", "c"), "k2"): {"v": 2}
+        }
+        cache.clear([("a",)])
+        assert cache.get([(("a", "c"), "k2")]) == {}
+        cache.set(ENTRIES)
+        cache.clear()
+        assert cache.get(list(ENTRIES)) == {}
+
+
+async def test_async_get_set_clear() -> None:
+    async with _async_cache() as cache:
+        assert await cache.aget([]) == {}
+        await cache.aset(ENTRIES)
+        async with cache._cursor() as cur:
+            await cur.execute(
+                "UPDATE node_cache SET expires_at = now() - interval '1 second' "
+                "WHERE key = 'k3'"
+            )
+
+        assert await cache.aget(
+            [(("a", "b"), "k1"), (("a", "c"), "k2"), (("d",), "k3"), (("a",), "k1")]
+        ) == {
+            (("a", "b"), "k1"): [["x", 1]],
+            (("a", "c"), "k2"): {"v": 2},
+        }
+
+        await cache.asweep()
+        async with cache._cursor() as cur:
+            await cur.execute("SELECT key FROM node_cache ORDER BY key")
+            assert [row["key"] for row in await cur.fetchall()] == ["k1", "k2"]
+
+        await cache.aclear([("a", "b")])
+        assert await cache.aget([(("a", "b"), "k1"), (("a", "c"), "k2")]) == {
+            (("a", "c"), "k2"): {"v": 2}
+        }
+        await cache.aclear()
+        assert await cache.aget(list(ENTRIES)) == {}
+
+
+async def test_async_sync_methods() -> None:
+    async with _async_cache() as cache:
+        # sync methods are only allowed from other threads
+        with pytest.raises(asyncio.InvalidStateError):
+            cache.get([(("a", "b"), "k1")])
+
+        await asyncio.to_thread(cache.set, ENTRIES)
+        assert await asyncio.to_thread(cache.get, [(("a", "c"), "k2")]) == {
+            (("a", "c"), "k2"): {"v": 2}
+        }
+        await asyncio.to_thread(cache.clear)
+        assert await cache.aget(list(ENTRIES)) == {}
+
+
+async def test_async_setup() -> None:
+    with _database() as uri:
+        async with await AsyncConnection.connect(
+            uri, autocommit=True, row_factory=dict_row
+        ) as conn:
+            cache = AsyncPostgresCache(conn)
+            await cache.setup()
+            await cache.setup()
+            async with cache._cursor() as cur:
+                await cur.execute("SELECT v FROM node_cache_migrations ORDER BY v")
+                assert [row["v"] for row in await cur.fetchall()] == list(
+                    range(len(MIGRATIONS))
+                )
@@ -4,6 +4,7 @@ import re
 import time
 from contextlib import contextmanager
 from typing import Any, Optional
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
@@ -19,6 +20,7 @@ from langgraph.store.base import (
     SearchOp,
 )
 from langgraph.store.postgres import PostgresStore
+from langgraph.store.postgres.base import _ensure_index_config
 from tests.conftest import (
     DEFAULT_URI,
     VECTOR_TYPES,
@@ -381,6 +383,7 @@ def _create_vector_store(
     fake_embeddings: Embeddings,
     text_fields: Optional[list[str]] = None,
     enable_ttl: bool = True,
+    embedding_cache_table: bool = False,
 ) -> PostgresStore:
     """Create a store with vector search enabled."""
     database = f"test_{uuid4().hex[:16]}"
@@ -402,6 +405,7 @@ def _create_vector_store(
         },
         "distance_type": distance_type,
         "text_fields": text_fields,
+        "embedding_cache_table": embedding_cache_table,
     }
 
     with Connection.connect(admin_conn_string, autocommit=True) as conn:
@@ -510,6 +514,114 @@ def test_vector_update_with_embedding(vector_store: PostgresStore) -> None:
     assert not any(r.key == "doc4" for r in results_new)
 
 
+@pytest.mark.parametrize("embedding_cache_table", [False, True])
+def test_embedding_cache(
+    fake_embeddings: CharacterEmbeddings, embedding_cache_table: bool
+) -> None:
+    """Test that unchanged texts and repeated queries aren't embedded again."""
+    with _create_vector_store(
+        "vector",
+        "cosine",
+        fake_embeddings,
+        embedding_cache_table=embedding_cache_table,
+    ) as store:
+        with patch.object(
+            fake_embeddings, "embed_documents", wraps=fake_embeddings.embed_documents
+        ) as embed:
+            store.put(("test",), "doc1", {"text": "zany zebra Xerxes"})
+            store.put(("test",), "doc1", {"text": "zany zebra Xerxes"})
+            store.put(("test",), "doc2", {"text": "zany zebra Xerxes"})
+            assert embed.call_count == 1
+
+            results = store.search(("test",), query="Zany Xerxes")
+            assert {r.key for r in results} == {"doc1", "doc2"}
+            results = store.search(("test",), query="Zany Xerxes")
+            assert {r.key for r in results} == {"doc1", "doc2"}
+            assert embed.call_count == 2
+
+            # a store with an empty in-memory cache reads the table, if enabled
+            store.embedding_cache.entries.clear()
+            store.put(("test",), "doc3", {"text": "zany zebra Xerxes"})
+            assert embed.call_count == (2 if embedding_cache_table else 3)
+
+
+def _make_embed(scale: float):
+    def embed(texts: list[str]) -> list[list[float]]:
+        return [[scale * len(text), 1.0] for text in texts]
+
+    return embed
+
+
+def test_embedding_cache_table_model_id(
+    fake_embeddings: CharacterEmbeddings,
+) -> None:
+    """Only embedding models that can be told apart by name share the table."""
+    _, config = _ensure_index_config(
+        {"dims": 2, "embed": fake_embeddings, "embedding_cache_table": True}
+    )
+    assert config["embedding_cache_table"]
+
+    # lambdas and closures of the same factory share their name
+    for embed in (lambda texts: [[1.0, 1.0] for _ in texts], _make_embed(2.0)):
+        _, config = _ensure_index_config(
+            {"dims": 2, "embed": embed, "embedding_cache_table": True}
+        )
+        assert not config["embedding_cache_table"]
+
+    _, config = _ensure_index_config(
+        {
+            "dims": 2,
+            "embed": _make_embed(2.0),
+            "embedding_cache_table": True,
+            "embedding_model_id": "scaled-2",
+        }
+    )
+    assert config["embedding_cache_table"]
+    assert config["__embedding_model"] == "scaled-2:2"
+
+
+def test_bulk_put(fake_embeddings: CharacterEmbeddings) -> None:
+    """Test bulk writes with embeddings, in several chunks."""
+    with _create_vector_store(
+        "vector", "cosine", fake_embeddings, text_fields=["text"]
+    ) as store:
+        progress: list[int] = []
+        written = store.bulk_put(
+            (
+                PutOp(("test", str(i % 2)), f"doc{i}", {"text": f"doc {i}"})
+                for i in range(25)
+            ),
+            batch_size=10,
+            embed_batch_size=4,
+            on_progress=progress.append,
+        )
+        assert written == 25
+        assert progress == [10, 20, 25]
+        item = store.get(("test", "1"), "doc3")
+        assert item is not None
+        assert item.value == {"text": "doc 3"}
+        results = store.search(("test",), query="doc 3", limit=30)
+        assert len(results) == 25
+        assert results[0].key == "doc3"
+
+        # existing items are updated, keeping the last put of each key
+        written = store.bulk_put(
+            [
+                PutOp(("test", "1"), "doc3", {"text": "updated"}),
+                PutOp(("test", "1"), "doc3", {"text": "zany zebra"}),
+            ]
+        )
+        assert written == 1
+        item = store.get(("test", "1"), "doc3")
+        assert item is not None
+        assert item.value == {"text": "zany zebra"}
+        results = store.search(("test",), query="zany zebra", limit=1)
+        assert results[0].key == "doc3"
+
+        with pytest.raises(ValueError):
+            store.bulk_put([PutOp(("test", "1"), "doc3", None)])
+
+
 @pytest.mark.parametrize("refresh_ttl", [True, False])
 def test_vector_search_with_filters(
     vector_store: PostgresStore, refresh_ttl: bool
@@ -860,3 +972,22 @@ def test_store_ttl(store):
     # Now has been (TTL_SECONDS-2)*2 > TTL_SECONDS + TTL_SECONDS/2
     res = store.search(ns, query="bar", refresh_ttl=False)
     assert len(res) == 0
+
+
+def test_bulk_put_default_ttl(store: PostgresStore) -> None:
+    """Items bulk written without a TTL get the default TTL, as with put."""
+    store.bulk_put(
+        [
+            PutOp(("foo",), "default", {"foo": "bar"}),
+            PutOp(("foo",), "explicit", {"foo": "bar"}, ttl=2 * TTL_MINUTES),
+        ]
+    )
+    with store._cursor() as cur:
+        cur.execute(
+            "SELECT key, ttl_minutes, expires_at FROM store WHERE prefix = 'foo' ORDER BY key"
+        )
+        rows = cur.fetchall()
+    assert [row["key"] for row in rows] == ["default", "explicit"]
+    assert rows[0]["ttl_minutes"] == pytest.approx(TTL_MINUTES)
+    assert rows[1]["ttl_minutes"] == pytest.approx(2 * TTL_MINUTES)
+    assert all(row["expires_at"] is not None for row in rows)
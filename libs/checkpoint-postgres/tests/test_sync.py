@@ -19,6 +19,7 @@ from langgraph.checkpoint.base import (
     empty_checkpoint,
 )
 from langgraph.checkpoint.postgres import PostgresSaver, ShallowPostgresSaver
+from langgraph.checkpoint.serde.types import SCHEDULED
 from tests.conftest import DEFAULT_POSTGRES_URI
 
 
@@ -279,6 +280,37 @@ def test_null_chars(saver_name: str, test_data) -> None:
         )
 
 
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe", "shallow"])
+def test_put_writes_batch(saver_name: str, test_data) -> None:
+    with _saver(saver_name) as saver:
+        config = saver.put(
+            test_data["configs"][1],
+            test_data["checkpoints"][1],
+            test_data["metadata"][1],
+            {},
+        )
+        saver.put_writes_batch(
+            config,
+            [
+                ("task-1", "~__pregel_pull, a", [("foo", 1), ("bar", 2)]),
+                ("task-2", "~__pregel_push, 0", [(SCHEDULED, None)]),
+            ],
+        )
+        # special writes are replaced, regular writes are kept
+        saver.put_writes_batch(
+            config,
+            [
+                ("task-1", "~__pregel_pull, a", [("foo", 3)]),
+                ("task-2", "~__pregel_push, 0", [(SCHEDULED, 1)]),
+            ],
+        )
+        assert saver.get_tuple(config).pending_writes == [
+            ("task-1", "foo", 1),
+            ("task-1", "bar", 2),
+            ("task-2", SCHEDULED, 1),
+        ]
+
+
 def test_nonnull_migrations() -> None:
     _leading_comment_remover = re.compile(r"^/\*.*?\*/")
     for migration in PostgresSaver.MIGRATIONS:
@@ -0,0 +1,171 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import closing, contextmanager
+from typing import Any, Optional
+
+from langgraph.cache.base import BaseCache, FullKey, Namespace, ns_matches
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+NS_SEP = "\x1f"
+
+
+def _ns_str(ns: Namespace) -> str:
+    return NS_SEP.join(ns)
+
+
+class SqliteCache(BaseCache[Any]):
+    """A cache that stores serialized values in a SQLite database.
+
+    Note:
+        Async methods run the synchronous implementation in the default
+        executor. The connection is guarded by a lock, so the cache can be
+        shared across threads.
+
+    Args:
+        conn (sqlite3.Connection): The SQLite database connection.
+        serde (Optional[SerializerProtocol]): The serializer to use for cached values.
+
+    Examples:
+
+        >>> from langgraph.cache.sqlite import SqliteCache
+        >>> with SqliteCache.from_conn_string("cache.sqlite") as cache:
+        ...     graph = builder.compile(cache=cache)
+    """
+
+    conn: sqlite3.Connection
+    is_setup: bool
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        serde: Optional[SerializerProtocol] = None,
+    ) -> None:
+        super().__init__(serde=serde)
+        self.conn = conn
+        self.is_setup = False
+        self.lock = threading.Lock()
+
+    @classmethod
+    @contextmanager
+    def from_conn_string(cls, conn_string: str) -> Iterator["SqliteCache"]:
+        """Create a new SqliteCache instance from a connection string.
+
+        Args:
+            conn_string (str): The SQLite connection string.
+
+        Yields:
+            SqliteCache: A new SqliteCache instance.
+        """
+        with closing(
+            sqlite3.connect(
+                conn_string,
+                # https://ricardoanderegg.com/posts/python-sqlite-thread-safety/
+                check_same_thread=False,
+            )
+        ) as conn:
+            yield cls(conn)
+
+    def setup(self) -> None:
+        """Set up the cache table.
+
+        This method creates the necessary table in the SQLite database if it
+        doesn't already exist. It is called automatically when needed.
+        """
+        if self.is_setup:
+            return
+
+        self.conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS cache (
+                ns TEXT NOT NULL,
+                key TEXT NOT NULL,
+                expiry REAL,
+                type TEXT NOT NULL,
+                value BLOB NOT NULL,
+                PRIMARY KEY (ns, key)
+            );
+            """
+        )
+
+        self.is_setup = True
+
+    @contextmanager
+    def cursor(self, transaction: bool = True) -> Iterator[sqlite3.Cursor]:
+        """Get a cursor for the SQLite database, creating the table if needed."""
+        with self.lock:
+            self.setup()
+            cur = self.conn.cursor()
+            try:
+                yield cur
+            finally:
+                if transaction:
+                    self.conn.commit()
+                cur.close()
+
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        if not keys:
+            return {}
+        by_str = {(_ns_str(ns), key): (ns, key) for ns, key in keys}
+        now = time.time()
+        rows: list[tuple[str, str, str, bytes]] = []
+        with self.cursor() as cur:
+            # delete expired entries for the requested keys first
+            cur.executemany(
+                "DELETE FROM cache WHERE ns = ? AND key = ? AND expiry IS NOT NULL AND expiry <= ?",
+                [(ns, key, now) for ns, key in by_str],
+            )
+            for ns, key in by_str:
+                cur.execute(
+                    "SELECT ns, key, type, value FROM cache WHERE ns = ? AND key = ?",
+                    (ns, key),
+                )
+                if row := cur.fetchone():
+                    rows.append(row)
+        return {
+            by_str[(ns, key)]: self.serde.loads_typed((type_, value))
+            for ns, key, type_, value in rows
+        }
+
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, keys)
+
+    def set(self, pairs: Mapping[FullKey, tuple[Any, Optional[int]]]) -> None:
+        if not pairs:
+            return
+        now = time.time()
+        params = []
+        for (ns, key), (value, ttl) in pairs.items():
+            type_, data = self.serde.dumps_typed(value)
+            params.append((_ns_str(ns), key, now + ttl if ttl else None, type_, data))
+        with self.cursor() as cur:
+            cur.executemany(
+                "INSERT OR REPLACE INTO cache (ns, key, expiry, type, value) VALUES (?, ?, ?, ?, ?)",
+                params,
+            )
+
+    async def aset(self, pairs: Mapping[FullKey, tuple[Any, Optional[int]]]) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.set, pairs)
+
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        with self.cursor() as cur:
+            if namespaces is None:
+                cur.execute("DELETE FROM cache")
+                return
+            cur.execute("SELECT DISTINCT ns FROM cache")
+            to_delete = [
+                (ns,)
+                for (ns,) in cur.fetchall()
+                if ns_matches(tuple(ns.split(NS_SEP)), namespaces)
+            ]
+            cur.executemany("DELETE FROM cache WHERE ns = ?", to_delete)
+
+    async def aclear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.clear, namespaces)
+
+
+__all__ = ["SqliteCache"]
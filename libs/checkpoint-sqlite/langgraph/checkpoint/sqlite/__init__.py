@@ -19,7 +19,15 @@ from langgraph.checkpoint.base import (
 )
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.checkpoint.serde.types import ChannelProtocol
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.sqlite.utils import (
+    INSERT_BLOBS_SQL,
+    SCHEMA_VERSION,
+    blobs_to_load,
+    dump_checkpoint,
+    load_blobs,
+    search_where,
+    split_legacy_checkpoint,
+)
 
 _AIO_ERROR_MSG = (
     "The SqliteSaver does not support async methods. "
@@ -150,11 +158,52 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 value BLOB,
                 PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
             );
+            CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL DEFAULT '',
+                channel TEXT NOT NULL,
+                version TEXT NOT NULL,
+                type TEXT NOT NULL,
+                blob BLOB,
+                PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+            );
             """
         )
+        (version,) = self.conn.execute("PRAGMA user_version").fetchone()
+        if version < SCHEMA_VERSION:
+            self._migrate_blobs()
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self.conn.commit()
 
         self.is_setup = True
 
+    def _migrate_blobs(self) -> None:
+        """Move channel values of existing checkpoints to the checkpoint_blobs table.
+
+        Checkpoints written by earlier versions store all channel values inline.
+        This runs once per database, when `setup()` finds an older schema version.
+        """
+        keys = self.conn.execute(
+            "SELECT thread_id, checkpoint_ns, checkpoint_id FROM checkpoints"
+        ).fetchall()
+        for thread_id, checkpoint_ns, checkpoint_id in keys:
+            type_, checkpoint = self.conn.execute(
+                "SELECT type, checkpoint FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                (thread_id, checkpoint_ns, checkpoint_id),
+            ).fetchone()
+            split = split_legacy_checkpoint(
+                self.serde, thread_id, checkpoint_ns, type_, checkpoint
+            )
+            if split is None:
+                continue
+            (type_, checkpoint), blobs = split
+            self.conn.executemany(INSERT_BLOBS_SQL, blobs)
+            self.conn.execute(
+                "UPDATE checkpoints SET type = ?, checkpoint = ? WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                (type_, checkpoint, thread_id, checkpoint_ns, checkpoint_id),
+            )
+        self.conn.commit()
+
     @contextmanager
     def cursor(self, transaction: bool = True) -> Iterator[sqlite3.Cursor]:
         """Get a cursor for the SQLite database.
@@ -248,6 +297,11 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     }
+                # load channel values
+                loaded = self.serde.loads_typed((type, checkpoint))
+                if query := blobs_to_load(thread_id, checkpoint_ns, loaded):
+                    cur.execute(*query)
+                    load_blobs(self.serde, loaded, cur.fetchall())
                 # find any pending writes
                 cur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
@@ -257,10 +311,10 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                         str(config["configurable"]["checkpoint_id"]),
                     ),
                 )
-                # deserialize the checkpoint and metadata
+                # deserialize the metadata
                 return CheckpointTuple(
                     config,
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -336,6 +390,10 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 checkpoint,
                 metadata,
             ) in cur:
+                loaded = self.serde.loads_typed((type, checkpoint))
+                if query := blobs_to_load(thread_id, checkpoint_ns, loaded):
+                    wcur.execute(*query)
+                    load_blobs(self.serde, loaded, wcur.fetchall())
                 wcur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
                     (thread_id, checkpoint_ns, checkpoint_id),
@@ -348,7 +406,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     },
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -377,7 +435,8 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         """Save a checkpoint to the database.
 
         This method saves a checkpoint to the SQLite database. The checkpoint is associated
-        with the provided config and its parent config (if any).
+        with the provided config and its parent config (if any). Channel values are stored
+        once per channel version, so only the channels in `new_versions` are written.
 
         Args:
             config (RunnableConfig): The config to associate with the checkpoint.
@@ -400,11 +459,15 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         """
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
-        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        (type_, serialized_checkpoint), blobs = dump_checkpoint(
+            self.serde, str(thread_id), checkpoint_ns, checkpoint, new_versions
+        )
         serialized_metadata = self.jsonplus_serde.dumps(
             get_checkpoint_metadata(config, metadata)
         )
         with self.cursor() as cur:
+            if blobs:
+                cur.executemany(INSERT_BLOBS_SQL, blobs)
             cur.execute(
                 "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
                 (
@@ -20,7 +20,15 @@ from langgraph.checkpoint.base import (
 )
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.checkpoint.serde.types import ChannelProtocol
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.sqlite.utils import (
+    INSERT_BLOBS_SQL,
+    SCHEMA_VERSION,
+    blobs_to_load,
+    dump_checkpoint,
+    load_blobs,
+    search_where,
+    split_legacy_checkpoint,
+)
 
 T = TypeVar("T", bound=Callable)
 
@@ -215,7 +223,8 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         """Save a checkpoint to the database.
 
         This method saves a checkpoint to the SQLite database. The checkpoint is associated
-        with the provided config and its parent config (if any).
+        with the provided config and its parent config (if any). Channel values are stored
+        once per channel version, so only the channels in `new_versions` are written.
 
         Args:
             config (RunnableConfig): The config to associate with the checkpoint.
@@ -277,12 +286,56 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     value BLOB,
                     PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
                 );
+                CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+                    thread_id TEXT NOT NULL,
+                    checkpoint_ns TEXT NOT NULL DEFAULT '',
+                    channel TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    type TEXT NOT NULL,
+                    blob BLOB,
+                    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+                );
                 """
             ):
                 await self.conn.commit()
+            async with self.conn.execute("PRAGMA user_version") as cur:
+                (version,) = await cur.fetchone()  # type: ignore[misc]
+            if version < SCHEMA_VERSION:
+                await self._migrate_blobs()
+                await self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                await self.conn.commit()
 
             self.is_setup = True
 
+    async def _migrate_blobs(self) -> None:
+        """Move channel values of existing checkpoints to the checkpoint_blobs table.
+
+        Checkpoints written by earlier versions store all channel values inline.
+        This runs once per database, when `setup()` finds an older schema version.
+        """
+        async with self.conn.execute(
+            "SELECT thread_id, checkpoint_ns, checkpoint_id FROM checkpoints"
+        ) as cur:
+            keys = await cur.fetchall()
+        for thread_id, checkpoint_ns, checkpoint_id in keys:
+            async with self.conn.execute(
+                "SELECT type, checkpoint FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                (thread_id, checkpoint_ns, checkpoint_id),
+            ) as cur:
+                type_, checkpoint = await cur.fetchone()  # type: ignore[misc]
+            split = split_legacy_checkpoint(
+                self.serde, thread_id, checkpoint_ns, type_, checkpoint
+            )
+            if split is None:
+                continue
+            (type_, checkpoint), blobs = split
+            await self.conn.executemany(INSERT_BLOBS_SQL, blobs)
+            await self.conn.execute(
+                "UPDATE checkpoints SET type = ?, checkpoint = ? WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                (type_, checkpoint, thread_id, checkpoint_ns, checkpoint_id),
+            )
+        await self.conn.commit()
+
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the database asynchronously.
 
@@ -333,6 +386,11 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     }
+                # load channel values
+                loaded = self.serde.loads_typed((type, checkpoint))
+                if query := blobs_to_load(thread_id, checkpoint_ns, loaded):
+                    await cur.execute(*query)
+                    load_blobs(self.serde, loaded, await cur.fetchall())
                 # find any pending writes
                 await cur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
@@ -342,10 +400,10 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                         str(config["configurable"]["checkpoint_id"]),
                     ),
                 )
-                # deserialize the checkpoint and metadata
+                # deserialize the metadata
                 return CheckpointTuple(
                     config,
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -408,6 +466,10 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 checkpoint,
                 metadata,
             ) in cur:
+                loaded = self.serde.loads_typed((type, checkpoint))
+                if query := blobs_to_load(thread_id, checkpoint_ns, loaded):
+                    await wcur.execute(*query)
+                    load_blobs(self.serde, loaded, await wcur.fetchall())
                 await wcur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
                     (thread_id, checkpoint_ns, checkpoint_id),
@@ -420,7 +482,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     },
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -449,7 +511,8 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         """Save a checkpoint to the database asynchronously.
 
         This method saves a checkpoint to the SQLite database. The checkpoint is associated
-        with the provided config and its parent config (if any).
+        with the provided config and its parent config (if any). Channel values are stored
+        once per channel version, so only the channels in `new_versions` are written.
 
         Args:
             config (RunnableConfig): The config to associate with the checkpoint.
@@ -463,13 +526,16 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         await self.setup()
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
-        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        (type_, serialized_checkpoint), blobs = dump_checkpoint(
+            self.serde, str(thread_id), checkpoint_ns, checkpoint, new_versions
+        )
         serialized_metadata = self.jsonplus_serde.dumps(
             get_checkpoint_metadata(config, metadata)
         )
-        async with (
-            self.lock,
-            self.conn.execute(
+        async with self.lock:
+            if blobs:
+                await self.conn.executemany(INSERT_BLOBS_SQL, blobs)
+            async with self.conn.execute(
                 "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
                 (
                     str(config["configurable"]["thread_id"]),
@@ -480,9 +546,8 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     serialized_checkpoint,
                     serialized_metadata,
                 ),
-            ),
-        ):
-            await self.conn.commit()
+            ):
+                await self.conn.commit()
         return {
             "configurable": {
                 "thread_id": thread_id,
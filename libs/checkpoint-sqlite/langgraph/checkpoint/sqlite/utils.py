@@ -1,9 +1,21 @@
 import json
-from typing import Any, Dict, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from langchain_core.runnables import RunnableConfig
 
-from langgraph.checkpoint.base import get_checkpoint_id
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, get_checkpoint_id
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+SELECT_BLOBS_SQL = """SELECT bl.channel, bl.type, bl.blob
+FROM json_each(?) AS v
+JOIN checkpoint_blobs AS bl
+    ON bl.thread_id = ? AND bl.checkpoint_ns = ? AND bl.channel = v.key AND bl.version = v.value"""
+
+INSERT_BLOBS_SQL = "INSERT OR IGNORE INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob) VALUES (?, ?, ?, ?, ?, ?)"
+
+# version of the on-disk format, stored in PRAGMA user_version
+# 1: channel values are stored in checkpoint_blobs, once per channel version
+SCHEMA_VERSION = 1
 
 
 def _metadata_predicate(
@@ -91,3 +103,97 @@ def search_where(
         param_values.append(get_checkpoint_id(before))
 
     return ("WHERE " + " AND ".join(wheres) if wheres else "", param_values)
+
+
+def dump_checkpoint(
+    serde: SerializerProtocol,
+    thread_id: str,
+    checkpoint_ns: str,
+    checkpoint: Checkpoint,
+    new_versions: ChannelVersions,
+) -> Tuple[Tuple[str, bytes], List[Tuple[str, str, str, str, str, Optional[bytes]]]]:
+    """Serialize a checkpoint without its channel values, and the values of
+    the channels updated in `new_versions` as rows for the checkpoint_blobs table.
+
+    Values of channels that weren't updated are already stored in checkpoint_blobs,
+    under the version they have in this checkpoint.
+    """
+    values = checkpoint["channel_values"]
+    blobs = [
+        (
+            thread_id,
+            checkpoint_ns,
+            channel,
+            str(version),
+            *(
+                serde.dumps_typed(values[channel])
+                if channel in values
+                else ("empty", None)
+            ),
+        )
+        for channel, version in new_versions.items()
+    ]
+    return serde.dumps_typed({**checkpoint, "channel_values": {}}), blobs
+
+
+def split_legacy_checkpoint(
+    serde: SerializerProtocol,
+    thread_id: str,
+    checkpoint_ns: str,
+    type_: str,
+    serialized: bytes,
+) -> Optional[
+    Tuple[Tuple[str, bytes], List[Tuple[str, str, str, str, str, Optional[bytes]]]]
+]:
+    """Move the inline channel values of a checkpoint written before
+    checkpoint_blobs existed into blob rows. Returns None if there is nothing to move."""
+    checkpoint = serde.loads_typed((type_, serialized))
+    versions = checkpoint["channel_versions"]
+    values = checkpoint["channel_values"]
+    moved = {k: versions[k] for k in values if k in versions}
+    if not moved:
+        return None
+    (new_type, new_serialized), blobs = dump_checkpoint(
+        serde, thread_id, checkpoint_ns, checkpoint, moved
+    )
+    if len(moved) < len(values):
+        # values without a version can't be looked up, keep them inline
+        new_type, new_serialized = serde.dumps_typed(
+            {
+                **checkpoint,
+                "channel_values": {k: v for k, v in values.items() if k not in moved},
+            }
+        )
+    return (new_type, new_serialized), blobs
+
+
+def blobs_to_load(
+    thread_id: str, checkpoint_ns: str, checkpoint: Checkpoint
+) -> Optional[Tuple[str, Tuple[str, str, str]]]:
+    """Return the query and params to load the channel values of a checkpoint
+    from checkpoint_blobs, or None if there are none to load."""
+    versions = {
+        k: str(v)
+        for k, v in checkpoint["channel_versions"].items()
+        if k not in checkpoint["channel_values"]
+    }
+    if not versions:
+        return None
+    return SELECT_BLOBS_SQL, (json.dumps(versions), thread_id, checkpoint_ns)
+
+
+def load_blobs(
+    serde: SerializerProtocol,
+    checkpoint: Checkpoint,
+    rows: Iterable[Tuple[str, str, Optional[bytes]]],
+) -> Checkpoint:
+    """Add the channel values loaded from checkpoint_blobs to a checkpoint."""
+    checkpoint["channel_values"] = {
+        **checkpoint["channel_values"],
+        **{
+            channel: serde.loads_typed((type_, blob))
+            for channel, type_, blob in rows
+            if type_ != "empty"
+        },
+    }
+    return checkpoint
@@ -123,3 +123,35 @@ class TestAsyncSqliteSaver:
             } == {"", "inner"}
 
             # TODO: test before and limit params
+
+    async def test_channel_values_stored_per_version(self) -> None:
+        async with AsyncSqliteSaver.from_conn_string(":memory:") as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+            }
+            chkpnt = empty_checkpoint()
+            chkpnt["channel_values"] = {"history": ["a"], "count": 1}
+            chkpnt["channel_versions"] = {"history": "1", "count": "1"}
+            config = await saver.aput(
+                config, chkpnt, self.metadata_1, {"history": "1", "count": "1"}
+            )
+
+            # only the updated channel is written again
+            chkpnt = create_checkpoint(chkpnt, None, 2)
+            chkpnt["channel_values"] = {"history": ["a"], "count": 2}
+            chkpnt["channel_versions"] = {"history": "1", "count": "2"}
+            config = await saver.aput(config, chkpnt, self.metadata_2, {"count": "2"})
+
+            async with saver.conn.execute(
+                "SELECT count(*) FROM checkpoint_blobs"
+            ) as cur:
+                assert await cur.fetchone() == (3,)
+
+            assert (await saver.aget_tuple(config)).checkpoint["channel_values"] == {
+                "history": ["a"],
+                "count": 2,
+            }
+            assert [
+                c.checkpoint["channel_values"]
+                async for c in saver.alist({"configurable": {"thread_id": "thread-1"}})
+            ] == [{"history": ["a"], "count": 2}, {"history": ["a"], "count": 1}]
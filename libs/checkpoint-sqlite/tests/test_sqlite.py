@@ -1,8 +1,11 @@
+import sqlite3
+from contextlib import closing
 from typing import Any, cast
 
 import pytest
 from langchain_core.runnables import RunnableConfig
 
+from langgraph.cache.sqlite import SqliteCache
 from langgraph.checkpoint.base import (
     Checkpoint,
     CheckpointMetadata,
@@ -170,6 +173,91 @@ class TestSqliteSaver:
             expected_param_values_3,
         )
 
+    def test_channel_values_stored_per_version(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+            }
+            chkpnt = empty_checkpoint()
+            chkpnt["channel_values"] = {"history": ["a"], "count": 1}
+            chkpnt["channel_versions"] = {"history": "1", "count": "1"}
+            config = saver.put(
+                config, chkpnt, self.metadata_1, {"history": "1", "count": "1"}
+            )
+
+            # only the updated channel is written again
+            chkpnt = create_checkpoint(chkpnt, None, 2)
+            chkpnt["channel_values"] = {"history": ["a"], "count": 2}
+            chkpnt["channel_versions"] = {"history": "1", "count": "2"}
+            config = saver.put(config, chkpnt, self.metadata_2, {"count": "2"})
+
+            with saver.cursor() as cur:
+                cur.execute(
+                    "SELECT channel, version FROM checkpoint_blobs ORDER BY channel, version"
+                )
+                assert cur.fetchall() == [
+                    ("count", "1"),
+                    ("count", "2"),
+                    ("history", "1"),
+                ]
+
+            assert saver.get_tuple(config).checkpoint["channel_values"] == {
+                "history": ["a"],
+                "count": 2,
+            }
+            assert [
+                c.checkpoint["channel_values"]
+                for c in saver.list({"configurable": {"thread_id": "thread-1"}})
+            ] == [{"history": ["a"], "count": 2}, {"history": ["a"], "count": 1}]
+
+    def test_migrate_inline_channel_values(self, tmp_path: Any) -> None:
+        path = str(tmp_path / "checkpoints.sqlite")
+        # database written before checkpoint_blobs existed
+        with SqliteSaver.from_conn_string(path) as saver:
+            chkpnt = empty_checkpoint()
+            chkpnt["channel_values"] = {"history": ["a"], "count": 1}
+            chkpnt["channel_versions"] = {"history": "1", "count": "1"}
+            type_, serialized = saver.serde.dumps_typed(chkpnt)
+            saver.conn.executescript(
+                """
+                CREATE TABLE checkpoints (
+                    thread_id TEXT NOT NULL,
+                    checkpoint_ns TEXT NOT NULL DEFAULT '',
+                    checkpoint_id TEXT NOT NULL,
+                    parent_checkpoint_id TEXT,
+                    type TEXT,
+                    checkpoint BLOB,
+                    metadata BLOB,
+                    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+                );
+                """
+            )
+            saver.conn.execute(
+                "INSERT INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, type, checkpoint) VALUES (?, ?, ?, ?, ?)",
+                ("thread-1", "", chkpnt["id"], type_, serialized),
+            )
+            saver.conn.commit()
+
+        with SqliteSaver.from_conn_string(path) as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+            }
+            saved = saver.get_tuple(config)
+            assert saved.checkpoint["channel_values"] == {"history": ["a"], "count": 1}
+
+            # new checkpoints only write the updated channels
+            chkpnt = create_checkpoint(saved.checkpoint, None, 2)
+            chkpnt["channel_values"] = {"history": ["a"], "count": 2}
+            chkpnt["channel_versions"] = {"history": "1", "count": "2"}
+            saver.put(saved.config, chkpnt, self.metadata_2, {"count": "2"})
+            assert saver.get_tuple(config).checkpoint["channel_values"] == {
+                "history": ["a"],
+                "count": 2,
+            }
+
+        with closing(sqlite3.connect(path)) as conn:
+            assert conn.execute("PRAGMA user_version").fetchone() == (1,)
+
     async def test_informative_async_errors(self) -> None:
         with SqliteSaver.from_conn_string(":memory:") as saver:
             # call method / assertions
@@ -180,3 +268,31 @@ class TestSqliteSaver:
             with pytest.raises(NotImplementedError, match="AsyncSqliteSaver"):
                 async for _ in saver.alist(self.config_1):
                     pass
+
+
+def test_sqlite_cache() -> None:
+    with SqliteCache.from_conn_string(":memory:") as cache:
+        cache.set(
+            {
+                (("a", "b"), "k1"): ([("x", 1)], None),
+                (("a", "c"), "k2"): ({"v": 2}, 60),
+                (("d",), "k3"): ("expired", 60),
+            }
+        )
+        # expire one of the entries
+        with cache.cursor() as cur:
+            cur.execute("UPDATE cache SET expiry = 0 WHERE key = 'k3'")
+
+        assert cache.get(
+            [(("a", "b"), "k1"), (("a", "c"), "k2"), (("d",), "k3"), (("a",), "k1")]
+        ) == {
+            (("a", "b"), "k1"): [["x", 1]],
+            (("a", "c"), "k2"): {"v": 2},
+        }
+
+        cache.clear([("a", "b")])
+        assert cache.get([(("a", "b"), "k1"), (("a", "c"), "k2")]) == {
+            (("a", "c"), "k2"): {"v": 2}
+        }
+        cache.clear()
+        assert cache.get([(("a", "c"), "k2")]) == {}
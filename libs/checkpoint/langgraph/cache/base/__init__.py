@@ -0,0 +1,107 @@
+"""Base interface for node result caches.
+
+A cache maps a full key, made of a namespace tuple and a string key, to a
+serialized value with an optional time-to-live. LangGraph uses it to store the
+writes produced by a node for a given input, so that executing the same node
+with the same input again can skip running the node entirely.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from typing import Generic, Optional, TypeVar
+
+from langgraph.checkpoint.serde.base import SerializerProtocol, maybe_add_typed_methods
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+ValueT = TypeVar("ValueT")
+
+Namespace = tuple[str, ...]
+"""Hierarchical namespace of a cache entry, eg. `("__pregel_ns_writes", "node")`."""
+
+FullKey = tuple[Namespace, str]
+"""A namespace and a key within that namespace."""
+
+
+class BaseCache(ABC, Generic[ValueT]):
+    """Base class for a cache of serialized values keyed by namespace and key.
+
+    Implementations must be safe to share between graph runs and threads.
+    Values are serialized with `serde` before being stored, so cached values
+    never alias objects that are later mutated by the graph.
+
+    Attributes:
+        serde (SerializerProtocol): Serializer for encoding/decoding cached values.
+    """
+
+    serde: SerializerProtocol = JsonPlusSerializer()
+
+    def __init__(self, *, serde: Optional[SerializerProtocol] = None) -> None:
+        self.serde = maybe_add_typed_methods(serde or self.serde)
+
+    @abstractmethod
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        """Get the cached values for the given keys.
+
+        Args:
+            keys: Full keys to look up.
+
+        Returns:
+            Mapping of full key to value, for keys that are present and not expired.
+        """
+
+    @abstractmethod
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        """Asynchronously get the cached values for the given keys.
+
+        Args:
+            keys: Full keys to look up.
+
+        Returns:
+            Mapping of full key to value, for keys that are present and not expired.
+        """
+
+    @abstractmethod
+    def set(self, pairs: Mapping[FullKey, tuple[ValueT, Optional[int]]]) -> None:
+        """Set cached values for the given keys.
+
+        Args:
+            pairs: Mapping of full key to a (value, ttl) tuple. The ttl is in
+                seconds, None means the entry never expires.
+        """
+
+    @abstractmethod
+    async def aset(self, pairs: Mapping[FullKey, tuple[ValueT, Optional[int]]]) -> None:
+        """Asynchronously set cached values for the given keys.
+
+        Args:
+            pairs: Mapping of full key to a (value, ttl) tuple. The ttl is in
+                seconds, None means the entry never expires.
+        """
+
+    @abstractmethod
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        """Delete cached values.
+
+        Args:
+            namespaces: Namespaces to clear. Entries are deleted if their
+                namespace starts with any of these. If None, clears everything.
+        """
+
+    @abstractmethod
+    async def aclear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        """Asynchronously delete cached values.
+
+        Args:
+            namespaces: Namespaces to clear. Entries are deleted if their
+                namespace starts with any of these. If None, clears everything.
+        """
+
+
+def ns_matches(ns: Namespace, namespaces: Optional[Sequence[Namespace]]) -> bool:
+    """Check whether a namespace falls under any of the given namespace prefixes."""
+    if namespaces is None:
+        return True
+    return any(ns[: len(prefix)] == prefix for prefix in namespaces)
+
+
+__all__ = ["BaseCache", "FullKey", "Namespace", "ns_matches"]
@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from typing import Any, Optional
+
+from langgraph.cache.base import BaseCache, FullKey, Namespace, ns_matches
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+
+class InMemoryCache(BaseCache[Any]):
+    """An in-memory, least-recently-used cache.
+
+    Entries are kept serialized, and evicted either when their ttl expires or
+    when the cache grows beyond `max_size` entries, oldest access first.
+
+    Args:
+        max_size (Optional[int]): Maximum number of entries to keep. Defaults to
+            None, meaning the cache is unbounded.
+        serde (Optional[SerializerProtocol]): The serializer to use for cached values.
+
+    Examples:
+
+            from langgraph.cache.memory import InMemoryCache
+            from langgraph.graph import StateGraph
+            from langgraph.types import CachePolicy
+
+            builder = StateGraph(int)
+            builder.add_node("add_one", lambda x: x + 1, cache_policy=CachePolicy(ttl=60))
+            builder.set_entry_point("add_one")
+            builder.set_finish_point("add_one")
+
+            graph = builder.compile(cache=InMemoryCache(max_size=1000))
+            graph.invoke(1)  # runs add_one
+            graph.invoke(1)  # served from the cache
+    """
+
+    # full key -> (serialized value, expiry timestamp or None)
+    _data: "OrderedDict[FullKey, tuple[tuple[str, bytes], Optional[float]]]"
+
+    def __init__(
+        self,
+        *,
+        max_size: Optional[int] = None,
+        serde: Optional[SerializerProtocol] = None,
+    ) -> None:
+        super().__init__(serde=serde)
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        if not keys:
+            return {}
+        now = time.time()
+        found: dict[FullKey, tuple[str, bytes]] = {}
+        with self._lock:
+            for key in keys:
+                if (entry := self._data.get(key)) is None:
+                    continue
+                value, expiry = entry
+                if expiry is not None and expiry <= now:
+                    del self._data[key]
+                    continue
+                self._data.move_to_end(key)
+                found[key] = value
+        # deserialize outside the lock
+        return {key: self.serde.loads_typed(value) for key, value in found.items()}
+
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        return self.get(keys)
+
+    def set(self, pairs: Mapping[FullKey, tuple[Any, Optional[int]]]) -> None:
+        if not pairs:
+            return
+        now = time.time()
+        # serialize outside the lock
+        entries = {
+            key: (self.serde.dumps_typed(value), now + ttl if ttl else None)
+            for key, (value, ttl) in pairs.items()
+        }
+        with self._lock:
+            for key, entry in entries.items():
+                self._data[key] = entry
+                self._data.move_to_end(key)
+            if self.max_size is not None:
+                while len(self._data) > self.max_size:
+                    self._data.popitem(last=False)
+
+    async def aset(self, pairs: Mapping[FullKey, tuple[Any, Optional[int]]]) -> None:
+        self.set(pairs)
+
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        with self._lock:
+            if namespaces is None:
+                self._data.clear()
+                return
+            for key in [k for k in self._data if ns_matches(k[0], namespaces)]:
+                del self._data[key]
+
+    async def aclear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        self.clear(namespaces)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+__all__ = ["InMemoryCache"]
@@ -129,11 +129,28 @@ def create_checkpoint(
     step: int,
     *,
     id: Optional[str] = None,
+    updated_channels: Optional[set[str]] = None,
 ) -> Checkpoint:
-    """Create a checkpoint for the given channels."""
+    """Create a checkpoint for the given channels.
+
+    If `updated_channels` is passed, `checkpoint` must have been created from
+    `channels`, and only the channels updated since are snapshotted again, the
+    values of the others being shared with `checkpoint`. The `channel_values`
+    of a checkpoint are never modified in place, so they're safe to share."""
     ts = datetime.now(timezone.utc).isoformat()
     if channels is None:
         values = checkpoint["channel_values"]
+    elif updated_channels is not None:
+        values = checkpoint["channel_values"]
+        if updated_channels:
+            values = values.copy()
+        for k in updated_channels:
+            if k not in checkpoint["channel_versions"] or k not in channels:
+                continue
+            try:
+                values[k] = channels[k].checkpoint()
+            except EmptyChannelError:
+                values.pop(k, None)
     else:
         values = {}
         for k, v in channels.items():
@@ -317,6 +334,23 @@ class BaseCheckpointSaver(Generic[V]):
         """
         raise NotImplementedError
 
+    def put_writes_batch(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint.
+
+        Default is to call `put_writes` for each task. Override to store them
+        in a single round-trip.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            writes (List[Tuple[str, str, List[Tuple[str, Any]]]]): List of (task_id, task_path, writes) for each task.
+        """
+        for task_id, task_path, task_writes in writes:
+            self.put_writes(config, task_writes, task_id, task_path)
+
     async def aget(self, config: RunnableConfig) -> Optional[Checkpoint]:
         """Asynchronously fetch a checkpoint using the given configuration.
 
@@ -411,6 +445,23 @@ class BaseCheckpointSaver(Generic[V]):
         """
         raise NotImplementedError
 
+    async def aput_writes_batch(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        """Asynchronously store intermediate writes of several tasks linked to a checkpoint.
+
+        Default is to call `aput_writes` for each task. Override to store them
+        in a single round-trip.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            writes (List[Tuple[str, str, List[Tuple[str, Any]]]]): List of (task_id, task_path, writes) for each task.
+        """
+        for task_id, task_path, task_writes in writes:
+            await self.aput_writes(config, task_writes, task_id, task_path)
+
     def get_next_version(self, current: Optional[V], channel: ChannelProtocol) -> V:
         """Generate the next version ID for a channel.
 
@@ -7,7 +7,7 @@ from collections import defaultdict
 from collections.abc import AsyncIterator, Iterator, Sequence
 from contextlib import AbstractAsyncContextManager, AbstractContextManager, ExitStack
 from types import TracebackType
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from langchain_core.runnables import RunnableConfig
 
@@ -27,6 +27,33 @@ from langgraph.checkpoint.serde.types import TASKS, ChannelProtocol
 logger = logging.getLogger(__name__)
 
 
+def _copy_containers(obj: Any) -> Any:
+    if type(obj) is dict:
+        return {k: _copy_containers(v) for k, v in obj.items()}
+    elif type(obj) in (list, tuple, set):
+        return type(obj)(_copy_containers(o) for o in obj)
+    else:
+        return obj
+
+
+class _ObjectSerializer(SerializerProtocol):
+    """Stores objects without serializing them, used by
+    `InMemorySaver(serialize=False)`.
+
+    Channels and the loop update lists, sets and dicts in place, so those are
+    copied on the way in and out, but any other objects are shared.
+    """
+
+    def dumps_typed(self, obj: Any) -> tuple[str, Any]:
+        if isinstance(obj, BaseException):
+            # same as the default serializer, eg. for task errors
+            return "object", repr(obj)
+        return "object", _copy_containers(obj)
+
+    def loads_typed(self, data: tuple[str, Any]) -> Any:
+        return _copy_containers(data[1])
+
+
 class InMemorySaver(
     BaseCheckpointSaver[str], AbstractContextManager, AbstractAsyncContextManager
 ):
@@ -38,8 +65,16 @@ class InMemorySaver(
         Only use `InMemorySaver` for debugging or testing purposes.
         For production use cases we recommend installing [langgraph-checkpoint-postgres](https://pypi.org/project/langgraph-checkpoint-postgres/) and using `PostgresSaver` / `AsyncPostgresSaver`.
 
+    Channel values are stored once per channel version, so channels that
+    didn't change in a step are shared with the previous checkpoints instead
+    of being serialized again.
+
     Args:
         serde (Optional[SerializerProtocol]): The serializer to use for serializing and deserializing checkpoints. Defaults to None.
+        serialize (bool): Whether to serialize checkpoints, channel values and writes.
+            If False, values are stored as Python objects, which skips serialization
+            entirely, but requires that they aren't mutated in place after being
+            saved. Defaults to True.
 
     Examples:
 
@@ -70,20 +105,30 @@ class InMemorySaver(
         tuple[str, str, str],
         dict[tuple[str, int], tuple[str, str, tuple[str, bytes], str]],
     ]
+    # (thread ID, checkpoint NS, channel, version) -> channel value
+    blobs: dict[tuple[str, str, str, Union[str, int, float]], tuple[str, bytes]]
 
     def __init__(
         self,
         *,
         serde: Optional[SerializerProtocol] = None,
         factory: type[defaultdict] = defaultdict,
+        serialize: bool = True,
     ) -> None:
+        if serde is not None and not serialize:
+            raise ValueError("Cannot pass a serde when serialize is False")
         super().__init__(serde=serde)
+        self.serialize = serialize
+        if not serialize:
+            self.serde = _ObjectSerializer()
         self.storage = factory(lambda: defaultdict(dict))
         self.writes = factory(dict)
+        self.blobs = factory()
         self.stack = ExitStack()
         if factory is not defaultdict:
             self.stack.enter_context(self.storage)  # type: ignore[arg-type]
             self.stack.enter_context(self.writes)  # type: ignore[arg-type]
+            self.stack.enter_context(self.blobs)  # type: ignore[arg-type]
 
     def __enter__(self) -> "InMemorySaver":
         return self.stack.__enter__()
@@ -123,91 +168,45 @@ class InMemorySaver(
         """
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoints = self.storage[thread_id][checkpoint_ns]
         if checkpoint_id := get_checkpoint_id(config):
-            if saved := self.storage[thread_id][checkpoint_ns].get(checkpoint_id):
-                checkpoint, metadata, parent_checkpoint_id = saved
-                writes = self.writes[(thread_id, checkpoint_ns, checkpoint_id)].values()
-                if parent_checkpoint_id:
-                    sends = sorted(
-                        (
-                            (*w, k[1])
-                            for k, w in self.writes[
-                                (thread_id, checkpoint_ns, parent_checkpoint_id)
-                            ].items()
-                            if w[1] == TASKS
-                        ),
-                        key=lambda w: (w[3], w[0], w[4]),
-                    )
-                else:
-                    sends = []
-                return CheckpointTuple(
-                    config=config,
-                    checkpoint={
-                        **self.serde.loads_typed(checkpoint),
-                        "pending_sends": [self.serde.loads_typed(s[2]) for s in sends],
-                    },
-                    metadata=self.serde.loads_typed(metadata),
-                    pending_writes=[
-                        (id, c, self.serde.loads_typed(v)) for id, c, v, _ in writes
-                    ],
-                    parent_config=(
-                        {
-                            "configurable": {
-                                "thread_id": thread_id,
-                                "checkpoint_ns": checkpoint_ns,
-                                "checkpoint_id": parent_checkpoint_id,
-                            }
-                        }
-                        if parent_checkpoint_id
-                        else None
-                    ),
-                )
+            if not (saved := checkpoints.get(checkpoint_id)):
+                return None
+        elif checkpoints:
+            checkpoint_id = max(checkpoints.keys())
+            saved = checkpoints[checkpoint_id]
+            config = {
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            }
         else:
-            if checkpoints := self.storage[thread_id][checkpoint_ns]:
-                checkpoint_id = max(checkpoints.keys())
-                checkpoint, metadata, parent_checkpoint_id = checkpoints[checkpoint_id]
-                writes = self.writes[(thread_id, checkpoint_ns, checkpoint_id)].values()
-                if parent_checkpoint_id:
-                    sends = sorted(
-                        (
-                            (*w, k[1])
-                            for k, w in self.writes[
-                                (thread_id, checkpoint_ns, parent_checkpoint_id)
-                            ].items()
-                            if w[1] == TASKS
-                        ),
-                        key=lambda w: (w[3], w[0], w[4]),
-                    )
-                else:
-                    sends = []
-                return CheckpointTuple(
-                    config={
-                        "configurable": {
-                            "thread_id": thread_id,
-                            "checkpoint_ns": checkpoint_ns,
-                            "checkpoint_id": checkpoint_id,
-                        }
-                    },
-                    checkpoint={
-                        **self.serde.loads_typed(checkpoint),
-                        "pending_sends": [self.serde.loads_typed(s[2]) for s in sends],
-                    },
-                    metadata=self.serde.loads_typed(metadata),
-                    pending_writes=[
-                        (id, c, self.serde.loads_typed(v)) for id, c, v, _ in writes
-                    ],
-                    parent_config=(
-                        {
-                            "configurable": {
-                                "thread_id": thread_id,
-                                "checkpoint_ns": checkpoint_ns,
-                                "checkpoint_id": parent_checkpoint_id,
-                            }
-                        }
-                        if parent_checkpoint_id
-                        else None
-                    ),
-                )
+            return None
+        checkpoint, metadata, parent_checkpoint_id = saved
+        writes = self.writes[(thread_id, checkpoint_ns, checkpoint_id)].values()
+        return CheckpointTuple(
+            config=config,
+            checkpoint=self._load_checkpoint(
+                thread_id, checkpoint_ns, checkpoint, parent_checkpoint_id
+            ),
+            metadata=self.serde.loads_typed(metadata),
+            pending_writes=[
+                (id, c, self.serde.loads_typed(v)) for id, c, v, _ in writes
+            ],
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_checkpoint_id,
+                    }
+                }
+                if parent_checkpoint_id
+                else None
+            ),
+        )
 
     def list(
         self,
@@ -283,20 +282,6 @@ class InMemorySaver(
                         (thread_id, checkpoint_ns, checkpoint_id)
                     ].values()
 
-                    if parent_checkpoint_id:
-                        sends = sorted(
-                            (
-                                (*w, k[1])
-                                for k, w in self.writes[
-                                    (thread_id, checkpoint_ns, parent_checkpoint_id)
-                                ].items()
-                                if w[1] == TASKS
-                            ),
-                            key=lambda w: (w[3], w[0], w[4]),
-                        )
-                    else:
-                        sends = []
-
                     yield CheckpointTuple(
                         config={
                             "configurable": {
@@ -305,12 +290,9 @@ class InMemorySaver(
                                 "checkpoint_id": checkpoint_id,
                             }
                         },
-                        checkpoint={
-                            **self.serde.loads_typed(checkpoint),
-                            "pending_sends": [
-                                self.serde.loads_typed(s[2]) for s in sends
-                            ],
-                        },
+                        checkpoint=self._load_checkpoint(
+                            thread_id, checkpoint_ns, checkpoint, parent_checkpoint_id
+                        ),
                         metadata=metadata,
                         parent_config=(
                             {
@@ -353,6 +335,23 @@ class InMemorySaver(
         c.pop("pending_sends")  # type: ignore[misc]
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        # channel values are stored once per version, unchanged channels are
+        # shared with the previous checkpoints
+        values: dict[str, Any] = c.pop("channel_values")  # type: ignore[misc]
+        inline = False
+        for k, v in c["channel_versions"].items():
+            key = (thread_id, checkpoint_ns, k, v)
+            if k in new_versions or key not in self.blobs:
+                # new version, or one carried over from another namespace
+                self.blobs[key] = (
+                    self.serde.dumps_typed(values[k]) if k in values else ("empty", b"")
+                )
+            elif k not in values and self.blobs[key][0] != "empty":
+                # a value exists for this version, but isn't part of this
+                # checkpoint, eg. for channels missing from the graph
+                inline = True
+        if inline:
+            c["channel_values"] = values
         self.storage[thread_id][checkpoint_ns].update(
             {
                 checkpoint["id"]: (
@@ -487,6 +486,49 @@ class InMemorySaver(
         """
         return self.put_writes(config, writes, task_id, task_path)
 
+    def _load_blobs(
+        self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions
+    ) -> dict[str, Any]:
+        channel_values: dict[str, Any] = {}
+        for k, v in versions.items():
+            if blob := self.blobs.get((thread_id, checkpoint_ns, k, v)):
+                if blob[0] != "empty":
+                    channel_values[k] = self.serde.loads_typed(blob)
+        return channel_values
+
+    def _load_checkpoint(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint: tuple[str, bytes],
+        parent_checkpoint_id: Optional[str],
+    ) -> Checkpoint:
+        saved: Checkpoint = self.serde.loads_typed(checkpoint)
+        if parent_checkpoint_id:
+            sends = sorted(
+                (
+                    (*w, k[1])
+                    for k, w in self.writes[
+                        (thread_id, checkpoint_ns, parent_checkpoint_id)
+                    ].items()
+                    if w[1] == TASKS
+                ),
+                key=lambda w: (w[3], w[0], w[4]),
+            )
+        else:
+            sends = []
+        return {
+            **saved,
+            "channel_values": (
+                saved["channel_values"]
+                if "channel_values" in saved
+                else self._load_blobs(
+                    thread_id, checkpoint_ns, saved["channel_versions"]
+                )
+            ),
+            "pending_sends": [self.serde.loads_typed(s[2]) for s in sends],
+        }
+
     def get_next_version(self, current: Optional[str], channel: ChannelProtocol) -> str:
         if current is None:
             current_v = 0
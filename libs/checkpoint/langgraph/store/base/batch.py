@@ -1,5 +1,9 @@
 import asyncio
+import concurrent.futures
 import functools
+import queue
+import threading
+import time
 import weakref
 from collections.abc import Iterable
 from typing import Any, Callable, Literal, Optional, TypeVar, Union
@@ -269,6 +273,82 @@ class AsyncBatchedBaseStore(BaseStore):
         ).result()
 
 
+class BatchedStore(BaseStore):
+    """Batch synchronous operations on a store made concurrently from many
+    threads, eg. by parallel tool calls.
+
+    Each call to `get`, `put`, `search`, `delete`, `list_namespaces` or `batch`
+    is queued and run by a background thread, which combines the operations of
+    all calls queued within `batch_window` seconds (up to `max_batch_size`
+    operations), dedupes them and runs them as a single `batch` of the wrapped
+    store. Async methods are passed through to the wrapped store.
+
+    ???+ example "Example"
+        ```python
+        from langgraph.store.base.batch import BatchedStore
+        from langgraph.store.postgres import PostgresStore
+
+        with PostgresStore.from_conn_string(conn_string) as store:
+            store.setup()
+            graph = builder.compile(store=BatchedStore(store))
+        ```
+    """
+
+    __slots__ = (
+        "store",
+        "max_batch_size",
+        "batch_window",
+        "supports_ttl",
+        "ttl_config",
+        "_queue",
+        "_thread",
+    )
+
+    def __init__(
+        self,
+        store: BaseStore,
+        *,
+        max_batch_size: int = 100,
+        batch_window: float = 0.0,
+    ) -> None:
+        """
+        Args:
+            store: The store to run the batched operations.
+            max_batch_size: Maximum number of operations to run in one batch.
+                Calls with more operations than this are run in a batch of their own.
+            batch_window: Seconds to wait after the first call of a batch for
+                other calls to join it. With the default of 0, calls queued while
+                the previous batch was running are batched together.
+        """
+        super().__init__()
+        self.store = store
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self.supports_ttl = store.supports_ttl
+        self.ttl_config = store.ttl_config
+        self._queue: queue.SimpleQueue[
+            Optional[tuple[concurrent.futures.Future, list[Op]]]
+        ] = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=_run_sync,
+            args=(self._queue, weakref.ref(self)),
+            name="BatchedStore",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __del__(self) -> None:
+        self._queue.put(None)
+
+    def batch(self, ops: Iterable[Op]) -> list[Result]:
+        fut: concurrent.futures.Future[list[Result]] = concurrent.futures.Future()
+        self._queue.put((fut, list(ops)))
+        return fut.result()
+
+    async def abatch(self, ops: Iterable[Op]) -> list[Result]:
+        return await self.store.abatch(ops)
+
+
 def _dedupe_ops(values: list[Op]) -> tuple[Optional[list[int]], list[Op]]:
     """Dedupe operations while preserving order for results.
 
@@ -348,3 +428,62 @@ async def _run(
                 del s
         else:
             break
+
+
+def _run_sync(
+    queue_: queue.SimpleQueue[Optional[tuple[concurrent.futures.Future, list[Op]]]],
+    store: weakref.ReferenceType[BatchedStore],
+) -> None:
+    # call that didn't fit in the previous batch
+    pending: Optional[tuple[concurrent.futures.Future, list[Op]]] = None
+    stop = False
+    while not stop and (item := pending or queue_.get()):
+        pending = None
+        # check if store is still alive
+        if s := store():
+            try:
+                # accumulate calls queued while the previous batch ran, or
+                # within the batch window
+                items = [item]
+                size = len(item[1])
+                deadline = time.monotonic() + s.batch_window
+                while size < s.max_batch_size:
+                    try:
+                        timeout = deadline - time.monotonic()
+                        next_item = (
+                            queue_.get(timeout=timeout)
+                            if timeout > 0
+                            else queue_.get_nowait()
+                        )
+                    except queue.Empty:
+                        break
+                    if next_item is None:
+                        stop = True
+                        break
+                    if size + len(next_item[1]) > s.max_batch_size:
+                        pending = next_item
+                        break
+                    items.append(next_item)
+                    size += len(next_item[1])
+                futs = [item[0] for item in items]
+                values = [op for item in items for op in item[1]]
+                # action each operation
+                try:
+                    listen, dedupped = _dedupe_ops(values)
+                    results = s.store.batch(dedupped)
+                    if listen is not None:
+                        results = [results[ix] for ix in listen]
+
+                    # set the results of each call
+                    start = 0
+                    for fut, (_, ops) in zip(futs, items):
+                        fut.set_result(results[start : start + len(ops)])
+                        start += len(ops)
+                except Exception as e:
+                    for fut in futs:
+                        fut.set_exception(e)
+            finally:
+                # remove strong ref to store
+                del s
+        else:
+            break
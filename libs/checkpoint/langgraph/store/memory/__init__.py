@@ -100,13 +100,15 @@ Tip:
 """
 
 import asyncio
+import bisect
 import concurrent.futures as cf
 import functools
+import itertools
 import logging
 from collections import defaultdict
 from datetime import datetime, timezone
 from importlib import util
-from typing import Any, Iterable, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
 
 from langchain_core.embeddings import Embeddings
 
@@ -159,6 +161,13 @@ class InMemoryStore(BaseStore):
         when creating the store. Without this configuration, all `index` arguments passed to
         `put` or `aput`will have no effect.
 
+    Note:
+        Top-level value fields listed in `filter_fields` are indexed, so a `search` filter
+        that matches one of them exactly only looks at the items with that value:
+
+            store = InMemoryStore(filter_fields=["user_id"])
+            store.search(("memories",), filter={"user_id": "123"})
+
     Warning:
         This store keeps all data in memory. Data is lost when the process exits.
         For persistence, use a database-backed store like PostgresStore.
@@ -173,11 +182,19 @@ class InMemoryStore(BaseStore):
     __slots__ = (
         "_data",
         "_vectors",
+        "_indexes",
+        "_item_index",
+        "filter_fields",
         "index_config",
         "embeddings",
     )
 
-    def __init__(self, *, index: Optional[IndexConfig] = None) -> None:
+    def __init__(
+        self,
+        *,
+        index: Optional[IndexConfig] = None,
+        filter_fields: Optional[Sequence[str]] = None,
+    ) -> None:
         # Both _data and _vectors are wrapped in the In-memory API
         # Do not change their names
         self._data: dict[tuple[str, ...], dict[str, Item]] = defaultdict(dict)
@@ -185,6 +202,11 @@ class InMemoryStore(BaseStore):
         self._vectors: dict[tuple[str, ...], dict[str, dict[str, list[float]]]] = (
             defaultdict(lambda: defaultdict(dict))
         )
+        # [ns] -> normalized vectors of _vectors[ns], built on first search
+        self._indexes: dict[tuple[str, ...], _VectorIndex] = {}
+        # namespace trie and filter_fields indexes over _data, built on first use
+        self._item_index: Optional[_ItemIndex] = None
+        self.filter_fields = list(filter_fields or ())
         self.index_config = index
         if self.index_config:
             self.index_config = self.index_config.copy()
@@ -232,8 +254,8 @@ class InMemoryStore(BaseStore):
 
     # Helpers
 
-    def _filter_items(self, op: SearchOp) -> list[tuple[Item, list[list[float]]]]:
-        """Filter items by namespace and filter function, return items with their embeddings."""
+    def _filter_items(self, op: SearchOp) -> list[Item]:
+        """Filter items by namespace and filter function."""
         namespace_prefix = op.namespace_prefix
 
         def filter_func(item: Item) -> bool:
@@ -245,26 +267,44 @@ class InMemoryStore(BaseStore):
                 for key, filter_value in op.filter.items()
             )
 
-        filtered = []
-        for namespace in self._data:
-            if not (
-                namespace[: len(namespace_prefix)] == namespace_prefix
-                if len(namespace) >= len(namespace_prefix)
-                else False
-            ):
-                continue
-
-            for key, item in self._data[namespace].items():
-                if filter_func(item):
-                    if op.query and (embeddings := self._vectors[namespace].get(key)):
-                        filtered.append((item, list(embeddings.values())))
-                    else:
-                        filtered.append((item, []))
+        item_index = self._get_item_index()
+        # in the order the namespaces were added to _data
+        namespaces = sorted(item_index.find_prefix(namespace_prefix))
+        filtered: list[Item] = []
+        if not namespaces:
+            return filtered
+        if op.filter and (bucket := item_index.match_filter(op.filter)) is not None:
+            namespace_seqs = {ns: seq for seq, ns in namespaces}
+            if len(bucket) < sum(len(self._data[ns]) for ns in namespace_seqs):
+                # fewer items have the filtered value than are in the namespaces
+                filtered.extend(
+                    item
+                    for _, _, ns, key in sorted(
+                        (namespace_seqs[ns], seq, ns, key)
+                        for (ns, key), seq in bucket.items()
+                        if ns in namespace_seqs
+                    )
+                    if filter_func(item := self._data[ns][key])
+                )
+                return filtered
+        for _, namespace in namespaces:
+            if op.filter:
+                filtered.extend(
+                    item for item in self._data[namespace].values() if filter_func(item)
+                )
+            else:
+                filtered.extend(self._data[namespace].values())
         return filtered
 
+    def _get_item_index(self) -> "_ItemIndex":
+        # rebuilt if _data was replaced, eg. by a subclass loading it from disk
+        if self._item_index is None or self._item_index.data is not self._data:
+            self._item_index = _ItemIndex(self._data, self.filter_fields)
+        return self._item_index
+
     def _embed_search_queries(
         self,
-        search_ops: dict[int, tuple[SearchOp, list[tuple[Item, list[list[float]]]]]],
+        search_ops: dict[int, tuple[SearchOp, list[Item]]],
     ) -> dict[str, list[float]]:
         queryinmem_store = {}
         if self.index_config and self.embeddings and search_ops:
@@ -283,7 +323,7 @@ class InMemoryStore(BaseStore):
 
     async def _aembed_search_queries(
         self,
-        search_ops: dict[int, tuple[SearchOp, list[tuple[Item, list[list[float]]]]]],
+        search_ops: dict[int, tuple[SearchOp, list[Item]]],
     ) -> dict[str, list[float]]:
         queryinmem_store = {}
         if self.index_config and self.embeddings and search_ops:
@@ -298,7 +338,7 @@ class InMemoryStore(BaseStore):
 
     def _batch_search(
         self,
-        ops: dict[int, tuple[SearchOp, list[tuple[Item, list[list[float]]]]]],
+        ops: dict[int, tuple[SearchOp, list[Item]]],
         queryinmem_store: dict[str, list[float]],
         results: list[Result],
     ) -> None:
@@ -309,40 +349,10 @@ class InMemoryStore(BaseStore):
                 continue
             if op.query and queryinmem_store:
                 query_embedding = queryinmem_store[op.query]
-                flat_items, flat_vectors = [], []
-                scoreless = []
-                for item, vectors in candidates:
-                    for vector in vectors:
-                        flat_items.append(item)
-                        flat_vectors.append(vector)
-                    if not vectors:
-                        scoreless.append(item)
-
-                scores = _cosine_similarity(query_embedding, flat_vectors)
-                sorted_results = sorted(
-                    zip(scores, flat_items), key=lambda x: x[0], reverse=True
-                )
-                # max pooling
-                seen: set[tuple[tuple[str, ...], str]] = set()
-                kept: list[tuple[Optional[float], Item]] = []
-                for score, item in sorted_results:
-                    key = (item.namespace, item.key)
-                    if key in seen:
-                        continue
-                    ix = len(seen)
-                    seen.add(key)
-                    if ix >= op.offset + op.limit:
-                        break
-                    if ix < op.offset:
-                        continue
-
-                    kept.append((score, item))
-                if scoreless and len(kept) < op.limit:
-                    # Corner case: if we request more items than what we have embedded,
-                    # fill the rest with non-scored items
-                    kept.extend(
-                        (None, item) for item in scoreless[: op.limit - len(kept)]
-                    )
+                if _check_numpy():
+                    kept = self._search_indexes(op, query_embedding, candidates)
+                else:
+                    kept = self._search_vectors(op, query_embedding, candidates)
 
                 results[i] = [
                     SearchItem(
@@ -364,24 +374,164 @@ class InMemoryStore(BaseStore):
                         created_at=item.created_at,
                         updated_at=item.updated_at,
                     )
-                    for (item, _) in candidates[op.offset : op.offset + op.limit]
+                    for item in candidates[op.offset : op.offset + op.limit]
+                ]
+
+    def _search_vectors(
+        self,
+        op: SearchOp,
+        query_embedding: list[float],
+        candidates: list[Item],
+    ) -> list[tuple[Optional[float], Item]]:
+        """Score the candidates' vectors one by one, used without numpy."""
+        flat_items, flat_vectors = [], []
+        scoreless = []
+        for item in candidates:
+            vectors = self._vectors[item.namespace].get(item.key, {}).values()
+            for vector in vectors:
+                flat_items.append(item)
+                flat_vectors.append(vector)
+            if not vectors:
+                scoreless.append(item)
+
+        scores = _cosine_similarity(query_embedding, flat_vectors)
+        sorted_results = sorted(
+            zip(scores, flat_items), key=lambda x: x[0], reverse=True
+        )
+        # max pooling
+        seen: set[tuple[tuple[str, ...], str]] = set()
+        kept: list[tuple[Optional[float], Item]] = []
+        for score, item in sorted_results:
+            key = (item.namespace, item.key)
+            if key in seen:
+                continue
+            ix = len(seen)
+            seen.add(key)
+            if ix >= op.offset + op.limit:
+                break
+            if ix < op.offset:
+                continue
+
+            kept.append((score, item))
+        if scoreless and len(kept) < op.limit:
+            # Corner case: if we request more items than what we have embedded,
+            # fill the rest with non-scored items
+            kept.extend((None, item) for item in scoreless[: op.limit - len(kept)])
+        return kept
+
+    def _search_indexes(
+        self,
+        op: SearchOp,
+        query_embedding: list[float],
+        candidates: list[Item],
+    ) -> list[tuple[Optional[float], Item]]:
+        """Score the candidates against the vector index of their namespaces,
+        keeping only the top offset + limit items."""
+        import numpy as np  # type: ignore[import-not-found]
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if norm := np.linalg.norm(query):
+            query = query / norm
+        by_namespace: dict[tuple[str, ...], list[Item]] = defaultdict(list)
+        for item in candidates:
+            by_namespace[item.namespace].append(item)
+        # scores of each namespace, with the (key, path) of each row
+        parts: list[np.ndarray] = []
+        owners: list[tuple[tuple[str, ...], list[tuple[str, str]]]] = []
+        offsets: list[int] = []
+        size = 0
+        for namespace, items in by_namespace.items():
+            index = self._get_index(namespace)
+            if not index.size:
+                continue
+            if len(items) == len(self._data[namespace]):
+                # every item in the namespace is a candidate
+                part = index.matrix[: index.size] @ query
+                part_owners = index.owners
+            else:
+                rows = [
+                    row
+                    for item in items
+                    for row in index.rows.get(item.key, {}).values()
                 ]
+                if not rows:
+                    continue
+                part = index.matrix[rows] @ query
+                part_owners = [index.owners[row] for row in rows]
+            parts.append(part)
+            owners.append((namespace, part_owners))
+            offsets.append(size)
+            size += len(part)
+
+        kept: list[tuple[Optional[float], Item]] = []
+        if parts:
+            scores = np.concatenate(parts)
+            # an item can have several vectors, widen the top rows until they
+            # hold enough distinct items
+            top_k = min(op.offset + op.limit, size)
+            while top_k:
+                if top_k < size:
+                    top = np.argpartition(-scores, top_k - 1)[:top_k]
+                else:
+                    top = np.arange(size)
+                top = top[np.argsort(-scores[top], kind="stable")]
+                # max pooling
+                seen: set[tuple[tuple[str, ...], str]] = set()
+                kept = []
+                for pos in top.tolist():
+                    part_ix = bisect.bisect_right(offsets, pos) - 1
+                    namespace, part_owners = owners[part_ix]
+                    key = part_owners[pos - offsets[part_ix]][0]
+                    if (namespace, key) in seen:
+                        continue
+                    ix = len(seen)
+                    seen.add((namespace, key))
+                    if ix >= op.offset + op.limit:
+                        break
+                    if ix < op.offset:
+                        continue
+                    kept.append((float(scores[pos]), self._data[namespace][key]))
+                if len(seen) >= op.offset + op.limit or top_k == size:
+                    break
+                top_k = min(top_k * 2, size)
+        if len(kept) < op.limit:
+            # Corner case: if we request more items than what we have embedded,
+            # fill the rest with non-scored items
+            scoreless = (
+                item
+                for item in candidates
+                if item.key not in self._get_index(item.namespace).rows
+            )
+            kept.extend(
+                (None, item) for _, item in zip(range(op.limit - len(kept)), scoreless)
+            )
+        return kept
+
+    def _get_index(self, namespace: tuple[str, ...]) -> "_VectorIndex":
+        if (index := self._indexes.get(namespace)) is None:
+            index = self._indexes[namespace] = _VectorIndex()
+            for key, paths in self._vectors[namespace].items():
+                for path, vector in paths.items():
+                    index.put(key, path, vector)
+        return index
 
     def _prepare_ops(
         self, ops: Iterable[Op]
     ) -> tuple[
         list[Result],
         dict[tuple[tuple[str, ...], str], PutOp],
-        dict[int, tuple[SearchOp, list[tuple[Item, list[list[float]]]]]],
+        dict[int, tuple[SearchOp, list[Item]]],
     ]:
         results: list[Result] = []
         put_ops: dict[tuple[tuple[str, ...], str], PutOp] = {}
-        search_ops: dict[
-            int, tuple[SearchOp, list[tuple[Item, list[list[float]]]]]
-        ] = {}
+        search_ops: dict[int, tuple[SearchOp, list[Item]]] = {}
         for i, op in enumerate(ops):
             if isinstance(op, GetOp):
-                item = self._data[op.namespace].get(op.key)
+                item = (
+                    items.get(op.key)
+                    if (items := self._data.get(op.namespace))
+                    else None
+                )
                 results.append(item)
             elif isinstance(op, SearchOp):
                 search_ops[i] = (op, self._filter_items(op))
@@ -397,18 +547,29 @@ class InMemoryStore(BaseStore):
         return results, put_ops, search_ops
 
     def _apply_put_ops(self, put_ops: dict[tuple[tuple[str, ...], str], PutOp]) -> None:
+        item_index = self._get_item_index()
         for (namespace, key), op in put_ops.items():
             if op.value is None:
-                self._data[namespace].pop(key, None)
+                items = self._data.get(namespace)
+                if items is None or (old := items.pop(key, None)) is None:
+                    continue
+                if not items:
+                    # namespaces only exist while they hold items
+                    del self._data[namespace]
                 self._vectors[namespace].pop(key, None)
+                if (index := self._indexes.get(namespace)) is not None:
+                    index.delete(key)
+                item_index.delete(old)
             else:
-                self._data[namespace][key] = Item(
+                old = self._data[namespace].get(key)
+                self._data[namespace][key] = item = Item(
                     value=op.value,
                     key=key,
                     namespace=namespace,
                     created_at=datetime.now(timezone.utc),
                     updated_at=datetime.now(timezone.utc),
                 )
+                item_index.put(old, item)
 
     def _extract_texts(
         self, put_ops: dict[tuple[tuple[str, ...], str], PutOp]
@@ -451,24 +612,271 @@ class InMemoryStore(BaseStore):
             )
         for embedding, (ns, key, path) in zip(embeddings, indices):
             self._vectors[ns][key][path] = embedding
+            if (index := self._indexes.get(ns)) is not None:
+                index.put(key, path, embedding)
 
     def _handle_list_namespaces(self, op: ListNamespacesOp) -> list[tuple[str, ...]]:
-        all_namespaces = list(
-            self._data.keys()
-        )  # Avoid collection size changing while iterating
-        namespaces = all_namespaces
-        if op.match_conditions:
-            namespaces = [
-                ns
-                for ns in namespaces
-                if all(_does_match(condition, ns) for condition in op.match_conditions)
-            ]
-
-        if op.max_depth is not None:
-            namespaces = sorted({ns[: op.max_depth] for ns in namespaces})
+        item_index = self._get_item_index()
+        conditions = op.match_conditions or ()
+        prefix = next((c.path for c in conditions if c.match_type == "prefix"), None)
+        suffix = next((c.path for c in conditions if c.match_type == "suffix"), None)
+
+        def matches(ns: tuple[str, ...]) -> bool:
+            return all(_does_match(condition, ns) for condition in conditions)
+
+        namespaces: Iterable[tuple[str, ...]]
+        if prefix is None and suffix is not None:
+            # walk the trie of reversed namespaces, then sort what matched
+            namespaces = sorted(
+                ns[::-1]
+                for ns in item_index.suffixes.walk(
+                    tuple(reversed(suffix)), lambda ns: matches(ns[::-1])
+                )
+            )
+            if op.max_depth is not None:
+                namespaces = _unique_sorted(ns[: op.max_depth] for ns in namespaces)
+        else:
+            # walked in sorted order, so only the requested page is visited
+            namespaces = item_index.namespaces.walk(
+                prefix or (), matches, max_depth=op.max_depth
+            )
+        return list(itertools.islice(namespaces, op.offset, op.offset + op.limit))
+
+
+class _NamespaceNode:
+    """A node in a trie of namespace labels."""
+
+    __slots__ = ("children", "seq")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _NamespaceNode] = {}
+        # order in which the namespace was added, None if it doesn't exist
+        self.seq: Optional[int] = None
+
+    def add(self, path: tuple[str, ...], seq: int) -> None:
+        node = self
+        for label in path:
+            if (child := node.children.get(label)) is None:
+                child = node.children[label] = _NamespaceNode()
+            node = child
+        node.seq = seq
+
+    def remove(self, path: tuple[str, ...]) -> None:
+        nodes = [self]
+        for label in path:
+            nodes.append(nodes[-1].children[label])
+        nodes[-1].seq = None
+        # prune the nodes that no longer lead to a namespace
+        for parent, label, node in zip(
+            reversed(nodes[:-1]), reversed(path), reversed(nodes[1:])
+        ):
+            if node.children or node.seq is not None:
+                break
+            del parent.children[label]
+
+    def walk(
+        self,
+        pattern: tuple[str, ...],
+        matches: Callable[[tuple[str, ...]], bool],
+        *,
+        max_depth: Optional[int] = None,
+        path: tuple[str, ...] = (),
+    ) -> Iterator[tuple[str, ...]]:
+        """Yield the namespaces below this node that start with `pattern` ("*"
+        matches any label) and pass `matches`, in sorted order. With `max_depth`,
+        yield each distinct namespace truncated to that depth instead."""
+        depth = len(path)
+        if max_depth is not None and depth >= max_depth:
+            if any(self.walk(pattern, matches, path=path)):
+                yield path
+            return
+        if self.seq is not None and depth >= len(pattern) and matches(path):
+            yield path
+        if depth < len(pattern) and pattern[depth] != "*":
+            label = pattern[depth]
+            children = [(label, self.children[label])] if label in self.children else []
         else:
-            namespaces = sorted(namespaces)
-        return namespaces[op.offset : op.offset + op.limit]
+            children = sorted(self.children.items())
+        for label, child in children:
+            yield from child.walk(
+                pattern, matches, max_depth=max_depth, path=(*path, label)
+            )
+
+    def iter_seqs(self, path: tuple[str, ...]) -> Iterator[tuple[int, tuple[str, ...]]]:
+        """Yield (seq, namespace) for this node and every namespace below it."""
+        if self.seq is not None:
+            yield self.seq, path
+        for label, child in self.children.items():
+            yield from child.iter_seqs((*path, label))
+
+
+class _ItemIndex:
+    """Indexes over the items of an `InMemoryStore`, kept in sync by its puts.
+
+    Namespaces are stored in a trie, and in a trie of their reversed labels for
+    suffix matches. For each of the store's `filter_fields`, items are grouped
+    by the value of that field.
+    """
+
+    __slots__ = ("data", "namespaces", "suffixes", "fields", "counter")
+
+    def __init__(
+        self, data: dict[tuple[str, ...], dict[str, Item]], fields: Sequence[str]
+    ) -> None:
+        self.data = data
+        self.namespaces = _NamespaceNode()
+        self.suffixes = _NamespaceNode()
+        # field -> value -> (ns, key) -> order in which the key was added
+        self.fields: dict[str, dict[Any, dict[tuple[tuple[str, ...], str], int]]] = {
+            field: {} for field in fields
+        }
+        self.counter = itertools.count()
+        for namespace, items in data.items():
+            if items:
+                self._add_namespace(namespace)
+            for item in items.values():
+                self._add_item(item, next(self.counter))
+
+    def put(self, old: Optional[Item], new: Item) -> None:
+        if old is None:
+            if len(self.data[new.namespace]) == 1:
+                self._add_namespace(new.namespace)
+            self._add_item(new, next(self.counter))
+        elif self.fields:
+            # keep the key's position, as _data does for updated keys
+            self._add_item(new, self._remove_item(old))
+
+    def delete(self, old: Item) -> None:
+        if old.namespace not in self.data:
+            self.namespaces.remove(old.namespace)
+            self.suffixes.remove(old.namespace[::-1])
+        self._remove_item(old)
+
+    def find_prefix(
+        self, prefix: tuple[str, ...]
+    ) -> Iterator[tuple[int, tuple[str, ...]]]:
+        """Yield (seq, namespace) for the namespaces that start with `prefix`."""
+        node = self.namespaces
+        for label in prefix:
+            if (child := node.children.get(label)) is None:
+                return
+            node = child
+        yield from node.iter_seqs(prefix)
+
+    def match_filter(
+        self, filter: dict[str, Any]
+    ) -> Optional[dict[tuple[tuple[str, ...], str], int]]:
+        """The smallest group of items with the exact value of an indexed field
+        in `filter`, or None if no indexed field is filtered by exact value."""
+        smallest = None
+        for field, value in filter.items():
+            if field not in self.fields:
+                continue
+            if isinstance(value, dict):
+                if len(value) != 1 or "$eq" not in value:
+                    continue
+                value = value["$eq"]
+            if (value_key := _field_value_key(value)) is _UNHASHABLE:
+                continue
+            group = self.fields[field].get(value_key, {})
+            if smallest is None or len(group) < len(smallest):
+                smallest = group
+        return smallest
+
+    def _add_namespace(self, namespace: tuple[str, ...]) -> None:
+        seq = next(self.counter)
+        self.namespaces.add(namespace, seq)
+        self.suffixes.add(namespace[::-1], seq)
+
+    def _add_item(self, item: Item, seq: int) -> None:
+        for field, groups in self.fields.items():
+            value_key = _field_value_key(item.value.get(field))
+            groups.setdefault(value_key, {})[(item.namespace, item.key)] = seq
+
+    def _remove_item(self, item: Item) -> int:
+        seq = -1
+        for field, groups in self.fields.items():
+            value_key = _field_value_key(item.value.get(field))
+            group = groups[value_key]
+            seq = group.pop((item.namespace, item.key))
+            if not group:
+                del groups[value_key]
+        return seq
+
+
+# groups the values that can't be looked up by equality, eg. lists and dicts
+_UNHASHABLE = object()
+
+
+def _field_value_key(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return _UNHASHABLE
+    try:
+        hash(value)
+    except TypeError:
+        return _UNHASHABLE
+    return value
+
+
+def _unique_sorted(
+    namespaces: Iterable[tuple[str, ...]],
+) -> Iterator[tuple[str, ...]]:
+    previous = None
+    for ns in namespaces:
+        if ns != previous:
+            yield ns
+            previous = ns
+
+
+class _VectorIndex:
+    """The vectors of one namespace, normalized and stored as rows of a
+    contiguous float32 matrix, so scoring them is a single matrix product.
+
+    Only used when numpy is installed. Rows of deleted keys are filled with
+    the last row, so the matrix stays contiguous.
+    """
+
+    __slots__ = ("matrix", "size", "owners", "rows")
+
+    def __init__(self) -> None:
+        self.matrix: Any = None
+        self.size = 0
+        # row -> (key, path)
+        self.owners: list[tuple[str, str]] = []
+        # key -> path -> row
+        self.rows: dict[str, dict[str, int]] = {}
+
+    def put(self, key: str, path: str, vector: list[float]) -> None:
+        import numpy as np  # type: ignore[import-not-found]
+
+        row_vector = np.asarray(vector, dtype=np.float32)
+        # zero vectors are kept as is, and score 0
+        if norm := np.linalg.norm(row_vector):
+            row_vector = row_vector / norm
+        paths = self.rows.setdefault(key, {})
+        if (row := paths.get(path)) is None:
+            row = paths[path] = self.size
+            if self.matrix is None:
+                self.matrix = np.empty((16, len(row_vector)), dtype=np.float32)
+            elif row == len(self.matrix):
+                grown = np.empty((2 * row, self.matrix.shape[1]), dtype=np.float32)
+                grown[:row] = self.matrix
+                self.matrix = grown
+            self.owners.append((key, path))
+            self.size += 1
+        self.matrix[row] = row_vector
+
+    def delete(self, key: str) -> None:
+        # from the last row down, so the row moved into a freed slot is never
+        # one of the rows being deleted
+        for row in sorted(self.rows.pop(key, {}).values(), reverse=True):
+            last = self.size - 1
+            if row != last:
+                self.matrix[row] = self.matrix[last]
+                moved_key, moved_path = self.owners[row] = self.owners[last]
+                self.rows[moved_key][moved_path] = row
+            self.owners.pop()
+            self.size -= 1
 
 
 @functools.lru_cache(maxsize=1)
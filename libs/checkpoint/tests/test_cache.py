@@ -0,0 +1,63 @@
+import pytest
+
+from langgraph.cache.memory import InMemoryCache
+
+
+def test_get_set_clear() -> None:
+    cache = InMemoryCache()
+    cache.set(
+        {
+            (("a", "b"), "k1"): ({"v": 1}, None),
+            (("a", "c"), "k2"): ([("x", 2)], None),
+        }
+    )
+
+    assert cache.get([(("a", "b"), "k1"), (("a", "b"), "missing")]) == {
+        (("a", "b"), "k1"): {"v": 1}
+    }
+    # cached values are copies, not references
+    value = cache.get([(("a", "b"), "k1")])[(("a", "b"), "k1")]
+    value["v"] = 2
+    assert cache.get([(("a", "b"), "k1")]) == {(("a", "b"), "k1"): {"v": 1}}
+
+    cache.clear([("a", "b")])
+    assert len(cache) == 1
+    cache.clear([("a",)])
+    assert len(cache) == 0
+
+
+def test_ttl() -> None:
+    cache = InMemoryCache()
+    cache.set({(("ns",), "k"): ("v", 60)})
+    assert cache.get([(("ns",), "k")]) == {(("ns",), "k"): "v"}
+
+    # expire the entry
+    value, expiry = cache._data[(("ns",), "k")]
+    cache._data[(("ns",), "k")] = (value, expiry - 61)
+    assert cache.get([(("ns",), "k")]) == {}
+    assert len(cache) == 0
+
+
+def test_max_size_evicts_least_recently_used() -> None:
+    with pytest.raises(ValueError):
+        InMemoryCache(max_size=0)
+
+    cache = InMemoryCache(max_size=2)
+    cache.set({(("ns",), "a"): (1, None), (("ns",), "b"): (2, None)})
+    # touch "a" so that "b" is the least recently used
+    assert cache.get([(("ns",), "a")]) == {(("ns",), "a"): 1}
+    cache.set({(("ns",), "c"): (3, None)})
+
+    assert len(cache) == 2
+    assert cache.get([(("ns",), "a"), (("ns",), "b"), (("ns",), "c")]) == {
+        (("ns",), "a"): 1,
+        (("ns",), "c"): 3,
+    }
+
+
+async def test_async() -> None:
+    cache = InMemoryCache()
+    await cache.aset({(("ns",), "k"): ("v", None)})
+    assert await cache.aget([(("ns",), "k")]) == {(("ns",), "k"): "v"}
+    await cache.aclear()
+    assert len(cache) == 0
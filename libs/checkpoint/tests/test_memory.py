@@ -6,6 +6,7 @@ from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base import (
     Checkpoint,
     CheckpointMetadata,
+    EmptyChannelError,
     create_checkpoint,
     empty_checkpoint,
 )
@@ -176,3 +177,103 @@ def test_memory_saver() -> None:
     from langgraph.checkpoint.memory import MemorySaver
 
     assert isinstance(MemorySaver(), InMemorySaver)
+
+
+def test_channel_values_stored_per_version() -> None:
+    saver = InMemorySaver()
+    config: RunnableConfig = {
+        "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+    }
+    chkpnt_1 = empty_checkpoint()
+    chkpnt_1["channel_values"] = {"a": [1, 2], "b": "foo"}
+    chkpnt_1["channel_versions"] = {"a": 1, "b": 1}
+    config = saver.put(config, chkpnt_1, {}, {"a": 1, "b": 1})
+
+    # only "b" changed, "a" is shared with the previous checkpoint
+    chkpnt_2 = create_checkpoint(chkpnt_1, None, 1)
+    chkpnt_2["channel_values"] = {"a": [1, 2], "b": "bar"}
+    chkpnt_2["channel_versions"] = {"a": 1, "b": 2}
+    config = saver.put(config, chkpnt_2, {}, {"b": 2})
+    assert len(saver.blobs) == 3
+
+    # channels cleared in a new version are stored as empty
+    chkpnt_3 = create_checkpoint(chkpnt_2, None, 2)
+    chkpnt_3["channel_values"] = {"a": [1, 2]}
+    chkpnt_3["channel_versions"] = {"a": 1, "b": 3}
+    config = saver.put(config, chkpnt_3, {}, {"b": 3})
+
+    assert [t.checkpoint["channel_values"] for t in saver.list(None)] == [
+        {"a": [1, 2]},
+        {"a": [1, 2], "b": "bar"},
+        {"a": [1, 2], "b": "foo"},
+    ]
+    tup = saver.get_tuple(config)
+    assert tup is not None
+    assert tup.checkpoint["channel_versions"] == {"a": 1, "b": 3}
+
+
+class _Channel:
+    def __init__(self, value: Any) -> None:
+        self.value = value
+        self.calls = 0
+
+    def checkpoint(self) -> Any:
+        self.calls += 1
+        if self.value is None:
+            raise EmptyChannelError()
+        return self.value
+
+
+def test_create_checkpoint_updated_channels() -> None:
+    channels = {"a": _Channel([1]), "b": _Channel("foo"), "c": _Channel(None)}
+    chkpnt_1 = empty_checkpoint()
+    chkpnt_1["channel_versions"] = {"a": 1, "b": 1}
+    chkpnt_2 = create_checkpoint(chkpnt_1, channels, 1)
+    assert chkpnt_2["channel_values"] == {"a": [1], "b": "foo"}
+
+    # only updated channels are snapshotted, the others are shared
+    channels["b"].value = "bar"
+    channels["c"].value = "new"
+    chkpnt_2["channel_versions"].update({"b": 2, "c": 2})
+    chkpnt_3 = create_checkpoint(chkpnt_2, channels, 2, updated_channels={"b", "c"})
+    assert chkpnt_3["channel_values"] == {"a": [1], "b": "bar", "c": "new"}
+    assert chkpnt_3["channel_values"]["a"] is chkpnt_2["channel_values"]["a"]
+    assert chkpnt_2["channel_values"] == {"a": [1], "b": "foo"}
+    assert channels["a"].calls == 1
+
+    # cleared channels are removed
+    channels["c"].value = None
+    chkpnt_4 = create_checkpoint(chkpnt_3, channels, 3, updated_channels={"c"})
+    assert chkpnt_4["channel_values"] == {"a": [1], "b": "bar"}
+    assert chkpnt_3["channel_values"] == {"a": [1], "b": "bar", "c": "new"}
+
+    # nothing updated, the values are shared as they are
+    chkpnt_5 = create_checkpoint(chkpnt_4, channels, 4, updated_channels=set())
+    assert chkpnt_5["channel_values"] is chkpnt_4["channel_values"]
+
+
+def test_no_serialize() -> None:
+    saver = InMemorySaver(serialize=False)
+    config: RunnableConfig = {
+        "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+    }
+    value = {"messages": ["hi"]}
+    chkpnt = empty_checkpoint()
+    chkpnt["channel_values"] = {"a": value}
+    chkpnt["channel_versions"] = {"a": 1}
+    config = saver.put(config, chkpnt, {"source": "input"}, {"a": 1})
+    saver.put_writes(config, [("a", value)], "task-1")
+
+    # containers are copied, other objects are kept as they are
+    value["messages"].append("bye")
+    tup = saver.get_tuple(config)
+    assert tup is not None
+    assert tup.checkpoint["channel_values"] == {"a": {"messages": ["hi"]}}
+    assert tup.pending_writes == [("task-1", "a", {"messages": ["hi"]})]
+    tup.checkpoint["channel_versions"]["a"] = 2
+    tup = saver.get_tuple(config)
+    assert tup is not None
+    assert tup.checkpoint["channel_versions"] == {"a": 1}
+
+    with pytest.raises(ValueError):
+        InMemorySaver(serde=saver.serde, serialize=False)
@@ -1,8 +1,12 @@
 # mypy: disable-error-code="operator"
 import asyncio
+import functools
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, cast
 
 import pytest
 from pytest_mock import MockerFixture
@@ -16,7 +20,7 @@ from langgraph.store.base import (
     Result,
     get_text_at_path,
 )
-from langgraph.store.base.batch import AsyncBatchedBaseStore
+from langgraph.store.base.batch import AsyncBatchedBaseStore, BatchedStore
 from langgraph.store.memory import InMemoryStore
 from tests.embed_test_utils import CharacterEmbeddings
 
@@ -353,6 +357,44 @@ def test_list_namespaces_empty_store() -> None:
     assert result == []
 
 
+def test_list_namespaces_after_delete() -> None:
+    store = InMemoryStore()
+    namespaces = [
+        ("a", "b", "c"),
+        ("a", "b", "d"),
+        ("a", "x", "d"),
+        ("z", "d"),
+    ]
+    for i, ns in enumerate(namespaces):
+        store.put(ns, f"id_{i}", {"i": i})
+        store.put(ns, "shared", {"i": i})
+
+    store.delete(("a", "b", "d"), "id_1")
+    assert store.list_namespaces(suffix=("d",)) == [
+        ("a", "b", "d"),
+        ("a", "x", "d"),
+        ("z", "d"),
+    ]
+
+    # namespaces are removed with their last item
+    store.delete(("a", "b", "d"), "shared")
+    store.delete(("z", "d"), "id_3")
+    store.delete(("z", "d"), "shared")
+    assert store.list_namespaces() == [("a", "b", "c"), ("a", "x", "d")]
+    assert store.list_namespaces(suffix=("d",)) == [("a", "x", "d")]
+    assert store.list_namespaces(prefix=("a", "*"), max_depth=2) == [
+        ("a", "b"),
+        ("a", "x"),
+    ]
+    assert store.list_namespaces(suffix=("*", "d"), max_depth=1) == [("a",)]
+    assert store.search(("z",)) == []
+    assert store.get(("z", "d"), "shared") is None
+    assert store.list_namespaces() == [("a", "b", "c"), ("a", "x", "d")]
+
+    store.put(("z", "d"), "id_3", {"i": 3})
+    assert store.list_namespaces(prefix=("z",)) == [("z", "d")]
+
+
 async def test_cannot_put_empty_namespace() -> None:
     store = InMemoryStore()
     doc = {"foo": "bar"}
@@ -506,6 +548,87 @@ async def test_async_batch_store_deduplication(mocker: MockerFixture) -> None:
     abatch.reset_mock()
 
 
+def test_batched_store(mocker: MockerFixture) -> None:
+    class BlockingStore(InMemoryStore):
+        def __init__(self) -> None:
+            super().__init__()
+            self.unblocked = threading.Event()
+
+        def batch(self, ops: Iterable[Op]) -> list[Result]:
+            self.unblocked.wait()
+            return super().batch(ops)
+
+    def run_blocked(store: BatchedStore, calls: list[Callable[[], Any]]) -> list[Any]:
+        # queue the calls while the store is busy with another one
+        inner = cast(BlockingStore, store.store)
+        inner.unblocked.clear()
+        with ThreadPoolExecutor(len(calls) + 1) as executor:
+            first = executor.submit(store.get, ("blocker",), "key")
+            while batch.call_count == 0:
+                time.sleep(0.001)
+            futs = [executor.submit(call) for call in calls]
+            while store._queue.qsize() < len(calls):
+                time.sleep(0.001)
+            inner.unblocked.set()
+            first.result()
+            return [fut.result() for fut in futs]
+
+    batch = mocker.spy(BlockingStore, "batch")
+    store = BatchedStore(BlockingStore())
+
+    run_blocked(
+        store,
+        [
+            functools.partial(store.put, ("test",), f"key{i % 3}", {"value": i % 3})
+            for i in range(6)
+        ],
+    )
+    assert len(batch.call_args_list) == 2
+    ops = list(batch.call_args_list[1].args[1])
+    assert len(ops) == 3
+    assert all(isinstance(op, PutOp) for op in ops)
+
+    batch.reset_mock()
+
+    results = run_blocked(
+        store,
+        [functools.partial(store.get, ("test",), f"key{i % 4}") for i in range(8)],
+    )
+    assert [r.value if r else None for r in results] == [
+        {"value": 0},
+        {"value": 1},
+        {"value": 2},
+        None,
+    ] * 2
+    assert len(batch.call_args_list) == 2
+    assert len(list(batch.call_args_list[1].args[1])) == 4
+
+    # calls with several operations get their own results
+    assert store.batch(
+        [GetOp(("test",), "key1"), PutOp(("test",), "key3", {"value": 3})]
+    ) == [results[1], None]
+    assert store.get(("test",), "key3").value == {"value": 3}  # type: ignore
+
+    # batches are capped at max_batch_size operations
+    store = BatchedStore(BlockingStore(), max_batch_size=2)
+    batch.reset_mock()
+    run_blocked(
+        store,
+        [functools.partial(store.put, ("test",), f"key{i}", {}) for i in range(4)],
+    )
+    assert [len(list(c.args[1])) for c in batch.call_args_list] == [1, 2, 2]
+
+    # errors are raised in every call of the batch
+    store = BatchedStore(BlockingStore())
+    batch.reset_mock()
+    batch.side_effect = ValueError("boom")
+    with ThreadPoolExecutor() as executor:
+        futs = [executor.submit(store.get, ("test",), "key") for _ in range(2)]
+        for fut in futs:
+            with pytest.raises(ValueError, match="boom"):
+                fut.result()
+
+
 @pytest.fixture
 def fake_embeddings() -> CharacterEmbeddings:
     return CharacterEmbeddings(dims=500)
@@ -947,3 +1070,94 @@ async def test_embed_with_path(fake_embeddings: CharacterEmbeddings) -> None:
     assert len(results) == 3
     doc5_result = next(r for r in results if r.key == "doc5")
     assert doc5_result.score is None
+
+
+def test_vector_search_index_matches_pure_python(
+    fake_embeddings: CharacterEmbeddings, mocker: MockerFixture
+) -> None:
+    """The numpy vector index returns the same results as scoring each vector."""
+    store = InMemoryStore(
+        index={
+            "dims": fake_embeddings.dims,
+            "embed": fake_embeddings,
+            "fields": ["text", "tags[*]"],
+        }
+    )
+    words = ["apple", "banana", "cherry", "grape", "lemon", "mango", "peach"]
+    for i in range(60):
+        store.put(
+            ("fruit", str(i % 3)),
+            f"doc{i}",
+            {
+                "text": " ".join(words[(i * j) % len(words)] for j in range(3))
+                + str(i),
+                "tags": [f"{words[i % len(words)]} {i}", f"{words[(i + 3) % 7]} {i}"],
+                "rank": i,
+            },
+            index=False if i % 11 == 0 else None,
+        )
+    # search once to build the indexes, then update and delete some items
+    store.search(("fruit",), query="apple")
+    for i in range(0, 60, 7):
+        store.put(("fruit", str(i % 3)), f"doc{i}", {"text": f"lemon {i}", "rank": i})
+    for i in range(0, 60, 5):
+        store.delete(("fruit", str(i % 3)), f"doc{i}")
+
+    searches: list[dict[str, Any]] = [
+        {"query": "apple banana", "limit": 10},
+        {"query": "peach", "limit": 5, "offset": 3},
+        {"query": "mango", "limit": 100},
+        {"query": "grape", "limit": 4, "filter": {"rank": {"$gt": 20}}},
+    ]
+    with_index = [
+        [(r.key, r.score) for r in store.search(("fruit",), **kwargs)]
+        for kwargs in searches
+    ]
+    mocker.patch("langgraph.store.memory._check_numpy", return_value=False)
+    without_index = [
+        [(r.key, r.score) for r in store.search(("fruit",), **kwargs)]
+        for kwargs in searches
+    ]
+    for indexed, pure in zip(with_index, without_index):
+        assert [key for key, _ in indexed] == [key for key, _ in pure]
+        assert [score for _, score in indexed] == [
+            pytest.approx(score, abs=1e-5) if score is not None else None
+            for _, score in pure
+        ]
+
+
+def test_search_filter_fields_match_scan() -> None:
+    indexed = InMemoryStore(filter_fields=["color", "size"])
+    scanned = InMemoryStore()
+    for store in (indexed, scanned):
+        for i in range(60):
+            ns = ("docs", f"team_{i % 3}") if i % 4 else ("other",)
+            store.put(
+                ns,
+                f"doc_{i}",
+                {
+                    "color": ["red", "blue", "green"][i % 3],
+                    "size": i % 7,
+                    "tags": ["x"] if i % 2 else {"y": 1},
+                },
+            )
+        # updated keys keep their position, deleted keys are dropped
+        store.put(("docs", "team_1"), "doc_1", {"color": "blue", "size": 100})
+        store.delete(("docs", "team_2"), "doc_2")
+
+    filters: list[dict[str, Any]] = [
+        {"color": "red"},
+        {"color": {"$eq": "blue"}},
+        {"color": "blue", "size": 100},
+        {"color": "red", "size": {"$gt": 3}},
+        {"size": 4, "tags": ["x"]},
+        {"color": "purple"},
+    ]
+    for prefix in [(), ("docs",), ("docs", "team_1"), ("missing",)]:
+        for filter in filters:
+            expected = scanned.search(prefix, filter=filter, limit=100)
+            result = indexed.search(prefix, filter=filter, limit=100)
+            assert [(r.namespace, r.key) for r in result] == [
+                (e.namespace, e.key) for e in expected
+            ]
+            assert [r.value for r in result] == [e.value for e in expected]
@@ -6,6 +6,8 @@ from pyperf._runner import Runner
 from uvloop import new_event_loop
 
 from bench.fanout_to_subgraph import fanout_to_subgraph, fanout_to_subgraph_sync
+from bench.message_history import history, message_history
+from bench.parallel import create_parallel
 from bench.pydantic_state import pydantic_state
 from bench.react_agent import react_agent
 from bench.sequential import create_sequential
@@ -205,6 +207,18 @@ benchmarks = (
             ]
         },
     ),
+    (
+        "message_history_1000x100",
+        message_history(100).compile(checkpointer=None),
+        message_history(100).compile(checkpointer=None),
+        {"messages": history(1000), "remaining": 100},
+    ),
+    (
+        "message_history_10000x100",
+        message_history(100).compile(checkpointer=None),
+        message_history(100).compile(checkpointer=None),
+        {"messages": history(10000), "remaining": 100},
+    ),
     (
         "sequential_20",
         create_sequential(20).compile(),
@@ -229,6 +243,18 @@ benchmarks = (
         create_sequential(200).compile(),
         {"messages": []},  # Empty list of messages
     ),
+    (
+        "parallel_10x100",
+        create_parallel(10).compile(),
+        create_parallel(10).compile(),
+        {"remaining": 100, "visits": 0},
+    ),
+    (
+        "parallel_10x100_thread",
+        create_parallel(10, "thread").compile(),
+        create_parallel(10, "thread").compile(),
+        {"remaining": 100, "visits": 0},
+    ),
     (
         "pydantic_state_25x300",
         pydantic_state(300).compile(checkpointer=None),
@@ -0,0 +1,63 @@
+"""Append to a long message history, one message per step."""
+
+from typing import Annotated, Callable
+
+from langchain_core.messages import AIMessage, AnyMessage, HumanMessage
+from typing_extensions import TypedDict
+
+from langgraph.graph import END, START, StateGraph, add_messages
+
+
+def message_history(steps: int, reducer: Callable = add_messages) -> StateGraph:
+    """Create a graph that appends one message to the history per step, for
+    `steps` steps."""
+
+    class State(TypedDict):
+        messages: Annotated[list[AnyMessage], reducer]
+        remaining: int
+
+    def reply(state: State) -> dict:
+        return {
+            "messages": [AIMessage(f"reply {state['remaining']}")],
+            "remaining": state["remaining"] - 1,
+        }
+
+    def should_continue(state: State) -> str:
+        return "reply" if state["remaining"] > 0 else END
+
+    builder = StateGraph(State)
+    builder.add_node("reply", reply)
+    builder.add_edge(START, "reply")
+    builder.add_conditional_edges("reply", should_continue)
+    return builder
+
+
+def history(size: int) -> list[AnyMessage]:
+    return [
+        HumanMessage(f"message {i}", id=str(i)) if i % 2 else AIMessage(f"message {i}")
+        for i in range(size)
+    ]
+
+
+if __name__ == "__main__":
+    import time
+
+    def add_messages_full(left: list, right: list) -> list:
+        """Not recognized as add_messages, so the full history is re-merged every step."""
+        return add_messages(left, right)
+
+    steps = 100
+    for size in (1_000, 10_000):
+        input = {"messages": history(size), "remaining": steps}
+        for label, reducer in (
+            ("incremental", add_messages),
+            ("full", add_messages_full),
+        ):
+            graph = message_history(steps, reducer).compile()
+            config = {"recursion_limit": steps + 10}
+            start = time.perf_counter()
+            graph.invoke(input, config)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:>11} history={size:>6}: {elapsed / steps * 1000:.3f} ms/step"
+            )
@@ -0,0 +1,64 @@
+"""Create a graph running a few no-op nodes in parallel for many steps."""
+
+import operator
+from typing import Annotated, Optional
+
+from typing_extensions import TypedDict
+
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import NodeExecutor
+from langgraph.utils.runnable import RunnableCallable
+
+
+class State(TypedDict):
+    remaining: int
+    visits: Annotated[int, operator.add]
+
+
+def create_parallel(
+    number_nodes: int, executor: Optional[NodeExecutor] = None
+) -> StateGraph:
+    """Create a graph running `number_nodes` no-op nodes in parallel in each step,
+    until `remaining` steps have run."""
+    builder = StateGraph(State)
+
+    def noop(state: State) -> dict:
+        """No-op function."""
+        return {"visits": 1}
+
+    async def anoop(state: State) -> dict:
+        """No-op function."""
+        return {"visits": 1}
+
+    def countdown(state: State) -> dict:
+        return {"remaining": state["remaining"] - 1}
+
+    async def acountdown(state: State) -> dict:
+        return {"remaining": state["remaining"] - 1}
+
+    names = [f"node_{i}" for i in range(number_nodes)]
+    builder.add_node("countdown", RunnableCallable(countdown, acountdown))
+    for name in names:
+        builder.add_node(name, RunnableCallable(noop, anoop), executor=executor)
+        builder.add_edge("countdown", name)
+    builder.add_edge(START, "countdown")
+    builder.add_conditional_edges(
+        names[-1],
+        lambda state: "countdown" if state["remaining"] > 0 else END,
+        ["countdown", END],
+    )
+    return builder
+
+
+if __name__ == "__main__":
+    import time
+
+    config = {"recursion_limit": 20000000000}
+    input = {"remaining": 1000, "visits": 0}
+
+    for executor in ("thread", None, "inline"):
+        graph = create_parallel(10, executor).compile()
+        start = time.time()
+        len([c for c in graph.stream(input, config=config)])
+        end = time.time()
+        print(f"executor={executor} time taken: {end - start:.4f} seconds")
@@ -3,6 +3,7 @@ from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.context import Context
 from langgraph.channels.ephemeral_value import EphemeralValue
 from langgraph.channels.last_value import LastValue
+from langgraph.channels.messages import MessagesAggregate
 from langgraph.channels.topic import Topic
 from langgraph.channels.untracked_value import UntrackedValue
 
@@ -11,6 +12,7 @@ __all__ = [
     "Topic",
     "Context",
     "BinaryOperatorAggregate",
+    "MessagesAggregate",
     "UntrackedValue",
     "EphemeralValue",
     "AnyValue",
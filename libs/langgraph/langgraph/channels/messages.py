@@ -0,0 +1,102 @@
+import uuid
+from typing import Any, Callable, Optional, Sequence, Type, cast
+
+from langchain_core.messages import (
+    AnyMessage,
+    BaseMessageChunk,
+    RemoveMessage,
+    convert_to_messages,
+    message_chunk_to_message,
+)
+from typing_extensions import Self
+
+from langgraph.channels.binop import BinaryOperatorAggregate
+from langgraph.constants import MISSING
+
+
+class MessagesAggregate(BinaryOperatorAggregate[list[AnyMessage]]):
+    """Stores a list of messages, merging each update into it by message ID.
+
+    Equivalent to `BinaryOperatorAggregate(list, add_messages)`, but keeps a
+    persistent map of message ID to position in the list. Each update only
+    normalizes the incoming messages, instead of re-converting and re-indexing
+    the full history, so the cost of a step doesn't grow with the conversation.
+    Used automatically for state keys annotated with `add_messages`.
+    """
+
+    __slots__ = ("index",)
+
+    def __init__(
+        self,
+        typ: Type[list[AnyMessage]],
+        operator: Callable[[Any, Any], list[AnyMessage]],
+    ) -> None:
+        super().__init__(typ, operator)
+        self.index: dict[str, int] = {}
+
+    def from_checkpoint(self, checkpoint: Optional[list[AnyMessage]]) -> Self:
+        empty = self.__class__(self.typ, self.operator)
+        empty.key = self.key
+        if checkpoint is None:
+            pass
+        elif checkpoint is self.value:
+            # copy of this channel, eg. for a local read, reuse the index
+            empty.value = checkpoint
+            empty.index = self.index.copy()
+        else:
+            empty.value = _coerce_messages(checkpoint)
+            empty.index = {m.id: i for i, m in enumerate(empty.value)}  # type: ignore[misc]
+        return empty
+
+    def update(self, values: Sequence[Any]) -> bool:
+        if not values:
+            return False
+        # values handed out by get() are never mutated, copy the list once per step
+        merged = [] if self.value is MISSING else self.value.copy()
+        try:
+            for value in values:
+                self._merge(merged, value)
+        except BaseException:
+            # restore the index to match the unchanged value
+            self.index = (
+                {}
+                if self.value is MISSING
+                else {m.id: i for i, m in enumerate(self.value)}  # type: ignore[misc]
+            )
+            raise
+        self.value = merged
+        return True
+
+    def _merge(self, merged: list[AnyMessage], right: Any) -> None:
+        index = self.index
+        ids_to_remove: set[str] = set()
+        for m in _coerce_messages(right):
+            if (existing_idx := index.get(cast(str, m.id))) is not None:
+                if isinstance(m, RemoveMessage):
+                    ids_to_remove.add(cast(str, m.id))
+                else:
+                    ids_to_remove.discard(cast(str, m.id))
+                    merged[existing_idx] = m
+            elif isinstance(m, RemoveMessage):
+                raise ValueError(
+                    f"Attempting to delete a message with an ID that doesn't exist ('{m.id}')"
+                )
+            else:
+                index[cast(str, m.id)] = len(merged)
+                merged.append(m)
+        if ids_to_remove:
+            merged[:] = [m for m in merged if m.id not in ids_to_remove]
+            self.index = {m.id: i for i, m in enumerate(merged)}  # type: ignore[misc]
+
+
+def _coerce_messages(value: Any) -> list[AnyMessage]:
+    if not isinstance(value, list):
+        value = [value]
+    messages = [
+        message_chunk_to_message(cast(BaseMessageChunk, m))
+        for m in convert_to_messages(value)
+    ]
+    for m in messages:
+        if m.id is None:
+            m.id = str(uuid.uuid4())
+    return cast(list[AnyMessage], messages)
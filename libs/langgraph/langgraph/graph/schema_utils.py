@@ -82,14 +82,19 @@ class SchemaCoercionMapper:
             depth = self.max_depth
         if not isinstance(input_data, dict) or depth <= 0:
             return input_data
-        processed = {}
         if self._field_coercers is None:
+            # fields left as is aren't visited at all
             self._field_coercers = {
-                n: self._build_coercer(t, depth - 1) for n, t in self._fields.items()
+                n: fn
+                for n, t in self._fields.items()
+                if (fn := self._build_coercer(t, depth - 1)) != self._passthrough
             }
-        for k, v in input_data.items():
-            fn = self._field_coercers.get(k)
-            processed[k] = fn(v, depth - 1) if fn else v
+        if not self._field_coercers:
+            return self._construct(**input_data)
+        processed = dict(input_data)
+        for k, fn in self._field_coercers.items():
+            if k in processed:
+                processed[k] = fn(processed[k], depth - 1)
         return self._construct(**processed)
 
     def _build_coercer(
@@ -101,8 +106,7 @@ class SchemaCoercionMapper:
 
         if origin is Annotated:
             real_type, *_ = get_args(field_type)
-            sub = self._build_coercer(real_type, depth - 1)
-            return lambda v, d: sub(v, d)
+            return self._build_coercer(real_type, depth - 1)
         if isclass(field_type):
             is_class_ = True
             try:
@@ -120,7 +124,7 @@ class SchemaCoercionMapper:
         if origin is list or field_type is list:
             args = get_args(field_type)
             if len(args) != 1:
-                return lambda v, d: v
+                return self._passthrough
             sub = self._build_coercer(args[0], depth - 1)
 
             def list_coercer(v: Any, d: Any) -> Any:
@@ -132,7 +136,7 @@ class SchemaCoercionMapper:
         if origin is set or field_type is set:
             args = get_args(field_type)
             if len(args) != 1:
-                return lambda v, d: v
+                return self._passthrough
             sub = self._build_coercer(args[0], depth - 1)
 
             def set_coercer(v: Any, d: Any) -> Any:
@@ -167,7 +171,7 @@ class SchemaCoercionMapper:
         if origin is tuple:
             targs = get_args(field_type)
             if not targs:
-                return lambda v, d: v
+                return self._passthrough
             subs = [self._build_coercer(a, depth - 1) for a in targs]
 
             def tuple_coercer(v: Any, d: Any) -> Any:
@@ -2,6 +2,7 @@ import inspect
 import logging
 import typing
 import warnings
+import weakref
 from functools import partial
 from inspect import isclass, isfunction, ismethod, signature
 from types import FunctionType
@@ -29,11 +30,13 @@ from pydantic.v1 import BaseModel as BaseModelV1
 from typing_extensions import Self
 
 from langgraph._api.deprecation import LangGraphDeprecationWarning
+from langgraph.cache.base import BaseCache
 from langgraph.channels.base import BaseChannel
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.dynamic_barrier_value import DynamicBarrierValue, WaitForNames
 from langgraph.channels.ephemeral_value import EphemeralValue
 from langgraph.channels.last_value import LastValue
+from langgraph.channels.messages import MessagesAggregate
 from langgraph.channels.named_barrier_value import NamedBarrierValue
 from langgraph.constants import EMPTY_SEQ, MISSING, NS_END, NS_SEP, SELF, TAG_HIDDEN
 from langgraph.errors import (
@@ -66,7 +69,14 @@ from langgraph.pregel.write import (
     ChannelWriteTupleEntry,
 )
 from langgraph.store.base import BaseStore
-from langgraph.types import All, Checkpointer, Command, RetryPolicy
+from langgraph.types import (
+    All,
+    CachePolicy,
+    Checkpointer,
+    Command,
+    NodeExecutor,
+    RetryPolicy,
+)
 from langgraph.utils.fields import get_field_default
 from langgraph.utils.pydantic import create_model
 from langgraph.utils.runnable import RunnableCallable, RunnableLike, coerce_to_runnable
@@ -101,6 +111,8 @@ class StateNodeSpec(NamedTuple):
     input: Type[Any]
     retry_policy: Optional[RetryPolicy]
     ends: Optional[Union[tuple[str, ...], dict[str, str]]] = EMPTY_SEQ
+    cache_policy: Optional[CachePolicy] = None
+    executor: Optional[NodeExecutor] = None
 
 
 class StateGraph(Graph):
@@ -242,6 +254,8 @@ class StateGraph(Graph):
         metadata: Optional[dict[str, Any]] = None,
         input: Optional[Type[Any]] = None,
         retry: Optional[RetryPolicy] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        executor: Optional[NodeExecutor] = None,
         destinations: Optional[Union[dict[str, str], tuple[str]]] = None,
     ) -> Self:
         """Adds a new node to the state graph.
@@ -267,6 +281,8 @@ class StateGraph(Graph):
         metadata: Optional[dict[str, Any]] = None,
         input: Optional[Type[Any]] = None,
         retry: Optional[RetryPolicy] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        executor: Optional[NodeExecutor] = None,
         destinations: Optional[Union[dict[str, str], tuple[str]]] = None,
     ) -> Self:
         """Adds a new node to the state graph.
@@ -291,6 +307,8 @@ class StateGraph(Graph):
         metadata: Optional[dict[str, Any]] = None,
         input: Optional[Type[Any]] = None,
         retry: Optional[RetryPolicy] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        executor: Optional[NodeExecutor] = None,
         destinations: Optional[Union[dict[str, str], tuple[str]]] = None,
     ) -> Self:
         """Adds a new node to the state graph.
@@ -303,6 +321,11 @@ class StateGraph(Graph):
             metadata (Optional[dict[str, Any]]): The metadata associated with the node. (default: None)
             input (Optional[Type[Any]]): The input schema for the node. (default: the graph's input schema)
             retry (Optional[RetryPolicy]): The policy for retrying the node. (default: None)
+            cache_policy (Optional[CachePolicy]): The policy for caching the node's results.
+                Only used if the graph is compiled with a cache. (default: None)
+            executor (Optional[NodeExecutor]): Where to run the node: "inline" on the thread running the graph,
+                "thread" in the thread pool, or "process" in a worker process, for CPU-bound nodes.
+                "inline" and "thread" only apply to sync execution. (default: None, inline if the node was measured to be cheap)
             destinations (Optional[Union[dict[str, str], tuple[str]]]): Destinations that indicate where a node can route to.
                 This is useful for edgeless graphs with nodes that return `Command` objects.
                 If a dict is provided, the keys will be used as the target node names and the values will be used as the labels for the edges.
@@ -432,6 +455,8 @@ class StateGraph(Graph):
             input=input or self.schema,
             retry_policy=retry,
             ends=ends,
+            cache_policy=cache_policy,
+            executor=executor,
         )
         return self
 
@@ -571,6 +596,7 @@ class StateGraph(Graph):
         checkpointer: Checkpointer = None,
         *,
         store: Optional[BaseStore] = None,
+        cache: Optional[BaseCache] = None,
         interrupt_before: Optional[Union[All, list[str]]] = None,
         interrupt_after: Optional[Union[All, list[str]]] = None,
         debug: bool = False,
@@ -587,6 +613,8 @@ class StateGraph(Graph):
                 allowing it to be paused, resumed, and replayed from any point.
                 If None, it may inherit the parent graph's checkpointer when used as a subgraph.
                 If False, it will not use or inherit any checkpointer.
+            cache (Optional[BaseCache]): A cache for the results of nodes that have a cache policy.
+                If None, it may inherit the parent graph's cache when used as a subgraph.
             interrupt_before (Optional[Sequence[str]]): An optional list of node names to interrupt before.
             interrupt_after (Optional[Sequence[str]]): An optional list of node names to interrupt after.
             debug (bool): A flag indicating whether to enable debug mode.
@@ -652,6 +680,7 @@ class StateGraph(Graph):
             auto_validate=False,
             debug=debug,
             store=store,
+            cache=cache,
             name=name or "LangGraph",
         )
 
@@ -764,33 +793,8 @@ class CompiledStateGraph(CompiledGraph):
                     else:
                         updates.extend(_get_updates(i) or ())
                 return updates
-            elif (t := type(input)) and get_type_hints(t):
-                # Pydantic v2
-                if isinstance(input, BaseModel):
-                    keep: Optional[set[str]] = input.model_fields_set
-                    defaults = {k: v.default for k, v in input.model_fields.items()}
-                # Pydantic v1
-                elif isinstance(input, BaseModelV1):
-                    keep = input.__fields_set__
-                    defaults = {k: v.default for k, v in t.__fields__.items()}
-                else:
-                    keep = None
-                    defaults = {}
-
-                # NOTE: This behavior for Pydantic is somewhat inelegant,
-                # but we keep around for backwards compatibility
-                # if input is a Pydantic model, only update values
-                # that are different from the default values or in the keep set
-                return [
-                    (k, value)
-                    for k in output_keys
-                    if (value := getattr(input, k, MISSING)) is not MISSING
-                    and (
-                        value is not None
-                        or defaults.get(k, MISSING) is not None
-                        or (keep is not None and k in keep)
-                    )
-                ]
+            elif extract := _get_update_extractor(type(input), output_keys):
+                return extract(input)
             else:
                 msg = create_error_message(
                     message=f"Expected dict, got {input}",
@@ -845,6 +849,8 @@ class CompiledStateGraph(CompiledGraph):
                 ],
                 metadata=node.metadata,
                 retry_policy=node.retry_policy,
+                cache_policy=node.cache_policy,
+                executor=node.executor,
                 bound=node.runnable,
             )
         else:
@@ -966,6 +972,74 @@ def _coerce_state(schema: Type[Any], input: dict[str, Any]) -> dict[str, Any]:
     return schema(**input)
 
 
+_update_extractors: weakref.WeakKeyDictionary[
+    Type[Any], dict[tuple[str, ...], Optional[Callable[[Any], list[tuple[str, Any]]]]]
+] = weakref.WeakKeyDictionary()
+
+
+def _get_update_extractor(
+    t: Type[Any], output_keys: Sequence[str]
+) -> Optional[Callable[[Any], list[tuple[str, Any]]]]:
+    """Get a function returning the updates to `output_keys` from the attributes
+    of an instance of `t`, or None if `t` has no type hints. Built once per class
+    and output keys, as reading the type hints and defaults is slow."""
+    keys = tuple(output_keys)
+    try:
+        extractors = _update_extractors[t]
+    except KeyError:
+        extractors = _update_extractors[t] = {}
+    try:
+        return extractors[keys]
+    except KeyError:
+        pass
+
+    if not get_type_hints(t):
+        extract = None
+    else:
+        # Pydantic v2
+        if issubclass(t, BaseModel):
+            fields_set: Optional[str] = "model_fields_set"
+            defaults = {k: v.default for k, v in t.model_fields.items()}
+        # Pydantic v1
+        elif issubclass(t, BaseModelV1):
+            fields_set = "__fields_set__"
+            defaults = {k: v.default for k, v in t.__fields__.items()}
+        else:
+            fields_set = None
+            defaults = {}
+        # NOTE: This behavior for Pydantic is somewhat inelegant,
+        # but we keep around for backwards compatibility
+        # if input is a Pydantic model, only update values
+        # that are different from the default values or in the keep set
+        none_defaults = frozenset(k for k in keys if defaults.get(k, MISSING) is None)
+        extract = partial(_extract_updates, keys, none_defaults, fields_set)
+
+    extractors[keys] = extract
+    return extract
+
+
+def _extract_updates(
+    keys: tuple[str, ...],
+    none_defaults: frozenset[str],
+    fields_set: Optional[str],
+    input: Any,
+) -> list[tuple[str, Any]]:
+    if none_defaults:
+        keep = getattr(input, fields_set) if fields_set else EMPTY_SEQ
+        return [
+            (k, value)
+            for k in keys
+            if (value := getattr(input, k, MISSING)) is not MISSING
+            and (value is not None or k not in none_defaults or k in keep)
+        ]
+    else:
+        return [
+            (k, value)
+            for k in keys
+            if (value := getattr(input, k, MISSING)) is not MISSING
+        ]
+
+
 def _control_branch(value: Any) -> Sequence[Union[str, Send]]:
     if isinstance(value, Send):
         return [value]
@@ -1096,6 +1170,10 @@ def _is_field_binop(typ: Type[Any]) -> Optional[BinaryOperatorAggregate]:
                 )
                 == 2
             ):
+                from langgraph.graph.message import add_messages
+
+                if meta[-1] is add_messages:
+                    return MessagesAggregate(typ, meta[-1])
                 return BinaryOperatorAggregate(typ, meta[-1])
             else:
                 raise ValueError(
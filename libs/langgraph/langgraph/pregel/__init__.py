@@ -5,7 +5,7 @@ import concurrent
 import concurrent.futures
 import queue
 import weakref
-from collections import deque
+from collections import defaultdict, deque
 from functools import partial
 from typing import (
     Any,
@@ -43,6 +43,7 @@ from langchain_core.tracers._streaming import _StreamingCallbackHandler
 from pydantic import BaseModel
 from typing_extensions import Self
 
+from langgraph.cache.base import BaseCache
 from langgraph.channels.base import (
     BaseChannel,
 )
@@ -54,7 +55,9 @@ from langgraph.checkpoint.base import (
     empty_checkpoint,
 )
 from langgraph.constants import (
+    CACHE_NS_WRITES,
     CONF,
+    CONFIG_KEY_CACHE,
     CONFIG_KEY_CHECKPOINT_ID,
     CONFIG_KEY_CHECKPOINT_NS,
     CONFIG_KEY_CHECKPOINTER,
@@ -492,6 +495,9 @@ class Pregel(PregelProtocol):
     store: Optional[BaseStore] = None
     """Memory store to use for SharedValues. Defaults to None."""
 
+    cache: Optional[BaseCache] = None
+    """Cache to use for storing node results. Defaults to None."""
+
     retry_policy: Optional[RetryPolicy] = None
     """Retry policy to use when running tasks. Set to None to disable."""
 
@@ -503,6 +509,10 @@ class Pregel(PregelProtocol):
 
     name: str = "LangGraph"
 
+    trigger_to_nodes: Mapping[str, Sequence[str]]
+    """Nodes subscribed to each channel, set by validate(). Used to only check
+    the nodes triggered by the channels updated in the previous step."""
+
     def __init__(
         self,
         *,
@@ -520,11 +530,13 @@ class Pregel(PregelProtocol):
         debug: Optional[bool] = None,
         checkpointer: Optional[BaseCheckpointSaver] = None,
         store: Optional[BaseStore] = None,
+        cache: Optional[BaseCache] = None,
         retry_policy: Optional[RetryPolicy] = None,
         config_type: Optional[Type[Any]] = None,
         input_model: Optional[Type[BaseModel]] = None,
         config: Optional[RunnableConfig] = None,
         name: str = "LangGraph",
+        trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
     ) -> None:
         self.nodes = nodes
         self.channels = channels or {}
@@ -539,11 +551,13 @@ class Pregel(PregelProtocol):
         self.debug = debug if debug is not None else get_debug()
         self.checkpointer = checkpointer
         self.store = store
+        self.cache = cache
         self.retry_policy = retry_policy
         self.config_type = config_type
         self.input_model = input_model
         self.config = config
         self.name = name
+        self.trigger_to_nodes = trigger_to_nodes or {}
         if auto_validate:
             self.validate()
 
@@ -576,6 +590,11 @@ class Pregel(PregelProtocol):
             self.interrupt_after_nodes,
             self.interrupt_before_nodes,
         )
+        trigger_to_nodes: defaultdict[str, list[str]] = defaultdict(list)
+        for name, node in self.nodes.items():
+            for trigger in node.triggers:
+                trigger_to_nodes[trigger].append(name)
+        self.trigger_to_nodes = dict(trigger_to_nodes)
         return self
 
     @property
@@ -1423,7 +1442,7 @@ class Pregel(PregelProtocol):
             if saved and channel_writes:
                 checkpointer.put_writes(checkpoint_config, channel_writes, task_id)
             # apply to checkpoint and save
-            mv_writes = apply_writes(
+            mv_writes, _ = apply_writes(
                 checkpoint, channels, [task], checkpointer.get_next_version
             )
             assert not mv_writes, "Can't write to SharedValues from update_state"
@@ -1709,7 +1728,7 @@ class Pregel(PregelProtocol):
                     checkpoint_config, channel_writes, task_id
                 )
             # apply to checkpoint and save
-            mv_writes = apply_writes(
+            mv_writes, _ = apply_writes(
                 checkpoint, channels, [task], checkpointer.get_next_version
             )
             assert not mv_writes, "Can't write to SharedValues from update_state"
@@ -1751,6 +1770,7 @@ class Pregel(PregelProtocol):
         Union[All, Sequence[str]],
         Optional[BaseCheckpointSaver],
         Optional[BaseStore],
+        Optional[BaseCache],
     ]:
         if config["recursion_limit"] < 1:
             raise ValueError("recursion_limit must be at least 1")
@@ -1783,6 +1803,10 @@ class Pregel(PregelProtocol):
             store: Optional[BaseStore] = config[CONF][CONFIG_KEY_STORE]
         else:
             store = self.store
+        if CONFIG_KEY_CACHE in config.get(CONF, {}):
+            cache: Optional[BaseCache] = config[CONF][CONFIG_KEY_CACHE]
+        else:
+            cache = self.cache
         return (
             debug,
             set(stream_mode),
@@ -1791,6 +1815,7 @@ class Pregel(PregelProtocol):
             interrupt_after,
             checkpointer,
             store,
+            cache,
         )
 
     def stream(
@@ -1962,6 +1987,7 @@ class Pregel(PregelProtocol):
                 interrupt_after_,
                 checkpointer,
                 store,
+                cache,
             ) = self._defaults(
                 config,
                 stream_mode=stream_mode,
@@ -1979,6 +2005,9 @@ class Pregel(PregelProtocol):
                 run_manager.inheritable_handlers.append(
                     StreamMessagesHandler(stream.put)
                 )
+            # set up node cache, shared with subgraphs
+            if cache is not None:
+                config[CONF][CONFIG_KEY_CACHE] = cache
             # set up custom stream mode
             if "custom" in stream_modes:
                 config[CONF][CONFIG_KEY_STREAM_WRITER] = lambda c: stream.put(
@@ -1990,9 +2019,11 @@ class Pregel(PregelProtocol):
                 stream=StreamProtocol(stream.put, stream_modes),
                 config=config,
                 store=store,
+                cache=cache,
                 checkpointer=checkpointer,
                 nodes=self.nodes,
                 specs=self.channels,
+                trigger_to_nodes=self.trigger_to_nodes,
                 output_keys=output_keys,
                 stream_keys=self.stream_channels_asis,
                 interrupt_before=interrupt_before_,
@@ -2043,8 +2074,9 @@ class Pregel(PregelProtocol):
                 # channels are guaranteed to be immutable for the duration of the step,
                 # with channel updates applied only at the transition between steps.
                 while loop.tick(input_keys=self.input_channels):
+                    loop.match_cached_writes()
                     for _ in runner.tick(
-                        loop.tasks.values(),
+                        [t for t in loop.tasks.values() if not t.writes],
                         timeout=self.step_timeout,
                         retry_policy=self.retry_policy,
                         get_waiter=get_waiter,
@@ -2253,6 +2285,7 @@ class Pregel(PregelProtocol):
                 interrupt_after_,
                 checkpointer,
                 store,
+                cache,
             ) = self._defaults(
                 config,
                 stream_mode=stream_mode,
@@ -2270,12 +2303,13 @@ class Pregel(PregelProtocol):
                 run_manager.inheritable_handlers.append(
                     StreamMessagesHandler(stream_put)
                 )
+            # set up node cache, shared with subgraphs
+            if cache is not None:
+                config[CONF][CONFIG_KEY_CACHE] = cache
             # set up custom stream mode
             if "custom" in stream_modes:
-                config[CONF][CONFIG_KEY_STREAM_WRITER] = (
-                    lambda c: aioloop.call_soon_threadsafe(
-                        stream.put_nowait, ((), "custom", c)
-                    )
+                config[CONF][CONFIG_KEY_STREAM_WRITER] = lambda c: (
+                    aioloop.call_soon_threadsafe(stream.put_nowait, ((), "custom", c))
                 )
             async with AsyncPregelLoop(
                 input,
@@ -2283,9 +2317,11 @@ class Pregel(PregelProtocol):
                 stream=StreamProtocol(stream.put_nowait, stream_modes),
                 config=config,
                 store=store,
+                cache=cache,
                 checkpointer=checkpointer,
                 nodes=self.nodes,
                 specs=self.channels,
+                trigger_to_nodes=self.trigger_to_nodes,
                 output_keys=output_keys,
                 stream_keys=self.stream_channels_asis,
                 interrupt_before=interrupt_before_,
@@ -2327,8 +2363,9 @@ class Pregel(PregelProtocol):
                 # channels are guaranteed to be immutable for the duration of the step,
                 # with channel updates applied only at the transition between steps
                 while loop.tick(input_keys=self.input_channels):
+                    await loop.amatch_cached_writes()
                     async for _ in runner.atick(
-                        loop.tasks.values(),
+                        [t for t in loop.tasks.values() if not t.writes],
                         timeout=self.step_timeout,
                         retry_policy=self.retry_policy,
                         get_waiter=get_waiter,
@@ -2460,3 +2497,46 @@ class Pregel(PregelProtocol):
             return latest
         else:
             return chunks
+
+    def _cache_namespaces(
+        self, nodes: Optional[Sequence[str]]
+    ) -> list[tuple[str, ...]]:
+        """Cache namespaces of the given nodes, or of all nodes if None, in this
+        graph and in each of its subgraphs."""
+        graphs: list[tuple[str, PregelProtocol]] = [("", self)]
+        graphs.extend(self.get_subgraphs(recurse=True))
+        return [
+            (CACHE_NS_WRITES, ns, node)
+            for ns, graph in graphs
+            if isinstance(graph, Pregel)
+            for node in (nodes or graph.nodes)
+            if node in graph.nodes
+        ]
+
+    def clear_cache(self, nodes: Optional[Sequence[str]] = None) -> None:
+        """Clear the cache for the given nodes.
+
+        Entries of nodes with the same name in subgraphs are cleared too, for the
+        subgraphs found by `get_subgraphs`.
+
+        Args:
+            nodes: Optional. The nodes to clear the cache for. If None, clears the
+                cache for all nodes of the graph and its subgraphs.
+        """
+        if not self.cache:
+            raise ValueError("No cache is set for this graph. Cannot clear cache.")
+        self.cache.clear(self._cache_namespaces(nodes))
+
+    async def aclear_cache(self, nodes: Optional[Sequence[str]] = None) -> None:
+        """Asynchronously clear the cache for the given nodes.
+
+        Entries of nodes with the same name in subgraphs are cleared too, for the
+        subgraphs found by `get_subgraphs`.
+
+        Args:
+            nodes: Optional. The nodes to clear the cache for. If None, clears the
+                cache for all nodes of the graph and its subgraphs.
+        """
+        if not self.cache:
+            raise ValueError("No cache is set for this graph. Cannot clear cache.")
+        await self.cache.aclear(self._cache_namespaces(nodes))
@@ -24,6 +24,7 @@ from langchain_core.callbacks import Callbacks
 from langchain_core.callbacks.manager import AsyncParentRunManager, ParentRunManager
 from langchain_core.runnables.config import RunnableConfig
 
+from langgraph.cache.base import BaseCache
 from langgraph.channels.base import BaseChannel
 from langgraph.checkpoint.base import (
     BaseCheckpointSaver,
@@ -34,6 +35,7 @@ from langgraph.checkpoint.base import (
     copy_checkpoint,
 )
 from langgraph.constants import (
+    CACHE_NS_WRITES,
     CONF,
     CONFIG_KEY_CHECKPOINT_ID,
     CONFIG_KEY_CHECKPOINT_MAP,
@@ -72,13 +74,15 @@ from langgraph.pregel.read import PregelNode
 from langgraph.store.base import BaseStore
 from langgraph.types import (
     All,
+    CacheKey,
+    CachePolicy,
     LoopProtocol,
     PregelExecutableTask,
     PregelScratchpad,
     PregelTask,
     RetryPolicy,
 )
-from langgraph.utils.config import merge_configs, patch_config
+from langgraph.utils.config import merge_configs, patch_config, recast_checkpoint_ns
 
 GetNextVersion = Callable[[Optional[V], BaseChannel], V]
 SUPPORTS_EXC_NOTES = sys.version_info >= (3, 11)
@@ -233,10 +237,10 @@ def apply_writes(
     channels: Mapping[str, BaseChannel],
     tasks: Iterable[WritesProtocol],
     get_next_version: Optional[GetNextVersion],
-) -> dict[str, list[Any]]:
+) -> tuple[dict[str, list[Any]], set[str]]:
     """Apply writes from a set of tasks (usually the tasks from a Pregel step)
     to the checkpoint and channels, and return managed values writes to be applied
-    externally."""
+    externally, and the channels whose values changed."""
     # sort tasks on path, to ensure deterministic order for update application
     # any path parts after the 3rd are ignored for sorting
     # (we use them for eg. task ids which aren't good for sorting)
@@ -262,17 +266,20 @@ def apply_writes(
         max_version = None
 
     # Consume all channels that were read
+    changed_channels: set[str] = set()
     for chan in {
         chan
         for task in tasks
         for chan in task.triggers
         if chan not in RESERVED and chan in channels
     }:
-        if channels[chan].consume() and get_next_version is not None:
-            checkpoint["channel_versions"][chan] = get_next_version(
-                max_version,
-                channels[chan],
-            )
+        if channels[chan].consume():
+            changed_channels.add(chan)
+            if get_next_version is not None:
+                checkpoint["channel_versions"][chan] = get_next_version(
+                    max_version,
+                    channels[chan],
+                )
 
     # clear pending sends
     if checkpoint["pending_sends"] and bump_step:
@@ -302,25 +309,29 @@ def apply_writes(
     updated_channels: set[str] = set()
     for chan, vals in pending_writes_by_channel.items():
         if chan in channels:
-            if channels[chan].update(vals) and get_next_version is not None:
-                checkpoint["channel_versions"][chan] = get_next_version(
-                    max_version,
-                    channels[chan],
-                )
+            if channels[chan].update(vals):
+                changed_channels.add(chan)
+                if get_next_version is not None:
+                    checkpoint["channel_versions"][chan] = get_next_version(
+                        max_version,
+                        channels[chan],
+                    )
             updated_channels.add(chan)
 
     # Channels that weren't updated in this step are notified of a new step
     if bump_step:
         for chan in channels:
             if chan not in updated_channels:
-                if channels[chan].update([]) and get_next_version is not None:
-                    checkpoint["channel_versions"][chan] = get_next_version(
-                        max_version,
-                        channels[chan],
-                    )
+                if channels[chan].update([]):
+                    changed_channels.add(chan)
+                    if get_next_version is not None:
+                        checkpoint["channel_versions"][chan] = get_next_version(
+                            max_version,
+                            channels[chan],
+                        )
 
     # Return managed values writes to be applied externally
-    return pending_writes_by_managed
+    return pending_writes_by_managed, changed_channels
 
 
 @overload
@@ -337,6 +348,9 @@ def prepare_next_tasks(
     store: Literal[None] = None,
     checkpointer: Literal[None] = None,
     manager: Literal[None] = None,
+    cache: Literal[None] = None,
+    trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
+    updated_channels: Optional[set[str]] = None,
 ) -> dict[str, PregelTask]: ...
 
 
@@ -354,6 +368,9 @@ def prepare_next_tasks(
     store: Optional[BaseStore],
     checkpointer: Optional[BaseCheckpointSaver],
     manager: Union[None, ParentRunManager, AsyncParentRunManager],
+    cache: Optional[BaseCache] = None,
+    trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
+    updated_channels: Optional[set[str]] = None,
 ) -> dict[str, PregelExecutableTask]: ...
 
 
@@ -370,10 +387,17 @@ def prepare_next_tasks(
     store: Optional[BaseStore] = None,
     checkpointer: Optional[BaseCheckpointSaver] = None,
     manager: Union[None, ParentRunManager, AsyncParentRunManager] = None,
+    cache: Optional[BaseCache] = None,
+    trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
+    updated_channels: Optional[set[str]] = None,
 ) -> Union[dict[str, PregelTask], dict[str, PregelExecutableTask]]:
     """Prepare the set of tasks that will make up the next Pregel step.
     This is the union of all PUSH tasks (Sends) and PULL tasks (nodes triggered
-    by edges)."""
+    by edges).
+
+    If `trigger_to_nodes` and `updated_channels` (as returned by `apply_writes`
+    for the previous step) are passed, only the nodes subscribed to the updated
+    channels are checked for PULL tasks, rather than every node."""
     checkpoint_id_bytes = binascii.unhexlify(checkpoint["id"].replace("-", ""))
     null_version = checkpoint_null_version(checkpoint)
     tasks: list[Union[PregelTask, PregelExecutableTask]] = []
@@ -395,11 +419,23 @@ def prepare_next_tasks(
             store=store,
             checkpointer=checkpointer,
             manager=manager,
+            cache=cache,
         ):
             tasks.append(task)
     # Check if any processes should be run in next step
     # If so, prepare the values to be passed to them
-    for name in processes:
+    candidate_nodes: Iterable[str]
+    if trigger_to_nodes and updated_channels is not None:
+        triggered = {
+            name for chan in updated_channels for name in trigger_to_nodes.get(chan, ())
+        }
+        # keep the order of processes, for a deterministic order of tasks
+        candidate_nodes = (
+            [name for name in processes if name in triggered] if triggered else ()
+        )
+    else:
+        candidate_nodes = processes
+    for name in candidate_nodes:
         if task := prepare_single_task(
             (PULL, name),
             None,
@@ -416,6 +452,7 @@ def prepare_next_tasks(
             store=store,
             checkpointer=checkpointer,
             manager=manager,
+            cache=cache,
         ):
             tasks.append(task)
     return {t.id: t for t in tasks}
@@ -441,9 +478,11 @@ def prepare_single_task(
     store: Optional[BaseStore] = None,
     checkpointer: Optional[BaseCheckpointSaver] = None,
     manager: Union[None, ParentRunManager, AsyncParentRunManager] = None,
+    cache: Optional[BaseCache] = None,
 ) -> Union[None, PregelTask, PregelExecutableTask]:
     """Prepares a single task for the next Pregel step, given a task path, which
-    uniquely identifies a PUSH or PULL task within the graph."""
+    uniquely identifies a PUSH or PULL task within the graph. Cache keys are
+    only computed if a `cache` is passed."""
     configurable = config.get(CONF, {})
     parent_ns = configurable.get(CONFIG_KEY_CHECKPOINT_NS, "")
 
@@ -638,11 +677,19 @@ def prepare_single_task(
                     ),
                     triggers,
                     proc.retry_policy,
-                    None,
+                    proc.cache_policy,
                     task_id,
                     task_path[:3],
                     writers=proc.flat_writers,
                     subgraphs=proc.subgraphs,
+                    cache_key=(
+                        _cache_key(
+                            proc.cache_policy, parent_ns, packet.node, packet.arg
+                        )
+                        if proc.cache_policy and cache is not None
+                        else None
+                    ),
+                    executor=proc.executor,
                 )
         else:
             return PregelTask(task_id, packet.node, task_path[:3])
@@ -759,11 +806,17 @@ def prepare_single_task(
                         ),
                         triggers,
                         proc.retry_policy,
-                        None,
+                        proc.cache_policy,
                         task_id,
                         task_path[:3],
                         writers=proc.flat_writers,
                         subgraphs=proc.subgraphs,
+                        cache_key=(
+                            _cache_key(proc.cache_policy, parent_ns, name, val)
+                            if proc.cache_policy and cache is not None
+                            else None
+                        ),
+                        executor=proc.executor,
                     )
             else:
                 return PregelTask(task_id, name, task_path[:3])
@@ -886,6 +939,30 @@ def _proc_input(
     yield val
 
 
+def _cache_key(
+    policy: CachePolicy, parent_ns: str, name: str, input: Any
+) -> Optional[CacheKey]:
+    """Derive the cache key for a task from its node name and input.
+    Task IDs are stripped from the parent namespace, so that the same node
+    in the same (sub)graph shares cache entries across runs. Returns None,
+    ie. the task isn't cached, if the key function fails on the input."""
+    try:
+        key = policy.key_func(input)
+    except Exception:
+        logger.warning(
+            f"Not caching node {name}, as the cache key of its input can't be computed",
+            exc_info=True,
+        )
+        return None
+    return CacheKey(
+        (CACHE_NS_WRITES, recast_checkpoint_ns(parent_ns), name),
+        sha1(
+            key.encode() if isinstance(key, str) else key, usedforsecurity=False
+        ).hexdigest(),
+        policy.ttl,
+    )
+
+
 def _uuid5_str(namespace: bytes, *parts: str) -> str:
     """Generate a UUID from the SHA-1 hash of a namespace UUID and a name."""
 
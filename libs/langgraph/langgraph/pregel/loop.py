@@ -27,6 +27,7 @@ from langchain_core.runnables import RunnableConfig
 from pydantic import BaseModel
 from typing_extensions import ParamSpec, Self
 
+from langgraph.cache.base import BaseCache
 from langgraph.channels.base import BaseChannel
 from langgraph.checkpoint.base import (
     WRITES_IDX_MAP,
@@ -36,7 +37,6 @@ from langgraph.checkpoint.base import (
     CheckpointMetadata,
     CheckpointTuple,
     PendingWrite,
-    copy_checkpoint,
     create_checkpoint,
     empty_checkpoint,
 )
@@ -114,6 +114,7 @@ from langgraph.pregel.utils import get_new_channel_versions
 from langgraph.store.base import BaseStore
 from langgraph.types import (
     All,
+    CacheKey,
     Command,
     LoopProtocol,
     PregelExecutableTask,
@@ -145,7 +146,9 @@ class PregelLoop(LoopProtocol):
     input: Optional[Any]
     input_model: Optional[Type[BaseModel]]
     checkpointer: Optional[BaseCheckpointSaver]
+    cache: Optional[BaseCache[Sequence[tuple[str, Any]]]]
     nodes: Mapping[str, PregelNode]
+    trigger_to_nodes: Mapping[str, Sequence[str]]
     specs: Mapping[str, Union[BaseChannel, ManagedValueSpec]]
     output_keys: Union[str, Sequence[str]]
     stream_keys: Union[str, Sequence[str]]
@@ -188,6 +191,10 @@ class PregelLoop(LoopProtocol):
     ]
     tasks: dict[str, PregelExecutableTask]
     to_interrupt: list[PregelExecutableTask]
+    # channels updated in the last step, None if not known (eg. when resuming)
+    updated_channels: Optional[set[str]] = None
+    # channels updated since the last checkpoint, None to snapshot all of them
+    dirty_channels: Optional[set[str]] = None
     output: Union[None, dict[str, Any], Any] = None
 
     # public
@@ -202,12 +209,14 @@ class PregelLoop(LoopProtocol):
         checkpointer: Optional[BaseCheckpointSaver],
         nodes: Mapping[str, PregelNode],
         specs: Mapping[str, Union[BaseChannel, ManagedValueSpec]],
+        trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
         output_keys: Union[str, Sequence[str]],
         stream_keys: Union[str, Sequence[str]],
         interrupt_after: Union[All, Sequence[str]] = EMPTY_SEQ,
         interrupt_before: Union[All, Sequence[str]] = EMPTY_SEQ,
         manager: Union[None, AsyncParentRunManager, ParentRunManager] = None,
         input_model: Optional[Type[BaseModel]] = None,
+        cache: Optional[BaseCache[Sequence[tuple[str, Any]]]] = None,
         debug: bool = False,
     ) -> None:
         super().__init__(
@@ -220,7 +229,9 @@ class PregelLoop(LoopProtocol):
         self.input = input
         self.input_model = input_model
         self.checkpointer = checkpointer
+        self.cache = cache
         self.nodes = nodes
+        self.trigger_to_nodes = trigger_to_nodes or {}
         self.specs = specs
         self.output_keys = output_keys
         self.stream_keys = stream_keys
@@ -284,6 +295,20 @@ class PregelLoop(LoopProtocol):
         """Put writes for a task, to be read by the next tick."""
         if not writes:
             return
+        self._save_writes(task_id, writes)
+        # output writes
+        if hasattr(self, "tasks"):
+            self._output_writes(task_id, writes)
+            # save writes to the cache, if the task has a cache policy
+            if (
+                self.cache is not None
+                and (task := self.tasks.get(task_id))
+                and task.cache_key is not None
+                and not any(w[0] in (ERROR, INTERRUPT, RESUME) for w in writes)
+            ):
+                self._put_cached_writes(task.cache_key, writes)
+
+    def _save_writes(self, task_id: str, writes: Sequence[tuple[str, Any]]) -> None:
         # deduplicate writes to special channels, last write wins
         if all(w[0] in WRITES_IDX_MAP for w in writes):
             writes = list({w[0]: w for w in writes}.values())
@@ -335,9 +360,6 @@ class PregelLoop(LoopProtocol):
                     writes,
                     task_id,
                 )
-        # output writes
-        if hasattr(self, "tasks"):
-            self._output_writes(task_id, writes)
 
     def accept_push(
         self, task: PregelExecutableTask, write_idx: int, call: Optional[Call] = None
@@ -369,6 +391,7 @@ class PregelLoop(LoopProtocol):
                 store=self.store,
                 checkpointer=self.checkpointer,
                 manager=self.manager,
+                cache=self.cache,
             ),
         ):
             # don't start if we should interrupt *before* the new task
@@ -427,12 +450,13 @@ class PregelLoop(LoopProtocol):
                     ),
                 )
             # all tasks have finished
-            mv_writes = apply_writes(
+            mv_writes, self.updated_channels = apply_writes(
                 self.checkpoint,
                 self.channels,
                 self.tasks.values(),
                 self.checkpointer_get_next_version,
             )
+            self._mark_dirty(self.updated_channels)
             # apply writes to managed values
             for key, values in mv_writes.items():
                 self._update_mv(key, values)
@@ -493,6 +517,9 @@ class PregelLoop(LoopProtocol):
             manager=self.manager,
             store=self.store,
             checkpointer=self.checkpointer,
+            cache=self.cache,
+            trigger_to_nodes=self.trigger_to_nodes,
+            updated_channels=self.updated_channels,
         )
         self.to_interrupt = []
 
@@ -609,15 +636,17 @@ class PregelLoop(LoopProtocol):
             for tid, ws in writes.items():
                 self.put_writes(tid, ws)
         # apply NULL writes
+        null_updated_channels: set[str] = set()
         if null_writes := [
             w[1:] for w in self.checkpoint_pending_writes if w[0] == NULL_TASK_ID
         ]:
-            mv_writes = apply_writes(
+            mv_writes, null_updated_channels = apply_writes(
                 self.checkpoint,
                 self.channels,
                 [PregelTaskWrites((), INPUT, null_writes, [])],
                 self.checkpointer_get_next_version,
             )
+            self._mark_dirty(null_updated_channels)
             for key, values in mv_writes.items():
                 self._update_mv(key, values)
         # proceed past previous checkpoint
@@ -661,7 +690,7 @@ class PregelLoop(LoopProtocol):
                 manager=None,
             )
             # apply input writes
-            mv_writes = apply_writes(
+            mv_writes, updated_channels = apply_writes(
                 self.checkpoint,
                 self.channels,
                 [
@@ -671,6 +700,8 @@ class PregelLoop(LoopProtocol):
                 self.checkpointer_get_next_version,
             )
             assert not mv_writes, "Can't write to SharedValues in graph input"
+            self.updated_channels = updated_channels.union(null_updated_channels)
+            self._mark_dirty(updated_channels)
             # save input checkpoint
             self._put_checkpoint({"source": "input", "writes": dict(input_writes)})
             # set flag
@@ -709,8 +740,15 @@ class PregelLoop(LoopProtocol):
                     else self.stream_keys
                 ),
             )
-        # create new checkpoint
-        self.checkpoint = create_checkpoint(self.checkpoint, self.channels, self.step)
+        # create new checkpoint, only snapshotting the channels updated since the
+        # previous one, if it was created from the same channels
+        self.checkpoint = create_checkpoint(
+            self.checkpoint,
+            self.channels,
+            self.step,
+            updated_channels=self.dirty_channels,
+        )
+        self.dirty_channels = set()
         # bail if no checkpointer
         if self._checkpointer_put_after_previous is not None:
             self.checkpoint_metadata = metadata
@@ -744,7 +782,7 @@ class PregelLoop(LoopProtocol):
                 self._checkpointer_put_after_previous,
                 getattr(self, "_put_checkpoint_fut", None),
                 self.checkpoint_config,
-                copy_checkpoint(self.checkpoint),
+                _copy_checkpoint_shared_values(self.checkpoint),
                 self.checkpoint_metadata,
                 new_versions,
             )
@@ -758,9 +796,43 @@ class PregelLoop(LoopProtocol):
         # increment step
         self.step += 1
 
+    def _mark_dirty(self, channels: set[str]) -> None:
+        if self.dirty_channels is not None:
+            self.dirty_channels.update(channels)
+
     def _update_mv(self, key: str, values: Sequence[Any]) -> None:
         raise NotImplementedError
 
+    def _put_cached_writes(
+        self, key: CacheKey, writes: Sequence[tuple[str, Any]]
+    ) -> None:
+        raise NotImplementedError
+
+    def _cache_lookup(self) -> list[PregelExecutableTask]:
+        """Return the tasks of the current step that could be served from the cache."""
+        if self.cache is None:
+            return []
+        return [
+            t for t in self.tasks.values() if t.cache_key is not None and not t.writes
+        ]
+
+    def _apply_cached_writes(
+        self,
+        tasks: Sequence[PregelExecutableTask],
+        cached: Mapping[tuple[tuple[str, ...], str], Sequence[Any]],
+    ) -> list[PregelExecutableTask]:
+        hits: list[PregelExecutableTask] = []
+        for task in tasks:
+            key = cast(CacheKey, task.cache_key)
+            if (writes := cached.get((key.ns, key.key))) is None:
+                continue
+            task.writes.extend((w[0], w[1]) for w in writes)
+            # persist as pending writes, so the step can resume without re-running
+            self._save_writes(task.id, task.writes)
+            self._output_writes(task.id, task.writes, cached=True)
+            hits.append(task)
+        return hits
+
     def _suppress_interrupt(
         self,
         exc_type: Optional[Type[BaseException]],
@@ -776,7 +848,7 @@ class PregelLoop(LoopProtocol):
                 and self.checkpoint_pending_writes
                 and any(task.writes for task in self.tasks.values())
             ):
-                mv_writes = apply_writes(
+                mv_writes, _ = apply_writes(
                     self.checkpoint,
                     self.channels,
                     self.tasks.values(),
@@ -876,12 +948,14 @@ class SyncPregelLoop(PregelLoop, ContextManager):
         checkpointer: Optional[BaseCheckpointSaver],
         nodes: Mapping[str, PregelNode],
         specs: Mapping[str, Union[BaseChannel, ManagedValueSpec]],
+        trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
         manager: Union[None, AsyncParentRunManager, ParentRunManager] = None,
         interrupt_after: Union[All, Sequence[str]] = EMPTY_SEQ,
         interrupt_before: Union[All, Sequence[str]] = EMPTY_SEQ,
         output_keys: Union[str, Sequence[str]] = EMPTY_SEQ,
         stream_keys: Union[str, Sequence[str]] = EMPTY_SEQ,
         input_model: Optional[Type[BaseModel]] = None,
+        cache: Optional[BaseCache[Sequence[tuple[str, Any]]]] = None,
         debug: bool = False,
     ) -> None:
         super().__init__(
@@ -891,8 +965,10 @@ class SyncPregelLoop(PregelLoop, ContextManager):
             config=config,
             checkpointer=checkpointer,
             store=store,
+            cache=cache,
             nodes=nodes,
             specs=specs,
+            trigger_to_nodes=trigger_to_nodes,
             output_keys=output_keys,
             stream_keys=stream_keys,
             interrupt_after=interrupt_after,
@@ -937,6 +1013,24 @@ class SyncPregelLoop(PregelLoop, ContextManager):
 
         return self.submit(cast(WritableManagedValue, managed_value).update, values)
 
+    def match_cached_writes(self) -> list[PregelExecutableTask]:
+        """Apply cached writes to tasks of the current step, returning the tasks
+        that were served from the cache and don't need to be executed."""
+        if not (tasks := self._cache_lookup()):
+            return []
+        cached = cast(BaseCache, self.cache).get(
+            [(t.cache_key.ns, t.cache_key.key) for t in tasks if t.cache_key]
+        )
+        return self._apply_cached_writes(tasks, cached)
+
+    def _put_cached_writes(
+        self, key: CacheKey, writes: Sequence[tuple[str, Any]]
+    ) -> None:
+        self.submit(
+            cast(BaseCache, self.cache).set,
+            {(key.ns, key.key): (list(writes), key.ttl)},
+        )
+
     # context manager
 
     def __enter__(self) -> Self:
@@ -992,7 +1086,16 @@ class SyncPregelLoop(PregelLoop, ContextManager):
         self.status = "pending"
         self.step = self.checkpoint_metadata["step"] + 1
         self.stop = self.step + self.config["recursion_limit"] + 1
-        self.checkpoint_previous_versions = self.checkpoint["channel_versions"].copy()
+        if saved.config[CONF].get(CONFIG_KEY_CHECKPOINT_NS, "") == self.config[
+            CONF
+        ].get(CONFIG_KEY_CHECKPOINT_NS, ""):
+            self.checkpoint_previous_versions = self.checkpoint[
+                "channel_versions"
+            ].copy()
+        else:
+            # loaded from another namespace, eg. for repeated calls to a subgraph,
+            # so none of the channel values are saved in this one yet
+            self.checkpoint_previous_versions = {}
 
         return self
 
@@ -1017,12 +1120,14 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
         checkpointer: Optional[BaseCheckpointSaver],
         nodes: Mapping[str, PregelNode],
         specs: Mapping[str, Union[BaseChannel, ManagedValueSpec]],
+        trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
         interrupt_after: Union[All, Sequence[str]] = EMPTY_SEQ,
         interrupt_before: Union[All, Sequence[str]] = EMPTY_SEQ,
         manager: Union[None, AsyncParentRunManager, ParentRunManager] = None,
         output_keys: Union[str, Sequence[str]] = EMPTY_SEQ,
         stream_keys: Union[str, Sequence[str]] = EMPTY_SEQ,
         input_model: Optional[Type[BaseModel]] = None,
+        cache: Optional[BaseCache[Sequence[tuple[str, Any]]]] = None,
         debug: bool = False,
     ) -> None:
         super().__init__(
@@ -1032,8 +1137,10 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
             config=config,
             checkpointer=checkpointer,
             store=store,
+            cache=cache,
             nodes=nodes,
             specs=specs,
+            trigger_to_nodes=trigger_to_nodes,
             output_keys=output_keys,
             stream_keys=stream_keys,
             interrupt_after=interrupt_after,
@@ -1078,6 +1185,24 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
 
         return self.submit(cast(WritableManagedValue, managed_value).aupdate, values)
 
+    async def amatch_cached_writes(self) -> list[PregelExecutableTask]:
+        """Apply cached writes to tasks of the current step, returning the tasks
+        that were served from the cache and don't need to be executed."""
+        if not (tasks := self._cache_lookup()):
+            return []
+        cached = await cast(BaseCache, self.cache).aget(
+            [(t.cache_key.ns, t.cache_key.key) for t in tasks if t.cache_key]
+        )
+        return self._apply_cached_writes(tasks, cached)
+
+    def _put_cached_writes(
+        self, key: CacheKey, writes: Sequence[tuple[str, Any]]
+    ) -> None:
+        self.submit(
+            cast(BaseCache, self.cache).aset,
+            {(key.ns, key.key): (list(writes), key.ttl)},
+        )
+
     # context manager
 
     async def __aenter__(self) -> Self:
@@ -1136,7 +1261,16 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
         self.step = self.checkpoint_metadata["step"] + 1
         self.stop = self.step + self.config["recursion_limit"] + 1
 
-        self.checkpoint_previous_versions = self.checkpoint["channel_versions"].copy()
+        if saved.config[CONF].get(CONFIG_KEY_CHECKPOINT_NS, "") == self.config[
+            CONF
+        ].get(CONFIG_KEY_CHECKPOINT_NS, ""):
+            self.checkpoint_previous_versions = self.checkpoint[
+                "channel_versions"
+            ].copy()
+        else:
+            # loaded from another namespace, eg. for repeated calls to a subgraph,
+            # so none of the channel values are saved in this one yet
+            self.checkpoint_previous_versions = {}
 
         return self
 
@@ -1157,3 +1291,17 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
             # consumer to await it before e.g., reusing the DB connection.
             e.args = (*e.args, exit_task)
             raise
+
+
+def _copy_checkpoint_shared_values(checkpoint: Checkpoint) -> Checkpoint:
+    """Like `copy_checkpoint`, but sharing channel_values, which create_checkpoint
+    replaces on each step rather than modifying in place."""
+    return Checkpoint(
+        v=checkpoint["v"],
+        ts=checkpoint["ts"],
+        id=checkpoint["id"],
+        channel_values=checkpoint["channel_values"],
+        channel_versions=checkpoint["channel_versions"].copy(),
+        versions_seen={k: v.copy() for k, v in checkpoint["versions_seen"].items()},
+        pending_sends=checkpoint.get("pending_sends", []).copy(),
+    )
@@ -0,0 +1,224 @@
+"""Run nodes added with `executor="process"` in a pool of worker processes."""
+
+import asyncio
+import concurrent.futures
+import os
+import pickle
+import threading
+import time
+from functools import partial
+from typing import Any, Callable, Optional, Sequence
+
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.constants import CONF
+from langgraph.utils.runnable import RunnableCallable
+
+# config keys sent to worker processes along with the input of a node
+CONFIG_KEYS = ("tags", "metadata", "run_name", "recursion_limit")
+
+# set in each worker process by _init_worker
+_worker_serde: Optional[SerializerProtocol] = None
+_worker_nodes: dict[bytes, Runnable] = {}
+
+
+class ProcessPool:
+    """A pool of worker processes running the sync and async invocations of nodes
+    added with `executor="process"`, so that CPU-bound nodes aren't serialized
+    on the GIL of the process running the graph.
+
+    The node itself is pickled, so it must be defined at the top level of a
+    module. Its input and output are sent with `serde`, the checkpoint serializer
+    by default, along with a copy of the config without any of the internal keys,
+    so nodes run in a worker can't access the store or stream custom output.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        *,
+        serde: Optional[SerializerProtocol] = None,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Sequence[Any] = (),
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.serde = serde or JsonPlusSerializer()
+        self.initializer = initializer
+        self.initargs = tuple(initargs)
+        self.executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self.lock = threading.Lock()
+        self.warm_up_seconds = 0.0
+        self.tasks = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.serde_seconds = 0.0
+        self.run_seconds = 0.0
+
+    def _get_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        with self.lock:
+            if self.executor is None:
+                self.executor = concurrent.futures.ProcessPoolExecutor(
+                    self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(self.serde, self.initializer, self.initargs),
+                )
+            return self.executor
+
+    def warm_up(self) -> None:
+        """Start all worker processes and run the initializer in each of them,
+        so the first nodes sent to the pool don't pay for it."""
+        start = time.perf_counter()
+        executor = self._get_executor()
+        for fut in [executor.submit(_warm_up) for _ in range(self.max_workers)]:
+            fut.result()
+        with self.lock:
+            self.warm_up_seconds += time.perf_counter() - start
+
+    def run(self, node: bytes, input: Any, config: RunnableConfig) -> Any:
+        """Run a pickled node in a worker process, returning its output."""
+        return self._receive(self._send(node, input, config).result())
+
+    async def arun(self, node: bytes, input: Any, config: RunnableConfig) -> Any:
+        """Run a pickled node in a worker process, returning its output."""
+        return self._receive(await asyncio.wrap_future(self._send(node, input, config)))
+
+    def metrics(self) -> dict[str, Any]:
+        """Return the number of tasks run in the pool, the bytes sent to and
+        received from workers, and the seconds spent starting workers, running
+        nodes, and serializing their inputs and outputs on either side."""
+        with self.lock:
+            return {
+                "workers": self.max_workers,
+                "warm_up_seconds": self.warm_up_seconds,
+                "tasks": self.tasks,
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+                "serde_seconds": self.serde_seconds,
+                "run_seconds": self.run_seconds,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes. They're started again if the pool is used."""
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _send(
+        self, node: bytes, input: Any, config: RunnableConfig
+    ) -> concurrent.futures.Future:
+        start = time.perf_counter()
+        payload = self.serde.dumps_typed((input, _worker_config(config)))
+        duration = time.perf_counter() - start
+        with self.lock:
+            self.tasks += 1
+            self.bytes_sent += len(node) + len(payload[1])
+            self.serde_seconds += duration
+        return self._get_executor().submit(_run_in_worker, node, payload)
+
+    def _receive(self, result: tuple[tuple[str, bytes], float, float]) -> Any:
+        output, serde_seconds, run_seconds = result
+        start = time.perf_counter()
+        value = self.serde.loads_typed(output)
+        duration = time.perf_counter() - start
+        with self.lock:
+            self.bytes_received += len(output[1])
+            self.serde_seconds += serde_seconds + duration
+            self.run_seconds += run_seconds
+        return value
+
+
+_pool: Optional[ProcessPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPool:
+    """Get the process pool used by nodes added with `executor="process"`,
+    creating one with a worker per CPU if none was set."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPool()
+        return _pool
+
+
+def set_process_pool(pool: ProcessPool) -> None:
+    """Set the process pool used by nodes added with `executor="process"`,
+    shutting down the previous one."""
+    global _pool
+    with _pool_lock:
+        previous, _pool = _pool, pool
+    if previous is not None and previous is not pool:
+        previous.shutdown(wait=False)
+
+
+def process_runnable(bound: Runnable) -> Runnable:
+    """Wrap a node so that it's invoked in a worker process of the pool."""
+    try:
+        node = pickle.dumps(bound)
+    except Exception as exc:
+        raise ValueError(
+            f"Node '{bound.get_name()}' must be picklable to run with "
+            'executor="process", eg. a function defined at the top level of a module'
+        ) from exc
+    return RunnableCallable(
+        partial(_run, node), partial(_arun, node), name=bound.get_name()
+    )
+
+
+def _run(node: bytes, input: Any, config: RunnableConfig) -> Any:
+    return get_process_pool().run(node, input, config)
+
+
+async def _arun(node: bytes, input: Any, config: RunnableConfig) -> Any:
+    return await get_process_pool().arun(node, input, config)
+
+
+def _worker_config(config: RunnableConfig) -> RunnableConfig:
+    worker_config: RunnableConfig = {
+        k: config[k]  # type: ignore[literal-required]
+        for k in CONFIG_KEYS
+        if k in config
+    }
+    if configurable := config.get(CONF):
+        # internal keys hold callables and channels only valid in this process
+        worker_config[CONF] = {
+            k: v for k, v in configurable.items() if not k.startswith("__")
+        }
+    return worker_config
+
+
+def _init_worker(
+    serde: SerializerProtocol,
+    initializer: Optional[Callable[..., None]],
+    initargs: tuple[Any, ...],
+) -> None:
+    global _worker_serde
+    _worker_serde = serde
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _warm_up() -> None:
+    pass
+
+
+def _run_in_worker(
+    node: bytes, payload: tuple[str, bytes]
+) -> tuple[tuple[str, bytes], float, float]:
+    assert _worker_serde is not None
+    start = time.perf_counter()
+    if (bound := _worker_nodes.get(node)) is None:
+        bound = _worker_nodes[node] = pickle.loads(node)
+    input, config = _worker_serde.loads_typed(payload)
+    loaded = time.perf_counter()
+    if isinstance(bound, RunnableCallable) and bound.func is None:
+        # async def nodes have no sync function, run them in an event loop here
+        output = asyncio.run(bound.ainvoke(input, config))
+    else:
+        output = bound.invoke(input, config)
+    ran = time.perf_counter()
+    result = _worker_serde.dumps_typed(output)
+    return result, (loaded - start) + (time.perf_counter() - ran), ran - loaded
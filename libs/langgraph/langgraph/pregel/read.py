@@ -22,10 +22,12 @@ from langchain_core.runnables.base import Input, Other, coerce_to_runnable
 from langchain_core.runnables.utils import ConfigurableFieldSpec
 
 from langgraph.constants import CONF, CONFIG_KEY_READ
+from langgraph.pregel.process import process_runnable
 from langgraph.pregel.protocol import PregelProtocol
 from langgraph.pregel.retry import RetryPolicy
 from langgraph.pregel.utils import find_subgraph_pregel
 from langgraph.pregel.write import ChannelWrite
+from langgraph.types import CachePolicy, NodeExecutor
 from langgraph.utils.config import merge_configs
 from langgraph.utils.runnable import RunnableCallable, RunnableSeq
 
@@ -141,6 +143,12 @@ class PregelNode(Runnable):
     retry_policy: Optional[RetryPolicy]
     """The retry policy to use when invoking the node."""
 
+    cache_policy: Optional[CachePolicy]
+    """The cache policy to use when invoking the node."""
+
+    executor: Optional[NodeExecutor]
+    """Where to run the node's tasks, see `NodeExecutor`."""
+
     tags: Optional[Sequence[str]]
     """Tags to attach to the node for tracing."""
 
@@ -161,6 +169,8 @@ class PregelNode(Runnable):
         metadata: Optional[Mapping[str, Any]] = None,
         bound: Optional[Runnable[Any, Any]] = None,
         retry_policy: Optional[RetryPolicy] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        executor: Optional[NodeExecutor] = None,
     ) -> None:
         self.channels = channels
         self.triggers = list(triggers)
@@ -168,6 +178,8 @@ class PregelNode(Runnable):
         self.writers = writers or []
         self.bound = bound if bound is not None else DEFAULT_BOUND
         self.retry_policy = retry_policy
+        self.cache_policy = cache_policy
+        self.executor = executor
         self.tags = tags
         self.metadata = metadata
         if self.bound is not DEFAULT_BOUND:
@@ -215,10 +227,14 @@ class PregelNode(Runnable):
             return writers[0]
         elif self.bound is DEFAULT_BOUND:
             return RunnableSeq(*writers)
-        elif writers:
-            return RunnableSeq(self.bound, *writers)
+        # writers run in this process, on the output sent back by the worker
+        bound = (
+            process_runnable(self.bound) if self.executor == "process" else self.bound
+        )
+        if writers:
+            return RunnableSeq(bound, *writers)
         else:
-            return self.bound
+            return bound
 
     def join(self, channels: Sequence[str]) -> PregelNode:
         assert isinstance(channels, list) or isinstance(
@@ -404,7 +404,8 @@ class RemoteGraph(PregelProtocol):
                 `configurable` field.
             filter: Metadata to filter on.
             before: A `RunnableConfig` that includes checkpoint metadata.
-            limit: Max number of states to return.
+            limit: Max number of states to return. If None, the whole history is
+                returned, fetched in pages as it's consumed.
 
         Returns:
             States of the thread.
@@ -412,14 +413,13 @@ class RemoteGraph(PregelProtocol):
         sync_client = self._validate_sync_client()
         merged_config = merge_configs(self.config, config)
 
-        states = sync_client.threads.get_history(
+        for state in sync_client.threads.iter_history(
             thread_id=merged_config["configurable"]["thread_id"],
-            limit=limit if limit else 10,
+            limit=limit,
             before=self._get_checkpoint(before),
             metadata=filter,
             checkpoint=self._get_checkpoint(merged_config),
-        )
-        for state in states:
+        ):
             yield self._create_state_snapshot(state)
 
     async def aget_state_history(
@@ -439,7 +439,8 @@ class RemoteGraph(PregelProtocol):
                 `configurable` field.
             filter: Metadata to filter on.
             before: A `RunnableConfig` that includes checkpoint metadata.
-            limit: Max number of states to return.
+            limit: Max number of states to return. If None, the whole history is
+                returned, fetched in pages as it's consumed.
 
         Returns:
             States of the thread.
@@ -447,14 +448,13 @@ class RemoteGraph(PregelProtocol):
         client = self._validate_client()
         merged_config = merge_configs(self.config, config)
 
-        states = await client.threads.get_history(
+        async for state in client.threads.iter_history(
             thread_id=merged_config["configurable"]["thread_id"],
-            limit=limit if limit else 10,
+            limit=limit,
             before=self._get_checkpoint(before),
             metadata=filter,
             checkpoint=self._get_checkpoint(merged_config),
-        )
-        for state in states:
+        ):
             yield self._create_state_snapshot(state)
 
     def update_state(
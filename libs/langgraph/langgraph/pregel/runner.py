@@ -3,6 +3,7 @@ import concurrent.futures
 import threading
 import time
 import weakref
+from contextvars import copy_context
 from functools import partial
 from typing import (
     Any,
@@ -44,6 +45,9 @@ from langgraph.utils.future import chain_future
 F = TypeVar("F", concurrent.futures.Future, asyncio.Future)
 E = TypeVar("E", threading.Event, asyncio.Event)
 
+# nodes without an executor are run inline when their runs average less than this
+INLINE_MAX_DURATION = 0.0005
+
 
 class FuturesDict(Generic[F, E], dict[F, Optional[PregelExecutableTask]]):
     event: E
@@ -121,6 +125,8 @@ class PregelRunner:
         self.use_astream = use_astream
         self.node_finished = node_finished
         self.schedule_task = schedule_task
+        # moving average of the duration of sync runs of each node
+        self.durations: dict[str, float] = {}
 
     def tick(
         self,
@@ -139,11 +145,15 @@ class PregelRunner:
         )
         # give control back to the caller
         yield
+        # nothing to run, eg. all tasks were served from the cache
+        if not tasks:
+            return
         # fast path if single task with no timeout and no waiter
         if len(tasks) == 1 and timeout is None and get_waiter is None:
             t = tasks[0]
             try:
-                run_with_retry(
+                _run_timed(
+                    self.durations,
                     t,
                     retry_policy,
                     configurable={
@@ -175,11 +185,21 @@ class PregelRunner:
         # add waiter task if requested
         if get_waiter is not None:
             futures[get_waiter()] = None
-        # schedule tasks
+        # schedule tasks, keeping cheap ones to run on this thread
+        inline: list[PregelExecutableTask] = []
+        # nodes without an executor are only inlined if the whole step is cheap,
+        # so that they still finish in the order they were scheduled
+        inline_all = timeout is None and all(
+            self._should_inline(t) for t in tasks if not t.writes
+        )
         for t in tasks:
             if not t.writes:
+                if timeout is None and (t.executor == "inline" or inline_all):
+                    inline.append(t)
+                    continue
                 fut = self.submit()(  # type: ignore[misc]
-                    run_with_retry,
+                    _run_timed,
+                    self.durations,
                     t,
                     retry_policy,
                     configurable={
@@ -196,6 +216,53 @@ class PregelRunner:
                     __reraise_on_exit__=reraise,
                 )
                 futures[fut] = t
+        # run inline tasks one after the other, while the others run in the pool
+        for t in inline:
+            try:
+                copy_context().run(
+                    _run_timed,
+                    self.durations,
+                    t,
+                    retry_policy,
+                    configurable={
+                        CONFIG_KEY_CALL: partial(
+                            _call,
+                            t,
+                            retry=retry_policy,
+                            futures=weakref.ref(futures),
+                            schedule_task=self.schedule_task,
+                            submit=self.submit,
+                            reraise=reraise,
+                        ),
+                    },
+                )
+                self.commit(t, None)
+            except Exception as exc:
+                try:
+                    self.commit(t, exc)
+                except GraphBubbleUp:
+                    # eg. a ParentCommand, handled like those of tasks in the pool,
+                    # ie. once the other tasks are done
+                    pass
+                if reraise:
+                    # will be re-raised after futures are done
+                    fut = concurrent.futures.Future()
+                    fut.set_exception(exc)
+                    futures.done.add(fut)
+                    if _should_stop_others({fut}):
+                        break
+            # give control back to the caller
+            yield
+        if inline and (
+            _should_stop_others(futures.done)
+            or not any(t is not None for t in futures.values())
+        ):
+            # an inline task failed, or all tasks ran inline
+            _panic_or_proceed(
+                futures.done.union(f for f, t in futures.items() if t is not None),
+                panic=reraise,
+            )
+            return
         # execute tasks, and wait for one to fail or all to finish.
         # each task is independent from all other concurrent tasks
         # yield updates/debug output as each task finishes
@@ -252,6 +319,9 @@ class PregelRunner:
         )
         # give control back to the caller
         yield
+        # nothing to run, eg. all tasks were served from the cache
+        if not tasks:
+            return
         # fast path if single task with no waiter and no timeout
         if len(tasks) == 1 and get_waiter is None and timeout is None:
             t = tasks[0]
@@ -363,6 +433,14 @@ class PregelRunner:
             panic=reraise,
         )
 
+    def _should_inline(self, task: PregelExecutableTask) -> bool:
+        """Whether to run a sync task on the thread driving the graph, rather
+        than handing it off to the thread pool."""
+        if task.executor is not None:
+            return task.executor == "inline"
+        duration = self.durations.get(task.name)
+        return duration is not None and duration < INLINE_MAX_DURATION
+
     def commit(
         self,
         task: PregelExecutableTask,
@@ -398,6 +476,22 @@ class PregelRunner:
             self.put_writes()(task.id, task.writes)  # type: ignore[misc]
 
 
+def _run_timed(
+    durations: dict[str, float],
+    task: PregelExecutableTask,
+    retry_policy: Optional[RetryPolicy],
+    configurable: Optional[dict[str, Any]] = None,
+) -> None:
+    """Run a sync task, recording its duration in a moving average per node."""
+    start = time.perf_counter()
+    try:
+        run_with_retry(task, retry_policy, configurable)
+    finally:
+        duration = time.perf_counter() - start
+        prev = durations.get(task.name)
+        durations[task.name] = duration if prev is None else (prev + duration) / 2
+
+
 def _should_stop_others(
     done: set[F],
 ) -> bool:
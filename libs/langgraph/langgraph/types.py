@@ -1,4 +1,5 @@
 import dataclasses
+import pickle
 import sys
 from collections import deque
 from typing import (
@@ -63,6 +64,20 @@ StreamWriter = Callable[[Any], None]
 Always injected into nodes if requested as a keyword argument, but it's a no-op
 when not using stream_mode="custom"."""
 
+NodeExecutor = Literal["inline", "thread", "process"]
+"""Where the tasks of a node are run.
+
+- `"inline"`: Run sync tasks on the thread driving the graph, one after the other,
+    saving the cost of handing off to the thread pool. Suited to cheap, non-blocking nodes.
+- `"thread"`: Run sync tasks in the thread pool, concurrently with other tasks.
+- `"process"`: Run sync and async tasks in a worker process, see
+    `langgraph.pregel.process.ProcessPool`. Suited to CPU-bound nodes, which
+    would otherwise hold the GIL of the process running the graph.
+
+Nodes without an executor are run inline once their runs in the current
+invocation have been measured to be cheap, and in the thread pool otherwise.
+"""
+
 if sys.version_info >= (3, 10):
     _DC_KWARGS = {"kw_only": True, "slots": True, "frozen": True}
 else:
@@ -119,10 +134,47 @@ class RetryPolicy(NamedTuple):
     """List of exception classes that should trigger a retry, or a callable that returns True for exceptions that should trigger a retry."""
 
 
+def _freeze(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return tuple(
+            sorted(
+                ((k, _freeze(v)) for k, v in obj.items()),
+                key=lambda kv: repr(kv[0]),
+            )
+        )
+    elif isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    elif isinstance(obj, (set, frozenset)):
+        return tuple(sorted((_freeze(v) for v in obj), key=repr))
+    return obj
+
+
+def default_cache_key(input: Any) -> bytes:
+    """Default cache key function, pickles the node input.
+
+    Dicts and sets are ordered first so that equal inputs produce equal keys."""
+    return pickle.dumps(_freeze(input), protocol=5, fix_imports=False)
+
+
 class CachePolicy(NamedTuple):
     """Configuration for caching nodes."""
 
-    pass
+    key_func: Callable[[Any], Union[str, bytes]] = default_cache_key
+    """Function to derive the cache key from the node input. Called with the
+    node input, should return a str or bytes. Defaults to pickling the input."""
+    ttl: Optional[int] = None
+    """Time to live for the cache entry, in seconds. If None, the entry never expires."""
+
+
+class CacheKey(NamedTuple):
+    """Cache key for the writes of a task."""
+
+    ns: tuple[str, ...]
+    """Namespace of the cache entry, derived from the node name."""
+    key: str
+    """Key of the cache entry, derived from the node input."""
+    ttl: Optional[int]
+    """Time to live for the cache entry, in seconds."""
 
 
 @dataclasses.dataclass(**_DC_KWARGS)
@@ -157,6 +209,8 @@ class PregelExecutableTask(NamedTuple):
     scheduled: bool = False
     writers: Sequence[Runnable] = ()
     subgraphs: Sequence["PregelProtocol"] = ()
+    cache_key: Optional[CacheKey] = None
+    executor: Optional[NodeExecutor] = None
 
 
 class StateSnapshot(NamedTuple):
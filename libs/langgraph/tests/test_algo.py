@@ -1,6 +1,14 @@
+from langgraph.channels.last_value import LastValue
 from langgraph.checkpoint.base import empty_checkpoint
 from langgraph.constants import PULL, PUSH
-from langgraph.pregel.algo import prepare_next_tasks, task_path_str
+from langgraph.pregel import Channel, Pregel
+from langgraph.pregel.algo import (
+    PregelTaskWrites,
+    apply_writes,
+    increment,
+    prepare_next_tasks,
+    task_path_str,
+)
 from langgraph.pregel.manager import ChannelsManager
 
 
@@ -43,6 +51,73 @@ def test_prepare_next_tasks() -> None:
         # TODO: add more tests
 
 
+def test_prepare_next_tasks_trigger_to_nodes() -> None:
+    config = {}
+    app = Pregel(
+        nodes={
+            "one": Channel.subscribe_to("a") | Channel.write_to("b"),
+            "two": Channel.subscribe_to("b") | Channel.write_to("c"),
+            "three": Channel.subscribe_to("b") | Channel.write_to("c"),
+            "four": Channel.subscribe_to("c") | Channel.write_to("a"),
+        },
+        channels={"a": LastValue(int), "b": LastValue(int), "c": LastValue(int)},
+        input_channels="a",
+        output_channels="c",
+    )
+    assert app.trigger_to_nodes == {"a": ["one"], "b": ["two", "three"], "c": ["four"]}
+    checkpoint = empty_checkpoint()
+
+    with ChannelsManager(app.channels, checkpoint, config) as (channels, managed):
+        _, updated_channels = apply_writes(
+            checkpoint,
+            channels,
+            [PregelTaskWrites((), "__input__", [("a", 1), ("b", 2)], [])],
+            increment,
+        )
+        assert updated_channels == {"a", "b"}
+
+        tasks = prepare_next_tasks(
+            checkpoint,
+            [],
+            app.nodes,
+            channels,
+            managed,
+            config,
+            0,
+            for_execution=False,
+        )
+        assert [t.name for t in tasks.values()] == ["one", "two", "three"]
+        # only the nodes subscribed to the updated channels are checked
+        tasks = prepare_next_tasks(
+            checkpoint,
+            [],
+            app.nodes,
+            channels,
+            managed,
+            config,
+            0,
+            for_execution=False,
+            trigger_to_nodes=app.trigger_to_nodes,
+            updated_channels={"b"},
+        )
+        assert [t.name for t in tasks.values()] == ["two", "three"]
+        assert (
+            prepare_next_tasks(
+                checkpoint,
+                [],
+                app.nodes,
+                channels,
+                managed,
+                config,
+                0,
+                for_execution=False,
+                trigger_to_nodes=app.trigger_to_nodes,
+                updated_channels=set(),
+            )
+            == {}
+        )
+
+
 def test_tuple_str() -> None:
     push_path_a = (PUSH, 2)
     pull_path_a = (PULL, "abc")
@@ -15,6 +15,7 @@ from pydantic import BaseModel
 from pydantic.v1 import BaseModel as BaseModelV1
 from typing_extensions import TypedDict
 
+from langgraph.channels.messages import MessagesAggregate
 from langgraph.graph import add_messages
 from langgraph.graph.message import MessagesState
 from langgraph.graph.state import END, START, StateGraph
@@ -175,6 +176,61 @@ def test_delete_all():
     assert result == expected_result
 
 
+def test_messages_aggregate_matches_add_messages():
+    updates = [
+        [("user", "Hello")],
+        [AIMessage(content="Hi there!", id="2"), HumanMessage(content="Yo", id="3")],
+        HumanMessage(content="Hello again", id="2"),
+        [RemoveMessage(id="3"), AIMessage(content="Re-added", id="3")],
+        [RemoveMessage(id="2")],
+        [],
+    ]
+
+    channel = MessagesAggregate(list, add_messages).from_checkpoint(
+        [HumanMessage(content="Start", id="1")]
+    )
+    expected = [HumanMessage(content="Start", id="1")]
+    for update in updates:
+        before = channel.get()
+        channel.update([update])
+        expected = add_messages(expected, update)
+        # ids of tuple messages are random, so compare contents
+        assert [(m.type, m.content) for m in channel.get()] == [
+            (m.type, m.content) for m in expected
+        ]
+        # values handed out previously are not mutated
+        assert before is not channel.get()
+
+    # multiple updates in a step are applied in order
+    channel.update([[("user", "a")], [("user", "b")]])
+    assert [m.content for m in channel.get()[-2:]] == ["a", "b"]
+
+    # restoring from a checkpoint rebuilds the index
+    restored = MessagesAggregate(list, add_messages).from_checkpoint(
+        channel.checkpoint()
+    )
+    restored.update([[HumanMessage(content="Start again", id="1")]])
+    assert restored.get()[0].content == "Start again"
+    assert len(restored.get()) == len(channel.get())
+
+
+def test_messages_aggregate_remove_nonexistent_message():
+    channel = MessagesAggregate(list, add_messages).from_checkpoint(
+        [HumanMessage(content="Hello", id="1")]
+    )
+    with pytest.raises(
+        ValueError, match="Attempting to delete a message with an ID that doesn't exist"
+    ):
+        channel.update([[AIMessage(content="Hi", id="2"), RemoveMessage(id="3")]])
+    # failed updates leave the channel untouched
+    assert channel.get() == [HumanMessage(content="Hello", id="1")]
+    channel.update([[AIMessage(content="Hi", id="2")]])
+    assert channel.get() == [
+        HumanMessage(content="Hello", id="1"),
+        AIMessage(content="Hi", id="2"),
+    ]
+
+
 MESSAGES_STATE_SCHEMAS = [MessagesState]
 if IS_LANGCHAIN_CORE_030_OR_GREATER:
 
@@ -201,6 +257,7 @@ def test_messages_state(state_schema):
     graph.add_node(foo)
 
     app = graph.compile()
+    assert isinstance(app.channels["messages"], MessagesAggregate)
 
     assert app.invoke({"messages": [("user", "meow")]}) == {
         "messages": [
@@ -3,11 +3,12 @@ import functools
 import json
 import logging
 import operator
+import os
 import threading
 import time
 import uuid
 import warnings
-from collections import Counter, deque
+from collections import Counter, defaultdict, deque
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -41,6 +42,7 @@ from pytest_mock import MockerFixture
 from syrupy import SnapshotAssertion
 from typing_extensions import TypedDict
 
+from langgraph.cache.memory import InMemoryCache
 from langgraph.channels.base import BaseChannel
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.context import Context
@@ -62,9 +64,11 @@ from langgraph.graph import END, Graph, StateGraph
 from langgraph.graph.message import MessageGraph, MessagesState, add_messages
 from langgraph.prebuilt.tool_node import ToolNode
 from langgraph.pregel import Channel, GraphRecursionError, Pregel, StateSnapshot
+from langgraph.pregel.process import ProcessPool, set_process_pool
 from langgraph.pregel.retry import RetryPolicy
 from langgraph.store.base import BaseStore
 from langgraph.types import (
+    CachePolicy,
     Command,
     Interrupt,
     PregelTask,
@@ -1445,6 +1449,140 @@ def test_concurrent_emit_sends() -> None:
     ]
 
 
+def test_node_executor(monkeypatch: pytest.MonkeyPatch) -> None:
+    threads: dict[str, list[threading.Thread]] = defaultdict(list)
+
+    def node(name: str):
+        def _node(state: list) -> list:
+            threads[name].append(threading.current_thread())
+            return [name]
+
+        return _node
+
+    builder = StateGraph(Annotated[list, operator.add])
+    builder.add_node("inline", node("inline"), executor="inline")
+    builder.add_node("thread", node("thread"), executor="thread")
+    builder.add_node("auto", node("auto"))
+    builder.add_edge(START, "inline")
+    builder.add_edge(START, "thread")
+    builder.add_edge(START, "auto")
+    graph = builder.compile()
+
+    assert graph.invoke(["0"]) == ["0", "auto", "inline", "thread"]
+    assert threads["inline"] == [threading.current_thread()]
+    assert threads["thread"][0] is not threading.current_thread()
+    assert threads["auto"][0] is not threading.current_thread()
+
+    # nodes without an executor are inlined once measured to be cheap
+    monkeypatch.setattr("langgraph.pregel.runner.INLINE_MAX_DURATION", 1.0)
+    threads.clear()
+
+    def loop(state: list) -> Union[list[str], str]:
+        return ["x", "y"] if len(state) < 4 else END
+
+    builder = StateGraph(Annotated[list, operator.add])
+    builder.add_node("x", node("x"))
+    builder.add_node("y", node("y"))
+    builder.add_edge(START, "x")
+    builder.add_edge(START, "y")
+    builder.add_conditional_edges("y", loop, ["x", "y", END])
+    graph = builder.compile()
+
+    assert graph.invoke([]) == ["x", "y", "x", "y", "x", "y"]
+    assert threads["x"][0] is not threading.current_thread()
+    assert threads["x"][-1] is threading.current_thread()
+
+
+def test_node_executor_parent_command() -> None:
+    ran: list[str] = []
+
+    def route(state: list) -> Command:
+        ran.append("route")
+        return Command(goto="parent", graph=Command.PARENT)
+
+    def node(name: str, delay: float = 0):
+        def _node(state: list) -> list:
+            time.sleep(delay)
+            ran.append(name)
+            return [name]
+
+        return _node
+
+    subgraph = (
+        StateGraph(Annotated[list, operator.add])
+        .add_node("route", route, executor="inline")
+        .add_node("inline", node("inline"), executor="inline")
+        .add_node("thread", node("thread", 0.1), executor="thread")
+        .add_edge(START, "route")
+        .add_edge(START, "inline")
+        .add_edge(START, "thread")
+        .compile()
+    )
+    graph = (
+        StateGraph(Annotated[list, operator.add])
+        .add_node("sub", subgraph)
+        .add_node("parent", node("parent"))
+        .add_edge(START, "sub")
+        .compile()
+    )
+
+    # a command for the parent graph from an inline task is only raised once the
+    # other tasks of the step are done, as for tasks in the pool
+    assert graph.invoke([]) == ["parent"]
+    assert ran == ["route", "inline", "thread", "parent"]
+
+
+def _get_pid(state: list) -> list:
+    return [os.getpid()]
+
+
+async def _aget_pid(state: list) -> list:
+    return [os.getpid()]
+
+
+def test_node_executor_process() -> None:
+    builder = StateGraph(Annotated[list, operator.add])
+    builder.add_node("process", _get_pid, executor="process")
+    builder.add_node("thread", _get_pid)
+    builder.add_edge(START, "process")
+    builder.add_edge(START, "thread")
+    graph = builder.compile()
+
+    pool = ProcessPool(1)
+    set_process_pool(pool)
+    try:
+        pool.warm_up()
+        process_pid, thread_pid = graph.invoke([])
+        assert process_pid != os.getpid()
+        assert thread_pid == os.getpid()
+        assert graph.invoke([]) == [process_pid, thread_pid]
+        metrics = pool.metrics()
+        assert metrics["tasks"] == 2
+        assert metrics["bytes_sent"] > 0
+        assert metrics["bytes_received"] > 0
+    finally:
+        pool.shutdown()
+
+    # async nodes are run in an event loop in the worker process
+    builder = StateGraph(Annotated[list, operator.add])
+    builder.add_node("process", _aget_pid, executor="process")
+    builder.add_edge(START, "process")
+    pool = ProcessPool(1)
+    set_process_pool(pool)
+    try:
+        [process_pid] = builder.compile().invoke([])
+        assert process_pid != os.getpid()
+    finally:
+        pool.shutdown()
+
+    # nodes run in a worker process must be picklable
+    builder = StateGraph(Annotated[list, operator.add])
+    builder.add_node("process", lambda state: [], executor="process")
+    builder.add_edge(START, "process")
+    with pytest.raises(ValueError, match="must be picklable"):
+        builder.compile().invoke([])
+
+
 def test_send_sequences() -> None:
     class Node:
         def __init__(self, name: str):
@@ -7613,3 +7751,151 @@ def test_parallel_interrupts_double(
 
     assert invokes == 5
     assert len(events) == 5
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_SYNC)
+def test_node_cache(request: pytest.FixtureRequest, checkpointer_name: str) -> None:
+    checkpointer: BaseCheckpointSaver = request.getfixturevalue(
+        f"checkpointer_{checkpointer_name}"
+    )
+
+    class State(TypedDict):
+        items: Annotated[list[str], operator.add]
+
+    calls: list[str] = []
+
+    def double(state: State) -> State:
+        calls.append("double")
+        return {"items": [i * 2 for i in state["items"]]}
+
+    def uncached(state: State) -> State:
+        calls.append("uncached")
+        return {"items": ["!"]}
+
+    builder = StateGraph(State)
+    builder.add_node("double", double, cache_policy=CachePolicy())
+    builder.add_node("uncached", uncached)
+    builder.add_edge(START, "double")
+    builder.add_edge("double", "uncached")
+
+    cache = InMemoryCache()
+    graph = builder.compile(checkpointer=checkpointer, cache=cache)
+
+    config = {"configurable": {"thread_id": "1"}}
+    assert graph.invoke({"items": ["a"]}, config) == {"items": ["a", "aa", "!"]}
+    assert calls == ["double", "uncached"]
+    assert len(cache) == 1
+
+    # same input, served from the cache
+    assert [*graph.stream({"items": ["a"]}, {"configurable": {"thread_id": "2"}})] == [
+        {"double": {"items": ["aa"]}, "__metadata__": {"cached": True}},
+        {"uncached": {"items": ["!"]}},
+    ]
+    assert calls == ["double", "uncached", "uncached"]
+    assert graph.get_state({"configurable": {"thread_id": "2"}}).values == {
+        "items": ["a", "aa", "!"]
+    }
+
+    # different input, runs the node
+    assert graph.invoke({"items": ["b"]}, {"configurable": {"thread_id": "3"}}) == {
+        "items": ["b", "bb", "!"]
+    }
+    assert calls == ["double", "uncached", "uncached", "double", "uncached"]
+    assert len(cache) == 2
+
+    # clearing the cache runs the node again
+    graph.clear_cache()
+    assert len(cache) == 0
+    graph.invoke({"items": ["a"]}, {"configurable": {"thread_id": "4"}})
+    assert calls[-2:] == ["double", "uncached"]
+
+
+def test_node_cache_ttl_and_key_func() -> None:
+    calls: list[int] = []
+
+    def add_one(state: dict) -> dict:
+        calls.append(state["value"])
+        return {"value": state["value"] + 1}
+
+    builder = StateGraph(dict)
+    builder.add_node(
+        "add_one",
+        add_one,
+        cache_policy=CachePolicy(key_func=lambda s: str(s["value"] % 2), ttl=60),
+    )
+    builder.add_edge(START, "add_one")
+    cache = InMemoryCache()
+    graph = builder.compile(cache=cache)
+
+    assert graph.invoke({"value": 1}) == {"value": 2}
+    # same key, cached result is returned as is
+    assert graph.invoke({"value": 3}) == {"value": 2}
+    assert calls == [1]
+
+    # expired entries are not used
+    for key, (value, expiry) in list(cache._data.items()):
+        cache._data[key] = (value, expiry - 61)
+    assert graph.invoke({"value": 3}) == {"value": 4}
+    assert calls == [1, 3]
+
+
+def test_node_cache_unpicklable_input() -> None:
+    class State(TypedDict):
+        lock: Any
+        count: int
+
+    def increment(state: State) -> dict:
+        return {"count": state["count"] + 1}
+
+    builder = StateGraph(State)
+    builder.add_node("increment", increment, cache_policy=CachePolicy())
+    builder.add_edge(START, "increment")
+    lock = threading.Lock()
+
+    # without a cache, no cache key is computed
+    graph = builder.compile()
+    assert graph.invoke({"lock": lock, "count": 0}) == {"lock": lock, "count": 1}
+
+    # with a cache, inputs without a cache key aren't cached
+    cache = InMemoryCache()
+    graph = builder.compile(cache=cache)
+    assert graph.invoke({"lock": lock, "count": 0}) == {"lock": lock, "count": 1}
+    assert len(cache) == 0
+
+
+def test_node_cache_clear_subgraph() -> None:
+    class State(TypedDict):
+        items: Annotated[list[str], operator.add]
+
+    calls: list[str] = []
+
+    def double(state: State) -> State:
+        calls.append("double")
+        return {"items": [i * 2 for i in state["items"]]}
+
+    child = StateGraph(State)
+    child.add_node("double", double, cache_policy=CachePolicy())
+    child.add_edge(START, "double")
+
+    builder = StateGraph(State)
+    builder.add_node("child", child.compile())
+    builder.add_node("double", double, cache_policy=CachePolicy())
+    builder.add_edge(START, "child")
+    builder.add_edge("child", "double")
+    cache = InMemoryCache()
+    graph = builder.compile(cache=cache)
+
+    graph.invoke({"items": ["a"]})
+    assert calls == ["double", "double"]
+    assert len(cache) == 2
+    graph.invoke({"items": ["a"]})
+    assert calls == ["double", "double"]
+
+    # clearing a node also clears the nodes with the same name in subgraphs
+    graph.clear_cache(["double"])
+    assert len(cache) == 0
+    graph.invoke({"items": ["a"]})
+    assert calls == ["double"] * 4
+
+    graph.clear_cache()
+    assert len(cache) == 0
@@ -2,6 +2,7 @@ import asyncio
 import functools
 import logging
 import operator
+import os
 import random
 import sys
 import uuid
@@ -33,6 +34,7 @@ from pytest_mock import MockerFixture
 from syrupy import SnapshotAssertion
 from typing_extensions import TypedDict
 
+from langgraph.cache.memory import InMemoryCache
 from langgraph.channels.base import BaseChannel
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.context import Context
@@ -52,9 +54,11 @@ from langgraph.graph import END, Graph, StateGraph
 from langgraph.graph.message import MessagesState, add_messages
 from langgraph.prebuilt.tool_node import ToolNode
 from langgraph.pregel import Channel, GraphRecursionError, Pregel, StateSnapshot
+from langgraph.pregel.process import ProcessPool, set_process_pool
 from langgraph.pregel.retry import RetryPolicy
 from langgraph.store.base import BaseStore
 from langgraph.types import (
+    CachePolicy,
     Command,
     Interrupt,
     PregelTask,
@@ -2317,6 +2321,49 @@ async def test_cond_edge_after_send() -> None:
     assert await graph.ainvoke(["0"]) == ["0", "1", "2", "2", "3"]
 
 
+def _get_pid(state: list) -> list:
+    return [os.getpid()]
+
+
+async def test_node_executor_process() -> None:
+    builder = StateGraph(Annotated[list, operator.add])
+    builder.add_node("process", _get_pid, executor="process")
+    builder.add_node("same", _get_pid)
+    builder.add_edge(START, "process")
+    builder.add_edge(START, "same")
+    graph = builder.compile()
+
+    pool = ProcessPool(1)
+    set_process_pool(pool)
+    try:
+        process_pid, same_pid = await graph.ainvoke([])
+        assert process_pid != os.getpid()
+        assert same_pid == os.getpid()
+        assert pool.metrics()["tasks"] == 1
+    finally:
+        pool.shutdown()
+
+
+async def _aget_pid(state: list) -> list:
+    return [os.getpid()]
+
+
+async def test_node_executor_process_async_node() -> None:
+    builder = StateGraph(Annotated[list, operator.add])
+    builder.add_node("process", _aget_pid, executor="process")
+    builder.add_edge(START, "process")
+    graph = builder.compile()
+
+    pool = ProcessPool(1)
+    set_process_pool(pool)
+    try:
+        [process_pid] = await graph.ainvoke([])
+        assert process_pid != os.getpid()
+        assert await graph.ainvoke([]) == [process_pid]
+    finally:
+        pool.shutdown()
+
+
 async def test_concurrent_emit_sends() -> None:
     class Node:
         def __init__(self, name: str):
@@ -7838,3 +7885,57 @@ async def test_handles_multiple_interrupts_from_tasks() -> None:
     assert len(result) == 2
     assert result[0] == "Added James!"
     assert result[1] == "Added Will!"
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_ASYNC)
+async def test_node_cache(checkpointer_name: str) -> None:
+    class State(TypedDict):
+        items: Annotated[list[str], operator.add]
+
+    calls: list[str] = []
+
+    async def double(state: State) -> State:
+        calls.append("double")
+        return {"items": [i * 2 for i in state["items"]]}
+
+    async def uncached(state: State) -> State:
+        calls.append("uncached")
+        return {"items": ["!"]}
+
+    builder = StateGraph(State)
+    builder.add_node("double", double, cache_policy=CachePolicy())
+    builder.add_node("uncached", uncached)
+    builder.add_edge(START, "double")
+    builder.add_edge("double", "uncached")
+
+    async with awith_checkpointer(checkpointer_name) as checkpointer:
+        cache = InMemoryCache()
+        graph = builder.compile(checkpointer=checkpointer, cache=cache)
+
+        config = {"configurable": {"thread_id": "1"}}
+        assert await graph.ainvoke({"items": ["a"]}, config) == {
+            "items": ["a", "aa", "!"]
+        }
+        assert calls == ["double", "uncached"]
+        assert len(cache) == 1
+
+        # same input, served from the cache
+        assert [
+            c
+            async for c in graph.astream(
+                {"items": ["a"]}, {"configurable": {"thread_id": "2"}}
+            )
+        ] == [
+            {"double": {"items": ["aa"]}, "__metadata__": {"cached": True}},
+            {"uncached": {"items": ["!"]}},
+        ]
+        assert calls == ["double", "uncached", "uncached"]
+        assert (
+            await graph.aget_state({"configurable": {"thread_id": "2"}})
+        ).values == {"items": ["a", "aa", "!"]}
+
+        # clearing the cache runs the node again
+        await graph.aclear_cache()
+        assert len(cache) == 0
+        await graph.ainvoke({"items": ["a"]}, {"configurable": {"thread_id": "3"}})
+        assert calls[-2:] == ["double", "uncached"]
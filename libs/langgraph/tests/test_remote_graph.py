@@ -1,5 +1,9 @@
+import dataclasses
+from typing import Callable
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
+import orjson
 import pytest
 from langchain_core.runnables.graph import (
     Edge as DrawableEdge,
@@ -7,6 +11,15 @@ from langchain_core.runnables.graph import (
 from langchain_core.runnables.graph import (
     Node as DrawableNode,
 )
+from langgraph_sdk.client import (
+    JSON_OFFLOAD_MAX_VALUES,
+    JSON_OFFLOAD_THRESHOLD,
+    LangGraphClient,
+    StreamReconnectPolicy,
+    SyncLangGraphClient,
+    _json_size_exceeds,
+    aencode_json,
+)
 from langgraph_sdk.schema import StreamPart
 
 from langgraph.errors import GraphInterrupt
@@ -244,7 +257,7 @@ async def test_aget_state():
 def test_get_state_history():
     # set up test
     mock_sync_client = MagicMock()
-    mock_sync_client.threads.get_history.return_value = [
+    mock_sync_client.threads.iter_history.return_value = [
         {
             "values": {"messages": [{"type": "human", "content": "hello"}]},
             "next": None,
@@ -294,8 +307,9 @@ def test_get_state_history():
 @pytest.mark.anyio
 async def test_aget_state_history():
     # set up test
-    mock_async_client = AsyncMock()
-    mock_async_client.threads.get_history.return_value = [
+    mock_async_client = MagicMock()
+    async_iter = MagicMock()
+    async_iter.__aiter__.return_value = [
         {
             "values": {"messages": [{"type": "human", "content": "hello"}]},
             "next": None,
@@ -311,6 +325,7 @@ async def test_aget_state_history():
             "tasks": [],
         }
     ]
+    mock_async_client.threads.iter_history.return_value = async_iter
 
     # call method / assertions
     remote_pregel = RemoteGraph(
@@ -344,6 +359,65 @@ async def test_aget_state_history():
     )
 
 
+def test_get_state_history_pages():
+    history = [
+        {
+            "values": {"step": i},
+            "next": [],
+            "checkpoint": {
+                "thread_id": "thread_1",
+                "checkpoint_ns": "",
+                "checkpoint_id": f"checkpoint_{i}",
+            },
+            "metadata": {"step": i},
+            "created_at": "timestamp",
+            "parent_checkpoint": None,
+            "tasks": [],
+        }
+        for i in reversed(range(250))
+    ]
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = orjson.loads(request.content)
+        requests.append(body)
+        start = 0
+        if before := body.get("before"):
+            start = next(
+                i + 1
+                for i, s in enumerate(history)
+                if s["checkpoint"]["checkpoint_id"] == before["checkpoint_id"]
+            )
+        return httpx.Response(200, json=history[start : start + body["limit"]])
+
+    sync_client = SyncLangGraphClient(
+        httpx.Client(base_url="http://api", transport=httpx.MockTransport(handler))
+    )
+    remote_pregel = RemoteGraph("test_graph_id", sync_client=sync_client)
+    config = {"configurable": {"thread_id": "thread_1"}}
+
+    # all states are returned, fetched in pages using the last one as cursor
+    states = list(remote_pregel.get_state_history(config))
+    assert [s.values["step"] for s in states] == list(reversed(range(250)))
+    assert [(r["limit"], r.get("before")) for r in requests] == [
+        (100, None),
+        (100, history[99]["checkpoint"]),
+        (100, history[199]["checkpoint"]),
+    ]
+
+    # limit is split in pages no larger than needed
+    requests.clear()
+    states = list(remote_pregel.get_state_history(config, limit=150))
+    assert [s.values["step"] for s in states] == list(reversed(range(100, 250)))
+    assert [r["limit"] for r in requests] == [100, 50]
+
+    # stopping early doesn't fetch beyond the prefetched page
+    requests.clear()
+    for _ in zip(range(10), remote_pregel.get_state_history(config)):
+        pass
+    assert len(requests) <= 2
+
+
 def test_update_state():
     # set up test
     mock_sync_client = MagicMock()
@@ -651,6 +725,134 @@ async def test_astream():
     ]
 
 
+# the second event is cut off after its id, then replayed on reconnect,
+# along with the first one, which must not be emitted twice
+STREAM_EVENTS = [
+    f'event: values\ndata: {{"i": {i}}}\nid: {i}\n\n'.encode() for i in range(1, 4)
+]
+
+
+class DroppedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, chunks: list[bytes], drop: bool) -> None:
+        self.chunks = chunks
+        self.drop = drop
+
+    def __iter__(self):
+        yield from self.chunks
+        if self.drop:
+            raise httpx.ReadError("connection dropped")
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+        if self.drop:
+            raise httpx.ReadError("connection dropped")
+
+
+def dropping_handler(requests: list) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        last_event_id = request.headers.get("last-event-id")
+        requests.append((request.method, request.url.path, last_event_id))
+        headers = {
+            "content-type": "text/event-stream",
+            "location": "/threads/thread_1/runs/run_1/stream",
+        }
+        if request.method == "POST":
+            stream = DroppedStream([STREAM_EVENTS[0], STREAM_EVENTS[1][:-1]], drop=True)
+        else:
+            stream = DroppedStream(STREAM_EVENTS[int(last_event_id) - 1 :], drop=False)
+        return httpx.Response(200, headers=headers, stream=stream)
+
+    return handler
+
+
+def test_stream_reconnect():
+    requests: list = []
+    sync_client = SyncLangGraphClient(
+        httpx.Client(
+            base_url="http://api",
+            transport=httpx.MockTransport(dropping_handler(requests)),
+        )
+    )
+    remote_pregel = RemoteGraph("test_graph_id", sync_client=sync_client)
+
+    stream_parts = list(
+        remote_pregel.stream(
+            {"input": "data"},
+            config={"configurable": {"thread_id": "thread_1"}},
+            stream_mode="values",
+            reconnect=StreamReconnectPolicy(initial_interval=0),
+        )
+    )
+
+    assert stream_parts == [{"i": 1}, {"i": 2}, {"i": 3}]
+    assert requests == [
+        ("POST", "/threads/thread_1/runs/stream", None),
+        ("GET", "/threads/thread_1/runs/run_1/stream", "1"),
+    ]
+
+
+@pytest.mark.anyio
+async def test_astream_reconnect():
+    requests: list = []
+    client = LangGraphClient(
+        httpx.AsyncClient(
+            base_url="http://api",
+            transport=httpx.MockTransport(dropping_handler(requests)),
+        )
+    )
+    remote_pregel = RemoteGraph("test_graph_id", client=client)
+
+    stream_parts = [
+        stream_part
+        async for stream_part in remote_pregel.astream(
+            {"input": "data"},
+            config={"configurable": {"thread_id": "thread_1"}},
+            stream_mode="values",
+            reconnect=StreamReconnectPolicy(initial_interval=0),
+        )
+    ]
+
+    assert stream_parts == [{"i": 1}, {"i": 2}, {"i": 3}]
+    assert requests == [
+        ("POST", "/threads/thread_1/runs/stream", None),
+        ("GET", "/threads/thread_1/runs/run_1/stream", "1"),
+    ]
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+
+@pytest.mark.parametrize(
+    "body,offloaded",
+    [
+        ({"input": {"messages": [{"role": "user", "content": "hi"}]}}, False),
+        ({"input": "x" * JSON_OFFLOAD_THRESHOLD}, True),
+        # bodies with many small values aren't walked to the end
+        ({"input": list(range(JSON_OFFLOAD_MAX_VALUES))}, True),
+        # values of unknown size
+        ({"input": {1, 2}}, True),
+        ({"input": Point(1, 2)}, True),
+    ],
+)
+@pytest.mark.anyio
+async def test_aencode_json_offload(body, offloaded, monkeypatch):
+    import langgraph_sdk.client
+
+    executor = MagicMock(wraps=langgraph_sdk.client._get_json_executor())
+    monkeypatch.setattr(langgraph_sdk.client, "_get_json_executor", lambda: executor)
+
+    assert _json_size_exceeds(body, JSON_OFFLOAD_THRESHOLD) is offloaded
+    _, content = await aencode_json(body)
+    assert content == orjson.dumps(
+        body, langgraph_sdk.client.orjson_default, orjson.OPT_NON_STR_KEYS
+    )
+    assert executor.submit.called is offloaded
+
+
 def test_invoke():
     # set up test
     mock_sync_client = MagicMock()
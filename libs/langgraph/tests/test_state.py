@@ -7,6 +7,7 @@ from typing import Any, Optional
 
 import pytest
 from langchain_core.runnables import RunnableConfig, RunnableLambda
+from pydantic import BaseModel as BaseModelV2
 from pydantic.v1 import BaseModel
 from typing_extensions import Annotated, NotRequired, Required, TypedDict
 
@@ -400,3 +401,31 @@ def test_private_input_schema_conditional_edge():
     builder.add_edge("__start__", "node_1")
     graph = builder.compile()
     assert graph.invoke({"foo": 0}) == {"foo": 2, "bar": "meow"}
+
+
+@pytest.mark.parametrize("base", [BaseModel, BaseModelV2])
+def test_node_returns_pydantic_state(base: type) -> None:
+    class State(base):
+        a: Optional[str] = None
+        b: str = "b"
+        c: Optional[int] = 1
+
+    def node_1(state: State) -> State:
+        # a is None as its default, so it's not an update unless set explicitly
+        return State(b="x", c=None)
+
+    def node_2(state: State) -> State:
+        return State(a=None)
+
+    builder = StateGraph(State)
+    builder.add_node(node_1)
+    builder.add_node(node_2)
+    builder.add_edge("__start__", "node_1")
+    builder.add_edge("node_1", "node_2")
+    graph = builder.compile()
+
+    for _ in range(2):
+        assert [*graph.stream(State(a="in"), stream_mode="updates")] == [
+            {"node_1": {"b": "x", "c": None}},
+            {"node_2": {"a": None, "b": "b", "c": 1}},
+        ]
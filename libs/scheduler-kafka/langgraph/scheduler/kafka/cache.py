@@ -0,0 +1,394 @@
+import base64
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any, Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.scheduler.kafka.types import TaskWrite
+
+# writes larger than this aren't sent along with messages to the orchestrator
+MAX_TASK_WRITES_BYTES = 256 * 1024
+
+
+def dump_task_writes(
+    serde: SerializerProtocol,
+    calls: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+) -> Optional[list[TaskWrite]]:
+    """Serialize the writes saved by an executor, one (task_id, writes) pair per
+    call to put_writes, to send them to the orchestrator. Returns None if they
+    are too large to send."""
+    dumped: list[TaskWrite] = []
+    size = 0
+    for task_id, writes in calls:
+        for idx, (channel, value) in enumerate(writes):
+            type_, data = serde.dumps_typed(value)
+            size += len(data)
+            if size > MAX_TASK_WRITES_BYTES:
+                return None
+            dumped.append(
+                TaskWrite(
+                    task_id=task_id,
+                    idx=WRITES_IDX_MAP.get(channel, idx),
+                    channel=channel,
+                    type=type_,
+                    value=base64.b64encode(data).decode(),
+                )
+            )
+    return dumped
+
+
+def _thread_key(config: RunnableConfig) -> tuple[str, str]:
+    return (
+        config["configurable"]["thread_id"],
+        config["configurable"].get("checkpoint_ns", ""),
+    )
+
+
+class _CachedCheckpoint:
+    __slots__ = ("config", "checkpoint", "metadata", "parent_config", "writes")
+
+    def __init__(
+        self,
+        config: RunnableConfig,
+        checkpoint: tuple[str, bytes],
+        metadata: tuple[str, bytes],
+        parent_config: Optional[RunnableConfig],
+    ) -> None:
+        self.config = config
+        self.checkpoint = checkpoint
+        self.metadata = metadata
+        self.parent_config = parent_config
+        # (task_id, idx) -> (task_id, channel, serialized value)
+        self.writes: dict[tuple[str, int], tuple[str, str, tuple[str, bytes]]] = {}
+
+    def put_write(
+        self, task_id: str, idx: int, channel: str, value: tuple[str, bytes]
+    ) -> None:
+        # same semantics as the checkpointers, special writes replace earlier ones
+        if idx >= 0 and (task_id, idx) in self.writes:
+            return
+        self.writes[(task_id, idx)] = (task_id, channel, value)
+
+    def put_writes(
+        self, task_id: str, writes: Sequence[tuple[str, tuple[str, bytes]]]
+    ) -> None:
+        for idx, (channel, value) in enumerate(writes):
+            self.put_write(task_id, WRITES_IDX_MAP.get(channel, idx), channel, value)
+
+
+class CheckpointCache:
+    """Latest checkpoint of recently processed threads, as saved or loaded by an
+    orchestrator, so that the next message for the same thread doesn't need to
+    read it back from the checkpointer.
+
+    Messages are partitioned by thread, so while the orchestrator is assigned a
+    partition no one else saves checkpoints for its threads. Executors send the
+    writes of each task along with the message that reports it finished, which
+    keeps the cached pending writes up to date. Any other message invalidates
+    the thread, eg. after its state is updated directly. The cache must be
+    cleared when partitions are revoked, as another orchestrator takes over
+    their threads.
+    """
+
+    def __init__(self, serde: SerializerProtocol, maxsize: int) -> None:
+        self.serde = serde
+        self.maxsize = maxsize
+        self.entries: OrderedDict[tuple[str, str], _CachedCheckpoint] = OrderedDict()
+        # incremented on clear, so that checkpoints saved by messages that
+        # started processing before then aren't cached
+        self.generation = 0
+        # incremented whenever writes may be missing from the cache, so that
+        # checkpoints read from the checkpointer before then aren't cached
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def metrics(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "size": len(self.entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.generation += 1
+            self.version += 1
+
+    def invalidate(self, config: RunnableConfig) -> None:
+        with self.lock:
+            self.entries.pop(_thread_key(config), None)
+            self.version += 1
+
+    def get(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Return the cached checkpoint of a thread, if it's the latest one or the
+        one requested by `config`."""
+        with self.lock:
+            key = _thread_key(config)
+            if (entry := self.entries.get(key)) is None or (
+                (checkpoint_id := get_checkpoint_id(config))
+                and checkpoint_id != get_checkpoint_id(entry.config)
+            ):
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            writes = sorted(entry.writes.items())
+        return CheckpointTuple(
+            entry.config,
+            self.serde.loads_typed(entry.checkpoint),
+            self.serde.loads_typed(entry.metadata),
+            entry.parent_config,
+            [
+                (task_id, channel, self.serde.loads_typed(value))
+                for _, (task_id, channel, value) in writes
+            ],
+        )
+
+    def put_tuple(self, version: int, saved: CheckpointTuple) -> None:
+        """Cache a checkpoint read from the checkpointer, unless writes were sent
+        since `version`, which the checkpointer may not have returned."""
+        entry = _CachedCheckpoint(
+            saved.config,
+            self.serde.dumps_typed(saved.checkpoint),
+            self.serde.dumps_typed(saved.metadata),
+            saved.parent_config,
+        )
+        # pending writes are returned ordered by task and index
+        counts: dict[str, int] = {}
+        for task_id, channel, value in saved.pending_writes or ():
+            if (idx := WRITES_IDX_MAP.get(channel)) is None:
+                idx = counts[task_id] = counts.get(task_id, -1) + 1
+            entry.put_write(task_id, idx, channel, self.serde.dumps_typed(value))
+        with self.lock:
+            if version == self.version:
+                self._put(entry)
+
+    def put(self, generation: int, entry: _CachedCheckpoint) -> None:
+        """Cache the latest checkpoint of a thread, unless the cache was cleared
+        since `generation`."""
+        with self.lock:
+            if generation == self.generation:
+                self._put(entry)
+
+    def _put(self, entry: _CachedCheckpoint) -> None:
+        key = _thread_key(entry.config)
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        task_id: str,
+        writes: Sequence[tuple[str, tuple[str, bytes]]],
+    ) -> None:
+        """Add serialized writes to the cached checkpoint they were saved for, if
+        it's still the latest one."""
+        with self.lock:
+            entry = self.entries.get(_thread_key(config))
+            if entry is not None and get_checkpoint_id(config) == get_checkpoint_id(
+                entry.config
+            ):
+                entry.put_writes(task_id, writes)
+
+    def put_task_writes(self, config: RunnableConfig, writes: list[TaskWrite]) -> None:
+        """Add the writes sent by an executor to the cached checkpoint they were
+        saved for, if it's still the latest one."""
+        with self.lock:
+            self.version += 1
+            entry = self.entries.get(_thread_key(config))
+            if entry is None or get_checkpoint_id(config) != get_checkpoint_id(
+                entry.config
+            ):
+                return
+            for w in writes:
+                entry.put_write(
+                    w["task_id"],
+                    w["idx"],
+                    w["channel"],
+                    (w["type"], base64.b64decode(w["value"])),
+                )
+
+
+class CachedCheckpointSaver(BaseCheckpointSaver):
+    """Checkpointer for processing one message in the orchestrator, which reads
+    the latest checkpoint from the cache if present, and updates the cache with
+    the checkpoints and writes it saves."""
+
+    def __init__(self, saver: BaseCheckpointSaver, cache: CheckpointCache) -> None:
+        super().__init__(serde=saver.serde)
+        self.saver = saver
+        self.cache = cache
+        self.generation = cache.generation
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        if (saved := self.cache.get(config)) is None:
+            version = self.cache.version
+            if (saved := self.saver.get_tuple(config)) is not None:
+                self._put_tuple(version, config, saved)
+        return saved
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        if (saved := self.cache.get(config)) is None:
+            version = self.cache.version
+            if (saved := await self.saver.aget_tuple(config)) is not None:
+                self._put_tuple(version, config, saved)
+        return saved
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        return self.saver.list(config, filter=filter, before=before, limit=limit)
+
+    def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        return self.saver.alist(config, filter=filter, before=before, limit=limit)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        entry = self._entry(config, checkpoint, metadata)
+        next_config = self.saver.put(config, checkpoint, metadata, new_versions)
+        self._put_entry(entry, next_config)
+        return next_config
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        entry = self._entry(config, checkpoint, metadata)
+        next_config = await self.saver.aput(config, checkpoint, metadata, new_versions)
+        self._put_entry(entry, next_config)
+        return next_config
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        self.saver.put_writes(config, writes, task_id, task_path)
+        self.cache.put_writes(
+            config, task_id, [(c, self.serde.dumps_typed(v)) for c, v in writes]
+        )
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await self.saver.aput_writes(config, writes, task_id, task_path)
+        self.cache.put_writes(
+            config, task_id, [(c, self.serde.dumps_typed(v)) for c, v in writes]
+        )
+
+    def put_writes_batch(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        self.saver.put_writes_batch(config, writes)
+        for task_id, _, task_writes in writes:
+            self.cache.put_writes(
+                config,
+                task_id,
+                [(c, self.serde.dumps_typed(v)) for c, v in task_writes],
+            )
+
+    async def aput_writes_batch(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        await self.saver.aput_writes_batch(config, writes)
+        for task_id, _, task_writes in writes:
+            self.cache.put_writes(
+                config,
+                task_id,
+                [(c, self.serde.dumps_typed(v)) for c, v in task_writes],
+            )
+
+    def get_next_version(self, current: Optional[Any], channel: Any) -> Any:
+        return self.saver.get_next_version(current, channel)
+
+    def _put_tuple(
+        self, version: int, config: RunnableConfig, saved: CheckpointTuple
+    ) -> None:
+        # only the latest checkpoint is cached
+        if not get_checkpoint_id(config):
+            self.cache.put_tuple(version, saved)
+
+    def _entry(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+    ) -> Optional[_CachedCheckpoint]:
+        if checkpoint["pending_sends"]:
+            # when loaded from the checkpointer, pending sends are ordered by how
+            # it stores the writes of the previous checkpoint, so don't cache
+            return None
+        parent_id = get_checkpoint_id(config)
+        # serialized now, as the loop keeps using the checkpoint
+        return _CachedCheckpoint(
+            config,
+            self.serde.dumps_typed(checkpoint),
+            self.serde.dumps_typed(get_checkpoint_metadata(config, metadata)),
+            {
+                "configurable": {
+                    "thread_id": config["configurable"]["thread_id"],
+                    "checkpoint_ns": config["configurable"].get("checkpoint_ns", ""),
+                    "checkpoint_id": parent_id,
+                }
+            }
+            if parent_id
+            else None,
+        )
+
+    def _put_entry(
+        self, entry: Optional[_CachedCheckpoint], next_config: RunnableConfig
+    ) -> None:
+        if entry is None:
+            self.cache.invalidate(next_config)
+        else:
+            entry.config = next_config
+            self.cache.put(self.generation, entry)
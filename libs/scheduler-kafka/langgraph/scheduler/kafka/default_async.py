@@ -1,9 +1,28 @@
+from typing import Callable, Collection
+
 import aiokafka
 
+from langgraph.scheduler.kafka.types import TopicPartition
+
 
 class DefaultAsyncConsumer(aiokafka.AIOKafkaConsumer):
     pass
 
 
+class DefaultAsyncRebalanceListener(aiokafka.ConsumerRebalanceListener):
+    def __init__(
+        self, on_revoked: Callable[[Collection[TopicPartition]], None]
+    ) -> None:
+        self.on_revoked = on_revoked
+
+    async def on_partitions_revoked(self, revoked: Collection[TopicPartition]) -> None:
+        self.on_revoked(revoked)
+
+    async def on_partitions_assigned(
+        self, assigned: Collection[TopicPartition]
+    ) -> None:
+        pass
+
+
 class DefaultAsyncProducer(aiokafka.AIOKafkaProducer):
     pass
@@ -1,7 +1,8 @@
 import concurrent.futures
-from typing import Optional, Sequence
+from typing import Callable, Collection, Optional, Sequence
 
-from kafka import KafkaConsumer, KafkaProducer
+from kafka import ConsumerRebalanceListener, KafkaConsumer, KafkaProducer
+from kafka.structs import OffsetAndMetadata
 from langgraph.scheduler.kafka.types import ConsumerRecord, TopicPartition
 
 
@@ -11,6 +12,13 @@ class DefaultConsumer(KafkaConsumer):
     ) -> dict[TopicPartition, Sequence[ConsumerRecord]]:
         return self.poll(timeout_ms=timeout_ms, max_records=max_records)
 
+    def commit(self, offsets: Optional[dict[TopicPartition, int]] = None) -> None:
+        if offsets is None:
+            return super().commit()
+        return super().commit(
+            {tp: OffsetAndMetadata(offset, "") for tp, offset in offsets.items()}
+        )
+
     def __enter__(self):
         return self
 
@@ -18,6 +26,19 @@ class DefaultConsumer(KafkaConsumer):
         self.close()
 
 
+class DefaultRebalanceListener(ConsumerRebalanceListener):
+    def __init__(
+        self, on_revoked: Callable[[Collection[TopicPartition]], None]
+    ) -> None:
+        self.on_revoked = on_revoked
+
+    def on_partitions_revoked(self, revoked: Collection[TopicPartition]) -> None:
+        self.on_revoked(revoked)
+
+    def on_partitions_assigned(self, assigned: Collection[TopicPartition]) -> None:
+        pass
+
+
 class DefaultProducer(KafkaProducer):
     def send(
         self,
@@ -2,7 +2,7 @@ import asyncio
 import binascii
 import concurrent.futures
 import weakref
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from contextlib import (
     AbstractAsyncContextManager,
     AbstractContextManager,
@@ -13,7 +13,6 @@ from functools import partial
 from typing import Any, Optional
 from uuid import UUID
 
-import orjson
 from langchain_core.runnables import RunnableConfig
 from typing_extensions import Self
 
@@ -29,21 +28,28 @@ from langgraph.pregel.executor import (
 )
 from langgraph.pregel.manager import AsyncChannelsManager, ChannelsManager
 from langgraph.pregel.runner import PregelRunner
+from langgraph.scheduler.kafka.cache import dump_task_writes
+from langgraph.scheduler.kafka.offsets import OffsetTracker
 from langgraph.scheduler.kafka.retry import aretry, retry
 from langgraph.scheduler.kafka.types import (
     AsyncConsumer,
     AsyncProducer,
     Consumer,
+    ConsumerRecord,
     ErrorMessage,
     MessageToExecutor,
     MessageToOrchestrator,
     Producer,
     Sendable,
+    TopicPartition,
     Topics,
 )
 from langgraph.types import LoopProtocol, PregelExecutableTask, RetryPolicy
 from langgraph.utils.config import patch_configurable, recast_checkpoint_ns
 
+# how often to poll for more messages while others are processing
+POLL_INTERVAL_MS = 50
+
 
 class AsyncKafkaExecutor(AbstractAsyncContextManager):
     consumer: AsyncConsumer
@@ -57,9 +63,11 @@ class AsyncKafkaExecutor(AbstractAsyncContextManager):
         *,
         batch_max_n: int = 10,
         batch_max_ms: int = 1000,
+        max_in_flight: int = 10,
         retry_policy: Optional[RetryPolicy] = None,
         consumer: Optional[AsyncConsumer] = None,
         producer: Optional[AsyncProducer] = None,
+        wire_formats: Optional[Mapping[str, serde.WireFormat]] = None,
         **kwargs: Any,
     ) -> None:
         self.graph = graph
@@ -70,7 +78,15 @@ class AsyncKafkaExecutor(AbstractAsyncContextManager):
         self.producer = producer
         self.batch_max_n = batch_max_n
         self.batch_max_ms = batch_max_ms
+        self.max_in_flight = max_in_flight
         self.retry_policy = retry_policy
+        # topic -> format of messages sent to it, JSON by default
+        self.wire_formats = wire_formats or {}
+        self.offsets = OffsetTracker()
+        self.fetching: Optional[asyncio.Task] = None
+        self.in_flight: dict[
+            asyncio.Task, tuple[TopicPartition, int, MessageToExecutor]
+        ] = {}
 
     async def __aenter__(self) -> Self:
         loop = asyncio.get_running_loop()
@@ -102,45 +118,119 @@ class AsyncKafkaExecutor(AbstractAsyncContextManager):
         return self
 
     async def __aexit__(self, *args: Any) -> None:
+        # unfinished messages aren't committed, so will be consumed again
+        for task in (self.fetching, *self.in_flight):
+            if task is not None:
+                task.cancel()
         return await self.stack.__aexit__(*args)
 
     def __aiter__(self) -> Self:
         return self
 
     async def __anext__(self) -> Sequence[MessageToExecutor]:
-        # wait for next batch
-        recs = await self.consumer.getmany(
-            timeout_ms=self.batch_max_ms, max_records=self.batch_max_n
-        )
-        msgs: list[MessageToExecutor] = [
-            serde.loads(msg.value) for msgs in recs.values() for msg in msgs
-        ]
-        # process batch
-        await asyncio.gather(*(self.each(msg) for msg in msgs))
-        # commit offsets
-        await self.consumer.commit()
-        # return message
-        return msgs
+        while True:
+            # fetch more messages while there's room for them, in the background
+            if self.fetching is None and len(self.in_flight) < self.max_in_flight:
+                self.fetching = asyncio.create_task(
+                    self.consumer.getmany(
+                        timeout_ms=self.batch_max_ms,
+                        max_records=min(
+                            self.batch_max_n, self.max_in_flight - len(self.in_flight)
+                        ),
+                    )
+                )
+            # wait for next batch, or for any message to finish processing
+            await asyncio.wait(
+                (self.fetching, *self.in_flight) if self.fetching else self.in_flight,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            idle = False
+            if self.fetching is not None and self.fetching.done():
+                recs: dict[TopicPartition, Sequence[ConsumerRecord]] = (
+                    self.fetching.result()
+                )
+                self.fetching = None
+                idle = not any(recs.values())
+                # start processing, without waiting for other messages
+                for tp, records in recs.items():
+                    for rec in records:
+                        msg: MessageToExecutor = serde.loads(rec.value)
+                        self.offsets.start(tp, rec.offset)
+                        self.in_flight[asyncio.create_task(self.each(msg))] = (
+                            tp,
+                            rec.offset,
+                            msg,
+                        )
+            # collect finished messages
+            if finished := [t for t in self.in_flight if t.done()]:
+                msgs: list[MessageToExecutor] = []
+                failed = []
+                for task in finished:
+                    tp, offset, msg = self.in_flight.pop(task)
+                    if task.cancelled() or task.exception() is not None:
+                        # not committed, so the message is consumed again
+                        failed.append(task)
+                    else:
+                        self.offsets.finish(tp, offset)
+                        msgs.append(msg)
+                # commit offsets, up to the first unfinished message in each partition
+                if offsets := self.offsets.to_commit():
+                    await self.consumer.commit(offsets)
+                for task in failed:
+                    task.result()
+                # return finished messages
+                return msgs
+            elif idle and not self.in_flight:
+                return []
+
+    def _dumps(self, topic: str, value: Any) -> bytes:
+        return serde.dumps(value, self.wire_formats.get(topic, serde.JSON))
+
+    def metrics(self) -> dict[str, Any]:
+        """Return the number of messages being processed, and per partition the
+        fetched and committed offsets, and the lag if the consumer reports it."""
+        return self.offsets.metrics(getattr(self.consumer, "highwater", None))
 
     async def each(self, msg: MessageToExecutor) -> None:
+        if tasks := msg.get("tasks"):
+            # tasks dispatched together are executed and reported independently
+            await asyncio.gather(
+                *(
+                    self.each(
+                        MessageToExecutor(
+                            config=msg["config"],
+                            task=task,
+                            finally_send=msg.get("finally_send"),
+                            send_writes=msg.get("send_writes", False),
+                        )
+                    )
+                    for task in tasks
+                )
+            )
+            return
         try:
-            await aretry(self.retry_policy, self.attempt, msg)
+            await aretry(self.retry_policy, self.attempt, msg, [])
         except CheckpointNotLatest:
             pass
         except GraphDelegate as exc:
             for arg in exc.args:
                 fut = await self.producer.send(
                     self.topics.orchestrator,
-                    value=serde.dumps(
+                    value=self._dumps(
+                        self.topics.orchestrator,
                         MessageToOrchestrator(
                             config=arg["config"],
-                            input=orjson.Fragment(
-                                self.graph.checkpointer.serde.dumps(arg["input"])
+                            input=serde.dumps_input(
+                                arg["input"],
+                                self.wire_formats.get(
+                                    self.topics.orchestrator, serde.JSON
+                                ),
+                                self.graph.checkpointer.serde,
                             ),
                             finally_send=[
                                 Sendable(topic=self.topics.executor, value=msg)
                             ],
-                        )
+                        ),
                     ),
                     # use thread_id, checkpoint_ns as partition key
                     key=serde.dumps(
@@ -154,17 +244,22 @@ class AsyncKafkaExecutor(AbstractAsyncContextManager):
         except Exception as exc:
             fut = await self.producer.send(
                 self.topics.error,
-                value=serde.dumps(
+                value=self._dumps(
+                    self.topics.error,
                     ErrorMessage(
                         topic=self.topics.executor,
                         msg=msg,
                         error=repr(exc),
-                    )
+                    ),
                 ),
             )
             await fut
 
-    async def attempt(self, msg: MessageToExecutor) -> None:
+    async def attempt(
+        self,
+        msg: MessageToExecutor,
+        written: Optional[list[tuple[str, Sequence[tuple[str, Any]]]]] = None,
+    ) -> None:
         # find graph
         if checkpoint_ns := msg["config"]["configurable"].get("checkpoint_ns"):
             # remove task_ids from checkpoint_ns
@@ -184,6 +279,10 @@ class AsyncKafkaExecutor(AbstractAsyncContextManager):
             raise RuntimeError("Checkpoint not found")
         if saved.checkpoint["id"] != msg["config"]["configurable"]["checkpoint_id"]:
             raise CheckpointNotLatest()
+        # writes saved by this and previous attempts, to send to the orchestrator
+        if written is None:
+            written = []
+        retried = bool(written)
         async with (
             AsyncChannelsManager(
                 graph.channels,
@@ -217,7 +316,7 @@ class AsyncKafkaExecutor(AbstractAsyncContextManager):
                 checkpoint_null_version=checkpoint_null_version(saved.checkpoint),
             ):
                 # execute task, saving writes
-                put_writes = partial(self._put_writes, submit, msg["config"])
+                put_writes = partial(self._put_writes, submit, msg["config"], written)
                 runner = PregelRunner(
                     submit=weakref.ref(submit),
                     put_writes=weakref.ref(put_writes),
@@ -227,18 +326,26 @@ class AsyncKafkaExecutor(AbstractAsyncContextManager):
                     pass
             else:
                 # task was not found
+                writes = [(ERROR, TaskNotFound())]
+                written.append((str(UUID(int=0)), writes))
                 await self.graph.checkpointer.aput_writes(
-                    msg["config"], [(ERROR, TaskNotFound())], str(UUID(int=0))
+                    msg["config"], writes, str(UUID(int=0))
                 )
         # notify orchestrator
         fut = await self.producer.send(
             self.topics.orchestrator,
-            value=serde.dumps(
+            value=self._dumps(
+                self.topics.orchestrator,
                 MessageToOrchestrator(
                     input=None,
                     config=msg["config"],
                     finally_send=msg.get("finally_send"),
-                )
+                    # only an orchestrator caching checkpoints uses the writes,
+                    # and the checkpointer may have kept writes from previous attempts
+                    writes=dump_task_writes(self.graph.checkpointer.serde, written)
+                    if msg.get("send_writes") and not retried
+                    else None,
+                ),
             ),
             # use thread_id, checkpoint_ns as partition key
             key=serde.dumps(
@@ -262,9 +369,11 @@ class AsyncKafkaExecutor(AbstractAsyncContextManager):
         self,
         submit: Submit,
         config: RunnableConfig,
+        written: list[tuple[str, Sequence[tuple[str, Any]]]],
         task_id: str,
         writes: list[tuple[str, Any]],
     ) -> None:
+        written.append((task_id, writes))
         return submit(self.graph.checkpointer.aput_writes, config, writes, task_id)
 
 
@@ -280,9 +389,11 @@ class KafkaExecutor(AbstractContextManager):
         *,
         batch_max_n: int = 10,
         batch_max_ms: int = 1000,
+        max_in_flight: int = 10,
         retry_policy: Optional[RetryPolicy] = None,
         consumer: Optional[Consumer] = None,
         producer: Optional[Producer] = None,
+        wire_formats: Optional[Mapping[str, serde.WireFormat]] = None,
         **kwargs: Any,
     ) -> None:
         self.graph = graph
@@ -293,7 +404,14 @@ class KafkaExecutor(AbstractContextManager):
         self.producer = producer
         self.batch_max_n = batch_max_n
         self.batch_max_ms = batch_max_ms
+        self.max_in_flight = max_in_flight
         self.retry_policy = retry_policy
+        # topic -> format of messages sent to it, JSON by default
+        self.wire_formats = wire_formats or {}
+        self.offsets = OffsetTracker()
+        self.in_flight: dict[
+            concurrent.futures.Future, tuple[TopicPartition, int, MessageToExecutor]
+        ] = {}
 
     def __enter__(self) -> Self:
         self.subgraphs = dict(self.graph.get_subgraphs(recurse=True))
@@ -327,39 +445,110 @@ class KafkaExecutor(AbstractContextManager):
         return self
 
     def __next__(self) -> Sequence[MessageToExecutor]:
-        # wait for next batch
-        recs = self.consumer.getmany(
-            timeout_ms=self.batch_max_ms, max_records=self.batch_max_n
-        )
-        msgs: list[MessageToExecutor] = [
-            serde.loads(msg.value) for msgs in recs.values() for msg in msgs
-        ]
-        # process batch
-        concurrent.futures.wait(self.submit(self.each, msg) for msg in msgs)
-        # commit offsets
-        self.consumer.commit()
-        # return message
-        return msgs
+        while True:
+            idle = False
+            # fetch more messages while there's room for them
+            if len(self.in_flight) < self.max_in_flight:
+                recs = self.consumer.getmany(
+                    # don't block on fetching while other messages are processing
+                    timeout_ms=0 if self.in_flight else self.batch_max_ms,
+                    max_records=min(
+                        self.batch_max_n, self.max_in_flight - len(self.in_flight)
+                    ),
+                )
+                idle = not any(recs.values())
+                # start processing, without waiting for other messages
+                for tp, records in recs.items():
+                    for rec in records:
+                        msg: MessageToExecutor = serde.loads(rec.value)
+                        self.offsets.start(tp, rec.offset)
+                        self.in_flight[self.submit(self.each, msg)] = (
+                            tp,
+                            rec.offset,
+                            msg,
+                        )
+            # wait for any message to finish, polling for more if there's room
+            if self.in_flight:
+                concurrent.futures.wait(
+                    self.in_flight,
+                    timeout=None
+                    if len(self.in_flight) >= self.max_in_flight
+                    else min(self.batch_max_ms, POLL_INTERVAL_MS) / 1000,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+            # collect finished messages
+            if finished := [f for f in self.in_flight if f.done()]:
+                msgs: list[MessageToExecutor] = []
+                failed = []
+                for fut in finished:
+                    tp, offset, msg = self.in_flight.pop(fut)
+                    if fut.cancelled() or fut.exception() is not None:
+                        # not committed, so the message is consumed again
+                        failed.append(fut)
+                    else:
+                        self.offsets.finish(tp, offset)
+                        msgs.append(msg)
+                # commit offsets, up to the first unfinished message in each partition
+                if offsets := self.offsets.to_commit():
+                    self.consumer.commit(offsets)
+                for fut in failed:
+                    fut.result()
+                # return finished messages
+                return msgs
+            elif idle and not self.in_flight:
+                return []
+
+    def _dumps(self, topic: str, value: Any) -> bytes:
+        return serde.dumps(value, self.wire_formats.get(topic, serde.JSON))
+
+    def metrics(self) -> dict[str, Any]:
+        """Return the number of messages being processed, and per partition the
+        fetched and committed offsets, and the lag if the consumer reports it."""
+        return self.offsets.metrics(getattr(self.consumer, "highwater", None))
 
     def each(self, msg: MessageToExecutor) -> None:
+        if tasks := msg.get("tasks"):
+            # tasks dispatched together are executed and reported independently
+            msgs = [
+                MessageToExecutor(
+                    config=msg["config"],
+                    task=task,
+                    finally_send=msg.get("finally_send"),
+                    send_writes=msg.get("send_writes", False),
+                )
+                for task in tasks
+            ]
+            futs = [self.submit(self.each, m) for m in msgs]
+            for fut, m in zip(futs, msgs):
+                if fut.cancel():
+                    # not started yet, eg. with every worker busy, so run it here
+                    self.each(m)
+                else:
+                    fut.result()
+            return
         try:
-            retry(self.retry_policy, self.attempt, msg)
+            retry(self.retry_policy, self.attempt, msg, [])
         except CheckpointNotLatest:
             pass
         except GraphDelegate as exc:
             for arg in exc.args:
                 fut = self.producer.send(
                     self.topics.orchestrator,
-                    value=serde.dumps(
+                    value=self._dumps(
+                        self.topics.orchestrator,
                         MessageToOrchestrator(
                             config=arg["config"],
-                            input=orjson.Fragment(
-                                self.graph.checkpointer.serde.dumps(arg["input"])
+                            input=serde.dumps_input(
+                                arg["input"],
+                                self.wire_formats.get(
+                                    self.topics.orchestrator, serde.JSON
+                                ),
+                                self.graph.checkpointer.serde,
                             ),
                             finally_send=[
                                 Sendable(topic=self.topics.executor, value=msg)
                             ],
-                        )
+                        ),
                     ),
                     # use thread_id, checkpoint_ns as partition key
                     key=serde.dumps(
@@ -373,17 +562,22 @@ class KafkaExecutor(AbstractContextManager):
         except Exception as exc:
             fut = self.producer.send(
                 self.topics.error,
-                value=serde.dumps(
+                value=self._dumps(
+                    self.topics.error,
                     ErrorMessage(
                         topic=self.topics.executor,
                         msg=msg,
                         error=repr(exc),
-                    )
+                    ),
                 ),
             )
             fut.result()
 
-    def attempt(self, msg: MessageToExecutor) -> None:
+    def attempt(
+        self,
+        msg: MessageToExecutor,
+        written: Optional[list[tuple[str, Sequence[tuple[str, Any]]]]] = None,
+    ) -> None:
         # find graph
         if checkpoint_ns := msg["config"]["configurable"].get("checkpoint_ns"):
             # remove task_ids from checkpoint_ns
@@ -403,6 +597,10 @@ class KafkaExecutor(AbstractContextManager):
             raise RuntimeError("Checkpoint not found")
         if saved.checkpoint["id"] != msg["config"]["configurable"]["checkpoint_id"]:
             raise CheckpointNotLatest()
+        # writes saved by this and previous attempts, to send to the orchestrator
+        if written is None:
+            written = []
+        retried = bool(written)
         with (
             ChannelsManager(
                 graph.channels,
@@ -434,7 +632,7 @@ class KafkaExecutor(AbstractContextManager):
                 checkpoint_null_version=checkpoint_null_version(saved.checkpoint),
             ):
                 # execute task, saving writes
-                put_writes = partial(self._put_writes, submit, msg["config"])
+                put_writes = partial(self._put_writes, submit, msg["config"], written)
                 runner = PregelRunner(
                     submit=weakref.ref(submit),
                     put_writes=weakref.ref(put_writes),
@@ -444,18 +642,26 @@ class KafkaExecutor(AbstractContextManager):
                     pass
             else:
                 # task was not found
+                writes = [(ERROR, TaskNotFound())]
+                written.append((str(UUID(int=0)), writes))
                 self.graph.checkpointer.put_writes(
-                    msg["config"], [(ERROR, TaskNotFound())], str(UUID(int=0))
+                    msg["config"], writes, str(UUID(int=0))
                 )
         # notify orchestrator
         fut = self.producer.send(
             self.topics.orchestrator,
-            value=serde.dumps(
+            value=self._dumps(
+                self.topics.orchestrator,
                 MessageToOrchestrator(
                     input=None,
                     config=msg["config"],
                     finally_send=msg.get("finally_send"),
-                )
+                    # only an orchestrator caching checkpoints uses the writes,
+                    # and the checkpointer may have kept writes from previous attempts
+                    writes=dump_task_writes(self.graph.checkpointer.serde, written)
+                    if msg.get("send_writes") and not retried
+                    else None,
+                ),
             ),
             # use thread_id, checkpoint_ns as partition key
             key=serde.dumps(
@@ -479,7 +685,9 @@ class KafkaExecutor(AbstractContextManager):
         self,
         submit: Submit,
         config: RunnableConfig,
+        written: list[tuple[str, Sequence[tuple[str, Any]]]],
         task_id: str,
         writes: list[tuple[str, Any]],
     ) -> None:
+        written.append((task_id, writes))
         return submit(self.graph.checkpointer.put_writes, config, writes, task_id)
@@ -0,0 +1,79 @@
+from collections import deque
+from typing import Any, Callable, Optional
+
+from langgraph.scheduler.kafka.types import TopicPartition
+
+
+class PartitionOffsets:
+    __slots__ = ("pending", "finished", "fetched", "committed")
+
+    def __init__(self) -> None:
+        # offsets fetched but not yet committed, in the order they were fetched
+        self.pending: deque[int] = deque()
+        # offsets that finished processing, but are behind an unfinished one
+        self.finished: set[int] = set()
+        # next offset after the last one fetched
+        self.fetched: Optional[int] = None
+        # next offset to commit, ie. all offsets before it are finished
+        self.committed: Optional[int] = None
+
+
+class OffsetTracker:
+    """Tracks the records being processed for each partition, so that records
+    can finish out of order while the committed offset for each partition only
+    advances past records that finished, along with every record before them."""
+
+    def __init__(self) -> None:
+        self.partitions: dict[TopicPartition, PartitionOffsets] = {}
+        self.in_flight = 0
+        self._to_commit: dict[TopicPartition, int] = {}
+
+    def start(self, tp: TopicPartition, offset: int) -> None:
+        """Record that processing of the record at `offset` has started."""
+        if (part := self.partitions.get(tp)) is None:
+            part = self.partitions[tp] = PartitionOffsets()
+        part.pending.append(offset)
+        part.fetched = offset + 1
+        self.in_flight += 1
+
+    def finish(self, tp: TopicPartition, offset: int) -> None:
+        """Record that processing of the record at `offset` has finished."""
+        part = self.partitions[tp]
+        part.finished.add(offset)
+        self.in_flight -= 1
+        # advance past the contiguous run of finished offsets
+        advanced = False
+        while part.pending and part.pending[0] in part.finished:
+            part.finished.discard(part.pending.popleft())
+            advanced = True
+        if advanced:
+            part.committed = part.pending[0] if part.pending else part.fetched
+            self._to_commit[tp] = part.committed
+
+    def to_commit(self) -> dict[TopicPartition, int]:
+        """Return the offsets to commit for partitions that advanced since the
+        last call, ie. the offset of the next record to consume."""
+        offsets, self._to_commit = self._to_commit, {}
+        return offsets
+
+    def metrics(
+        self,
+        highwater: Optional[Callable[[TopicPartition], Optional[int]]] = None,
+    ) -> dict[str, Any]:
+        """Return the number of records in flight, in total and per partition,
+        and for each partition the fetched and committed offsets. If
+        `highwater` is passed, also include the lag of the committed offset
+        behind the end of the partition."""
+        partitions = {}
+        for tp, part in self.partitions.items():
+            info = {
+                "in_flight": len(part.pending) - len(part.finished),
+                "fetched": part.fetched,
+                "committed": part.committed,
+            }
+            if highwater is not None and (end := highwater(tp)) is not None:
+                info["lag"] = end - (
+                    part.pending[0] if part.pending else (part.fetched or 0)
+                )
+            partitions[f"{tp.topic}:{tp.partition}"] = info
+        return {"in_flight": self.in_flight, "partitions": partitions}
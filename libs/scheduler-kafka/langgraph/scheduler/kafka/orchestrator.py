@@ -1,5 +1,6 @@
 import asyncio
 import concurrent.futures
+from collections.abc import Collection, Mapping, Sequence
 from contextlib import (
     AbstractAsyncContextManager,
     AbstractContextManager,
@@ -8,10 +9,11 @@ from contextlib import (
 )
 from typing import Any, Optional
 
-from langchain_core.runnables import ensure_config
+from langchain_core.runnables import RunnableConfig, ensure_config
 from typing_extensions import Self
 
 import langgraph.scheduler.kafka.serde as serde
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.constants import (
     CONFIG_KEY_DEDUPE_TASKS,
     CONFIG_KEY_ENSURE_LATEST,
@@ -20,23 +22,80 @@ from langgraph.constants import (
 )
 from langgraph.errors import CheckpointNotLatest, GraphInterrupt
 from langgraph.pregel import Pregel
+from langgraph.pregel.algo import task_path_str
 from langgraph.pregel.executor import BackgroundExecutor, Submit
 from langgraph.pregel.loop import AsyncPregelLoop, SyncPregelLoop
+from langgraph.scheduler.kafka.cache import CachedCheckpointSaver, CheckpointCache
+from langgraph.scheduler.kafka.offsets import OffsetTracker
 from langgraph.scheduler.kafka.retry import aretry, retry
 from langgraph.scheduler.kafka.types import (
     AsyncConsumer,
     AsyncProducer,
     Consumer,
+    ConsumerRecord,
     ErrorMessage,
     ExecutorTask,
     MessageToExecutor,
     MessageToOrchestrator,
     Producer,
+    Sendable,
+    TopicPartition,
     Topics,
 )
-from langgraph.types import RetryPolicy
+from langgraph.types import PregelExecutableTask, RetryPolicy
 from langgraph.utils.config import patch_configurable, recast_checkpoint_ns
 
+# how often to poll for more messages while others are processing
+POLL_INTERVAL_MS = 50
+# number of threads to cache the latest checkpoint for, with the default consumer
+DEFAULT_CHECKPOINT_CACHE_SIZE = 1000
+
+
+def dedupe_records(
+    recs: dict[TopicPartition, Sequence[ConsumerRecord]],
+) -> dict[bytes, list[tuple[TopicPartition, int]]]:
+    """Group the records of a batch by value, eg. if multiple nodes finish around
+    same time, each unique message is processed once for all of its records."""
+    uniq: dict[bytes, list[tuple[TopicPartition, int]]] = {}
+    for tp, records in recs.items():
+        for rec in records:
+            uniq.setdefault(rec.value, []).append((tp, rec.offset))
+    return uniq
+
+
+def batch_tasks(
+    tasks: Sequence[PregelExecutableTask], size: int
+) -> list[Sequence[PregelExecutableTask]]:
+    """Split the tasks to dispatch into batches of up to `size` tasks."""
+    size = max(size, 1)
+    return [tasks[i : i + size] for i in range(0, len(tasks), size)]
+
+
+def executor_message(
+    config: RunnableConfig,
+    tasks: Sequence[PregelExecutableTask],
+    finally_send: Optional[Sequence[Sendable]],
+    send_writes: bool = False,
+) -> MessageToExecutor:
+    """Create the message for a batch of tasks, in the single task format if
+    there's only one, for compatibility with executors of previous versions.
+    Executors only send back the writes of the tasks if `send_writes` is set."""
+    if len(tasks) == 1:
+        message = MessageToExecutor(
+            config=config,
+            task=ExecutorTask(id=tasks[0].id, path=tasks[0].path),
+            finally_send=finally_send,
+        )
+    else:
+        message = MessageToExecutor(
+            config=config,
+            tasks=[ExecutorTask(id=t.id, path=t.path) for t in tasks],
+            finally_send=finally_send,
+        )
+    if send_writes:
+        message["send_writes"] = True
+    return message
+
 
 class AsyncKafkaOrchestrator(AbstractAsyncContextManager):
     consumer: AsyncConsumer
@@ -49,9 +108,13 @@ class AsyncKafkaOrchestrator(AbstractAsyncContextManager):
         topics: Topics,
         batch_max_n: int = 10,
         batch_max_ms: int = 1000,
+        max_in_flight: int = 10,
         retry_policy: Optional[RetryPolicy] = None,
         consumer: Optional[AsyncConsumer] = None,
         producer: Optional[AsyncProducer] = None,
+        checkpoint_cache_size: Optional[int] = None,
+        dispatch_batch_size: int = 1,
+        wire_formats: Optional[Mapping[str, serde.WireFormat]] = None,
         **kwargs: Any,
     ) -> None:
         self.graph = graph
@@ -62,7 +125,28 @@ class AsyncKafkaOrchestrator(AbstractAsyncContextManager):
         self.producer = producer
         self.batch_max_n = batch_max_n
         self.batch_max_ms = batch_max_ms
+        self.max_in_flight = max_in_flight
+        self.dispatch_batch_size = dispatch_batch_size
         self.retry_policy = retry_policy
+        # topic -> format of messages sent to it, JSON by default
+        self.wire_formats = wire_formats or {}
+        self.offsets = OffsetTracker()
+        # a custom consumer must call on_partitions_revoked for the cache to be
+        # safe to use, so it's only enabled by default with the default consumer
+        if checkpoint_cache_size is None:
+            checkpoint_cache_size = (
+                DEFAULT_CHECKPOINT_CACHE_SIZE if consumer is None else 0
+            )
+        self.cache = (
+            CheckpointCache(graph.checkpointer.serde, checkpoint_cache_size)
+            if checkpoint_cache_size > 0 and graph.checkpointer
+            else None
+        )
+        self.fetching: Optional[asyncio.Task] = None
+        self.in_flight: dict[
+            asyncio.Task,
+            tuple[list[tuple[TopicPartition, int]], MessageToOrchestrator],
+        ] = {}
 
     async def __aenter__(self) -> Self:
         loop = asyncio.get_running_loop()
@@ -70,18 +154,23 @@ class AsyncKafkaOrchestrator(AbstractAsyncContextManager):
             k: v async for k, v in self.graph.aget_subgraphs(recurse=True)
         }
         if self.consumer is None:
-            from langgraph.scheduler.kafka.default_async import DefaultAsyncConsumer
-
-            self.consumer = await self.stack.enter_async_context(
-                DefaultAsyncConsumer(
-                    self.topics.orchestrator,
-                    auto_offset_reset="earliest",
-                    group_id="orchestrator",
-                    enable_auto_commit=False,
-                    loop=loop,
-                    **self.kwargs,
-                )
+            from langgraph.scheduler.kafka.default_async import (
+                DefaultAsyncConsumer,
+                DefaultAsyncRebalanceListener,
+            )
+
+            consumer = DefaultAsyncConsumer(
+                auto_offset_reset="earliest",
+                group_id="orchestrator",
+                enable_auto_commit=False,
+                loop=loop,
+                **self.kwargs,
             )
+            consumer.subscribe(
+                [self.topics.orchestrator],
+                listener=DefaultAsyncRebalanceListener(self.on_partitions_revoked),
+            )
+            self.consumer = await self.stack.enter_async_context(consumer)
         if self.producer is None:
             from langgraph.scheduler.kafka.default_async import DefaultAsyncProducer
 
@@ -94,25 +183,86 @@ class AsyncKafkaOrchestrator(AbstractAsyncContextManager):
         return self
 
     async def __aexit__(self, *args: Any) -> None:
+        # unfinished messages aren't committed, so will be consumed again
+        for task in (self.fetching, *self.in_flight):
+            if task is not None:
+                task.cancel()
         return await self.stack.__aexit__(*args)
 
     def __aiter__(self) -> Self:
         return self
 
     async def __anext__(self) -> list[MessageToOrchestrator]:
-        # wait for next batch
-        recs = await self.consumer.getmany(
-            timeout_ms=self.batch_max_ms, max_records=self.batch_max_n
-        )
-        # dedupe messages, eg. if multiple nodes finish around same time
-        uniq = set(msg.value for msgs in recs.values() for msg in msgs)
-        msgs: list[MessageToOrchestrator] = [serde.loads(msg) for msg in uniq]
-        # process batch
-        await asyncio.gather(*(self.each(msg) for msg in msgs))
-        # commit offsets
-        await self.consumer.commit()
-        # return message
-        return msgs
+        while True:
+            # fetch more messages while there's room for them, in the background
+            if self.fetching is None and len(self.in_flight) < self.max_in_flight:
+                self.fetching = asyncio.create_task(
+                    self.consumer.getmany(
+                        timeout_ms=self.batch_max_ms,
+                        max_records=min(
+                            self.batch_max_n, self.max_in_flight - len(self.in_flight)
+                        ),
+                    )
+                )
+            # wait for next batch, or for any message to finish processing
+            await asyncio.wait(
+                (self.fetching, *self.in_flight) if self.fetching else self.in_flight,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            idle = False
+            if self.fetching is not None and self.fetching.done():
+                recs = self.fetching.result()
+                self.fetching = None
+                idle = not any(recs.values())
+                # start processing, without waiting for other messages
+                for value, records in dedupe_records(recs).items():
+                    msg: MessageToOrchestrator = serde.loads(value)
+                    for tp, offset in records:
+                        self.offsets.start(tp, offset)
+                    self.in_flight[asyncio.create_task(self.each(msg))] = (
+                        records,
+                        msg,
+                    )
+            # collect finished messages
+            if finished := [t for t in self.in_flight if t.done()]:
+                msgs: list[MessageToOrchestrator] = []
+                failed = []
+                for task in finished:
+                    records, msg = self.in_flight.pop(task)
+                    if task.cancelled() or task.exception() is not None:
+                        # not committed, so the message is consumed again
+                        failed.append(task)
+                    else:
+                        for tp, offset in records:
+                            self.offsets.finish(tp, offset)
+                        msgs.append(msg)
+                # commit offsets, up to the first unfinished message in each partition
+                if offsets := self.offsets.to_commit():
+                    await self.consumer.commit(offsets)
+                for task in failed:
+                    task.result()
+                # return finished messages
+                return msgs
+            elif idle and not self.in_flight:
+                return []
+
+    def _dumps(self, topic: str, value: Any) -> bytes:
+        return serde.dumps(value, self.wire_formats.get(topic, serde.JSON))
+
+    def metrics(self) -> dict[str, Any]:
+        """Return the number of messages being processed, and per partition the
+        fetched and committed offsets, and the lag if the consumer reports it."""
+        metrics = self.offsets.metrics(getattr(self.consumer, "highwater", None))
+        if self.cache is not None:
+            metrics["checkpoint_cache"] = self.cache.metrics()
+        return metrics
+
+    def on_partitions_revoked(self, revoked: Collection[TopicPartition]) -> None:
+        """Clear the checkpoint cache, as other orchestrators may now process
+        messages for threads it holds. Must be called by custom consumers when
+        partitions are revoked, if the cache is enabled."""
+        if self.cache is not None:
+            self.cache.clear()
 
     async def each(self, msg: MessageToOrchestrator) -> None:
         try:
@@ -124,12 +274,13 @@ class AsyncKafkaOrchestrator(AbstractAsyncContextManager):
         except Exception as exc:
             fut = await self.producer.send(
                 self.topics.error,
-                value=serde.dumps(
+                value=self._dumps(
+                    self.topics.error,
                     ErrorMessage(
                         topic=self.topics.orchestrator,
                         msg=msg,
                         error=repr(exc),
-                    )
+                    ),
                 ),
             )
             await fut
@@ -147,14 +298,16 @@ class AsyncKafkaOrchestrator(AbstractAsyncContextManager):
         else:
             graph = self.graph
         # process message
+        checkpointer = self._checkpointer(msg)
         async with AsyncPregelLoop(
             msg["input"],
             config=ensure_config(msg["config"]),
             stream=None,
             store=self.graph.store,
-            checkpointer=self.graph.checkpointer,
+            checkpointer=checkpointer,
             nodes=graph.nodes,
             specs=graph.channels,
+            trigger_to_nodes=graph.trigger_to_nodes,
             output_keys=graph.output_channels,
             stream_keys=graph.stream_channels,
             interrupt_after=graph.interrupt_after_nodes,
@@ -176,47 +329,54 @@ class AsyncKafkaOrchestrator(AbstractAsyncContextManager):
                             CONFIG_KEY_ENSURE_LATEST: True,
                         },
                     )
-                    # send messages to executor
+                    # send messages to executor, with up to dispatch_batch_size
+                    # tasks each
                     futures = await asyncio.gather(
                         *(
                             self.producer.send(
                                 self.topics.executor,
-                                value=serde.dumps(
-                                    MessageToExecutor(
-                                        config=config,
-                                        task=ExecutorTask(id=task.id, path=task.path),
-                                        finally_send=msg.get("finally_send"),
-                                    )
+                                value=self._dumps(
+                                    self.topics.executor,
+                                    executor_message(
+                                        config,
+                                        batch,
+                                        msg.get("finally_send"),
+                                        self.cache is not None,
+                                    ),
                                 ),
                             )
-                            for task in new_tasks
+                            for batch in batch_tasks(
+                                new_tasks, self.dispatch_batch_size
+                            )
                         )
                     )
                     # wait for messages to be sent
                     await asyncio.gather(*futures)
-                    # mark as scheduled
-                    for task in new_tasks:
-                        loop.put_writes(
-                            task.id,
-                            [
-                                (
-                                    SCHEDULED,
-                                    max(
-                                        loop.checkpoint["versions_seen"]
-                                        .get(INTERRUPT, {})
-                                        .values(),
-                                        default=None,
-                                    ),
-                                )
-                            ],
-                        )
+                    # mark as scheduled, saving all markers at once
+                    scheduled = max(
+                        loop.checkpoint["versions_seen"].get(INTERRUPT, {}).values(),
+                        default=None,
+                    )
+                    await checkpointer.aput_writes_batch(
+                        loop.checkpoint_config,
+                        [
+                            (
+                                task.id,
+                                task_path_str(task.path),
+                                [(SCHEDULED, scheduled)],
+                            )
+                            for task in new_tasks
+                        ],
+                    )
             elif loop.status == "done" and msg.get("finally_send"):
                 # send any finally_send messages
                 futs = await asyncio.gather(
                     *(
                         self.producer.send(
                             m["topic"],
-                            value=serde.dumps(m["value"]) if m.get("value") else None,
+                            value=self._dumps(m["topic"], m["value"])
+                            if m.get("value")
+                            else None,
                             key=serde.dumps(m["key"]) if m.get("key") else None,
                         )
                         for m in msg["finally_send"]
@@ -225,6 +385,19 @@ class AsyncKafkaOrchestrator(AbstractAsyncContextManager):
                 # wait for messages to be sent
                 await asyncio.gather(*futs)
 
+    def _checkpointer(
+        self, msg: MessageToOrchestrator
+    ) -> Optional[BaseCheckpointSaver]:
+        if self.cache is None:
+            return self.graph.checkpointer
+        if msg.get("writes") is not None:
+            # add the writes saved by the executor to the cached checkpoint
+            self.cache.put_task_writes(msg["config"], msg["writes"])
+        else:
+            # the thread may have been updated other than by an executor task
+            self.cache.invalidate(msg["config"])
+        return CachedCheckpointSaver(self.graph.checkpointer, self.cache)
+
 
 class KafkaOrchestrator(AbstractContextManager):
     consumer: Consumer
@@ -239,9 +412,13 @@ class KafkaOrchestrator(AbstractContextManager):
         topics: Topics,
         batch_max_n: int = 10,
         batch_max_ms: int = 1000,
+        max_in_flight: int = 10,
         retry_policy: Optional[RetryPolicy] = None,
         consumer: Optional[Consumer] = None,
         producer: Optional[Producer] = None,
+        checkpoint_cache_size: Optional[int] = None,
+        dispatch_batch_size: int = 1,
+        wire_formats: Optional[Mapping[str, serde.WireFormat]] = None,
         **kwargs: Any,
     ) -> None:
         self.graph = graph
@@ -252,23 +429,48 @@ class KafkaOrchestrator(AbstractContextManager):
         self.producer = producer
         self.batch_max_n = batch_max_n
         self.batch_max_ms = batch_max_ms
+        self.max_in_flight = max_in_flight
+        self.dispatch_batch_size = dispatch_batch_size
         self.retry_policy = retry_policy
+        # topic -> format of messages sent to it, JSON by default
+        self.wire_formats = wire_formats or {}
+        self.offsets = OffsetTracker()
+        # a custom consumer must call on_partitions_revoked for the cache to be
+        # safe to use, so it's only enabled by default with the default consumer
+        if checkpoint_cache_size is None:
+            checkpoint_cache_size = (
+                DEFAULT_CHECKPOINT_CACHE_SIZE if consumer is None else 0
+            )
+        self.cache = (
+            CheckpointCache(graph.checkpointer.serde, checkpoint_cache_size)
+            if checkpoint_cache_size > 0 and graph.checkpointer
+            else None
+        )
+        self.in_flight: dict[
+            concurrent.futures.Future,
+            tuple[list[tuple[TopicPartition, int]], MessageToOrchestrator],
+        ] = {}
 
     def __enter__(self) -> Self:
         self.subgraphs = dict(self.graph.get_subgraphs(recurse=True))
         self.submit = self.stack.enter_context(BackgroundExecutor({}))
         if self.consumer is None:
-            from langgraph.scheduler.kafka.default_sync import DefaultConsumer
-
-            self.consumer = self.stack.enter_context(
-                DefaultConsumer(
-                    self.topics.orchestrator,
-                    auto_offset_reset="earliest",
-                    group_id="orchestrator",
-                    enable_auto_commit=False,
-                    **self.kwargs,
-                )
+            from langgraph.scheduler.kafka.default_sync import (
+                DefaultConsumer,
+                DefaultRebalanceListener,
+            )
+
+            consumer = DefaultConsumer(
+                auto_offset_reset="earliest",
+                group_id="orchestrator",
+                enable_auto_commit=False,
+                **self.kwargs,
             )
+            consumer.subscribe(
+                [self.topics.orchestrator],
+                listener=DefaultRebalanceListener(self.on_partitions_revoked),
+            )
+            self.consumer = self.stack.enter_context(consumer)
         if self.producer is None:
             from langgraph.scheduler.kafka.default_sync import DefaultProducer
 
@@ -286,19 +488,73 @@ class KafkaOrchestrator(AbstractContextManager):
         return self
 
     def __next__(self) -> list[MessageToOrchestrator]:
-        # wait for next batch
-        recs = self.consumer.getmany(
-            timeout_ms=self.batch_max_ms, max_records=self.batch_max_n
-        )
-        # dedupe messages, eg. if multiple nodes finish around same time
-        uniq = set(msg.value for msgs in recs.values() for msg in msgs)
-        msgs: list[MessageToOrchestrator] = [serde.loads(msg) for msg in uniq]
-        # process batch
-        concurrent.futures.wait(self.submit(self.each, msg) for msg in msgs)
-        # commit offsets
-        self.consumer.commit()
-        # return message
-        return msgs
+        while True:
+            idle = False
+            # fetch more messages while there's room for them
+            if len(self.in_flight) < self.max_in_flight:
+                recs = self.consumer.getmany(
+                    # don't block on fetching while other messages are processing
+                    timeout_ms=0 if self.in_flight else self.batch_max_ms,
+                    max_records=min(
+                        self.batch_max_n, self.max_in_flight - len(self.in_flight)
+                    ),
+                )
+                idle = not any(recs.values())
+                # start processing, without waiting for other messages
+                for value, records in dedupe_records(recs).items():
+                    msg: MessageToOrchestrator = serde.loads(value)
+                    for tp, offset in records:
+                        self.offsets.start(tp, offset)
+                    self.in_flight[self.submit(self.each, msg)] = (records, msg)
+            # wait for any message to finish, polling for more if there's room
+            if self.in_flight:
+                concurrent.futures.wait(
+                    self.in_flight,
+                    timeout=None
+                    if len(self.in_flight) >= self.max_in_flight
+                    else min(self.batch_max_ms, POLL_INTERVAL_MS) / 1000,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+            # collect finished messages
+            if finished := [f for f in self.in_flight if f.done()]:
+                msgs: list[MessageToOrchestrator] = []
+                failed = []
+                for fut in finished:
+                    records, msg = self.in_flight.pop(fut)
+                    if fut.cancelled() or fut.exception() is not None:
+                        # not committed, so the message is consumed again
+                        failed.append(fut)
+                    else:
+                        for tp, offset in records:
+                            self.offsets.finish(tp, offset)
+                        msgs.append(msg)
+                # commit offsets, up to the first unfinished message in each partition
+                if offsets := self.offsets.to_commit():
+                    self.consumer.commit(offsets)
+                for fut in failed:
+                    fut.result()
+                # return finished messages
+                return msgs
+            elif idle and not self.in_flight:
+                return []
+
+    def _dumps(self, topic: str, value: Any) -> bytes:
+        return serde.dumps(value, self.wire_formats.get(topic, serde.JSON))
+
+    def metrics(self) -> dict[str, Any]:
+        """Return the number of messages being processed, and per partition the
+        fetched and committed offsets, and the lag if the consumer reports it."""
+        metrics = self.offsets.metrics(getattr(self.consumer, "highwater", None))
+        if self.cache is not None:
+            metrics["checkpoint_cache"] = self.cache.metrics()
+        return metrics
+
+    def on_partitions_revoked(self, revoked: Collection[TopicPartition]) -> None:
+        """Clear the checkpoint cache, as other orchestrators may now process
+        messages for threads it holds. Must be called by custom consumers when
+        partitions are revoked, if the cache is enabled."""
+        if self.cache is not None:
+            self.cache.clear()
 
     def each(self, msg: MessageToOrchestrator) -> None:
         try:
@@ -310,12 +566,13 @@ class KafkaOrchestrator(AbstractContextManager):
         except Exception as exc:
             fut = self.producer.send(
                 self.topics.error,
-                value=serde.dumps(
+                value=self._dumps(
+                    self.topics.error,
                     ErrorMessage(
                         topic=self.topics.orchestrator,
                         msg=msg,
                         error=repr(exc),
-                    )
+                    ),
                 ),
             )
             fut.result()
@@ -333,14 +590,16 @@ class KafkaOrchestrator(AbstractContextManager):
         else:
             graph = self.graph
         # process message
+        checkpointer = self._checkpointer(msg)
         with SyncPregelLoop(
             msg["input"],
             config=ensure_config(msg["config"]),
             stream=None,
             store=self.graph.store,
-            checkpointer=self.graph.checkpointer,
+            checkpointer=checkpointer,
             nodes=graph.nodes,
             specs=graph.channels,
+            trigger_to_nodes=graph.trigger_to_nodes,
             output_keys=graph.output_channels,
             stream_keys=graph.stream_channels,
             interrupt_after=graph.interrupt_after_nodes,
@@ -362,47 +621,65 @@ class KafkaOrchestrator(AbstractContextManager):
                             CONFIG_KEY_ENSURE_LATEST: True,
                         },
                     )
-                    # send messages to executor
+                    # send messages to executor, with up to dispatch_batch_size
+                    # tasks each
                     futures = [
                         self.producer.send(
                             self.topics.executor,
-                            value=serde.dumps(
-                                MessageToExecutor(
-                                    config=config,
-                                    task=ExecutorTask(id=task.id, path=task.path),
-                                    finally_send=msg.get("finally_send"),
-                                )
+                            value=self._dumps(
+                                self.topics.executor,
+                                executor_message(
+                                    config,
+                                    batch,
+                                    msg.get("finally_send"),
+                                    self.cache is not None,
+                                ),
                             ),
                         )
-                        for task in new_tasks
+                        for batch in batch_tasks(new_tasks, self.dispatch_batch_size)
                     ]
                     # wait for messages to be sent
                     concurrent.futures.wait(futures)
-                    # mark as scheduled
-                    for task in new_tasks:
-                        loop.put_writes(
-                            task.id,
-                            [
-                                (
-                                    SCHEDULED,
-                                    max(
-                                        loop.checkpoint["versions_seen"]
-                                        .get(INTERRUPT, {})
-                                        .values(),
-                                        default=None,
-                                    ),
-                                )
-                            ],
-                        )
+                    # mark as scheduled, saving all markers at once
+                    scheduled = max(
+                        loop.checkpoint["versions_seen"].get(INTERRUPT, {}).values(),
+                        default=None,
+                    )
+                    checkpointer.put_writes_batch(
+                        loop.checkpoint_config,
+                        [
+                            (
+                                task.id,
+                                task_path_str(task.path),
+                                [(SCHEDULED, scheduled)],
+                            )
+                            for task in new_tasks
+                        ],
+                    )
             elif loop.status == "done" and msg.get("finally_send"):
                 # schedule any finally_send msgs
                 futs = [
                     self.producer.send(
                         m["topic"],
-                        value=serde.dumps(m["value"]) if m.get("value") else None,
+                        value=self._dumps(m["topic"], m["value"])
+                        if m.get("value")
+                        else None,
                         key=serde.dumps(m["key"]) if m.get("key") else None,
                     )
                     for m in msg["finally_send"]
                 ]
                 # wait for messages to be sent
                 concurrent.futures.wait(futs)
+
+    def _checkpointer(
+        self, msg: MessageToOrchestrator
+    ) -> Optional[BaseCheckpointSaver]:
+        if self.cache is None:
+            return self.graph.checkpointer
+        if msg.get("writes") is not None:
+            # add the writes saved by the executor to the cached checkpoint
+            self.cache.put_task_writes(msg["config"], msg["writes"])
+        else:
+            # the thread may have been updated other than by an executor task
+            self.cache.invalidate(msg["config"])
+        return CachedCheckpointSaver(self.graph.checkpointer, self.cache)
@@ -1,20 +1,110 @@
-from typing import Any
+from typing import Any, Literal, NamedTuple, Optional
 
+import msgpack  # type: ignore[import-untyped]
 import orjson
 
-from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.serde.jsonplus import (
+    JsonPlusSerializer,
+    _msgpack_default,
+    _msgpack_ext_hook,
+)
 
 SERIALIZER = JsonPlusSerializer()
 
+# first byte of binary messages, never used by msgpack and not valid JSON
+MAGIC = b"\xc1"
+# version of the binary envelope, MAGIC + version + encoding + compression
+VERSION = 1
+ENCODINGS = ("json", "msgpack")
+COMPRESSIONS = (None, "zstd", "lz4")
+
+
+class WireFormat(NamedTuple):
+    """How messages sent to a topic are encoded. Consumers read messages in any
+    format, so producers should only switch a topic to a new format once all of
+    its consumers have been upgraded."""
+
+    encoding: Literal["json", "msgpack"] = "json"
+    "JSON drops values it can't serialize, eg. functions, msgpack raises TypeError"
+    compression: Optional[Literal["zstd", "lz4"]] = None
+    "Compression for messages larger than `compress_min_bytes`"
+    compress_min_bytes: int = 4096
+
+
+JSON = WireFormat()
+
 
 def loads(v: bytes) -> Any:
-    return SERIALIZER.loads(v)
+    if v[:1] != MAGIC:
+        return SERIALIZER.loads(v)
+    if len(v) < 4 or v[1] > VERSION:
+        raise ValueError(f"Unsupported message version {v[1:2]!r}")
+    encoding, compression, data = ENCODINGS[v[2]], COMPRESSIONS[v[3]], v[4:]
+    if compression == "zstd":
+        data = _zstd().ZstdDecompressor().decompress(data)
+    elif compression == "lz4":
+        data = _lz4().decompress(data)
+    if encoding == "msgpack":
+        return msgpack.unpackb(data, ext_hook=_msgpack_ext_hook, strict_map_key=False)
+    else:
+        return SERIALIZER.loads(data)
 
 
-def dumps(v: Any) -> bytes:
-    return orjson.dumps(v, default=_default)
+def dumps(v: Any, format: WireFormat = JSON) -> bytes:
+    if format.encoding == "msgpack":
+        # unlike JSON, values that can't be serialized raise instead of being dropped
+        data = msgpack.packb(v, default=_msgpack_default)
+    else:
+        data = orjson.dumps(v, default=_default)
+    if format.compression is not None and len(data) >= format.compress_min_bytes:
+        if format.compression == "zstd":
+            data = _zstd().ZstdCompressor().compress(data)
+        else:
+            data = _lz4().compress(data)
+        compression = format.compression
+    elif format.encoding == "json":
+        # plain JSON is sent as is, readable by consumers of any version
+        return data
+    else:
+        compression = None
+    return (
+        MAGIC
+        + bytes(
+            (VERSION, ENCODINGS.index(format.encoding), COMPRESSIONS.index(compression))
+        )
+        + data
+    )
+
+
+def dumps_input(v: Any, format: WireFormat, serde: Any = SERIALIZER) -> Any:
+    """Prepare a graph input to be included in a message encoded with `format`.
+    JSON messages embed it as serialized by `serde`, as the message encoding
+    drops objects it doesn't know about."""
+    if format.encoding == "json":
+        return orjson.Fragment(serde.dumps(v))
+    return v
 
 
 def _default(v: Any) -> Any:
     # things we don't know how to serialize (eg. functions) ignore
     return None
+
+
+def _zstd() -> Any:
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError:
+        raise ImportError(
+            "zstandard is not installed. Please install it with `pip install zstandard`."
+        ) from None
+    return zstandard
+
+
+def _lz4() -> Any:
+    try:
+        import lz4.frame  # type: ignore[import-not-found]
+    except ImportError:
+        raise ImportError(
+            "lz4 is not installed. Please install it with `pip install lz4`."
+        ) from None
+    return lz4.frame
@@ -3,6 +3,7 @@ import concurrent.futures
 from typing import Any, NamedTuple, Optional, Protocol, Sequence, TypedDict, Union
 
 from langchain_core.runnables import RunnableConfig
+from typing_extensions import NotRequired
 
 
 class Topics(NamedTuple):
@@ -17,10 +18,23 @@ class Sendable(TypedDict):
     key: Optional[Any]
 
 
+class TaskWrite(TypedDict):
+    task_id: str
+    idx: int
+    "The index of the write, as saved by the checkpointer"
+    channel: str
+    type: str
+    "The type of the serialized value"
+    value: str
+    "The serialized value, base64-encoded"
+
+
 class MessageToOrchestrator(TypedDict):
     input: Optional[dict[str, Any]]
     config: RunnableConfig
     finally_send: Optional[Sequence[Sendable]]
+    writes: NotRequired[Optional[list[TaskWrite]]]
+    "Writes saved by the task that finished, if small enough to send"
 
 
 class ExecutorTask(TypedDict):
@@ -30,8 +44,12 @@ class ExecutorTask(TypedDict):
 
 class MessageToExecutor(TypedDict):
     config: RunnableConfig
-    task: ExecutorTask
+    task: NotRequired[ExecutorTask]
+    tasks: NotRequired[Sequence[ExecutorTask]]
+    "Tasks dispatched together, sharing the same config, instead of `task`"
     finally_send: Optional[Sequence[Sendable]]
+    send_writes: NotRequired[bool]
+    "Whether to send the saved writes back, set if the orchestrator caches checkpoints"
 
 
 class ErrorMessage(TypedDict):
@@ -67,7 +85,7 @@ class Consumer(Protocol):
         self, timeout_ms: int, max_records: int
     ) -> dict[TopicPartition, Sequence[ConsumerRecord]]: ...
 
-    def commit(self) -> None: ...
+    def commit(self, offsets: Optional[dict[TopicPartition, int]] = None) -> None: ...
 
 
 class AsyncConsumer(Protocol):
@@ -75,7 +93,9 @@ class AsyncConsumer(Protocol):
         self, timeout_ms: int, max_records: int
     ) -> dict[TopicPartition, Sequence[ConsumerRecord]]: ...
 
-    async def commit(self) -> None: ...
+    async def commit(
+        self, offsets: Optional[dict[TopicPartition, int]] = None
+    ) -> None: ...
 
 
 class Producer(Protocol):
@@ -15,7 +15,7 @@ from langgraph.graph.state import StateGraph
 from langgraph.pregel import Pregel
 from langgraph.scheduler.kafka import serde
 from langgraph.scheduler.kafka.types import MessageToOrchestrator, Topics
-from tests.any import AnyDict
+from tests.any import AnyDict, AnyList
 from tests.drain import drain_topics_async
 
 pytestmark = pytest.mark.anyio
@@ -136,6 +136,7 @@ async def test_fanout_graph(topics: Topics, acheckpointer: BaseCheckpointSaver)
                 "tags": [],
             },
             "input": None,
+            "writes": AnyList(),
             "finally_send": None,
         }
         for c in reversed(history)
@@ -161,6 +162,7 @@ async def test_fanout_graph(topics: Topics, acheckpointer: BaseCheckpointSaver)
                 "id": t.id,
                 "path": list(t.path),
             },
+            "send_writes": True,
             "finally_send": None,
         }
         for c in reversed(history)
@@ -218,6 +220,7 @@ async def test_fanout_graph_w_interrupt(
                 "tags": [],
             },
             "input": None,
+            "writes": AnyList(),
             "finally_send": None,
         }
         for c in reversed(history[1:])  # the last one wasn't executed
@@ -245,6 +248,7 @@ async def test_fanout_graph_w_interrupt(
                 "id": t.id,
                 "path": list(t.path),
             },
+            "send_writes": True,
             "finally_send": None,
         }
         for c in reversed(history[1:])  # the last one wasn't executed
@@ -13,7 +13,7 @@ from langgraph.pregel import Pregel
 from langgraph.scheduler.kafka import serde
 from langgraph.scheduler.kafka.default_sync import DefaultProducer
 from langgraph.scheduler.kafka.types import MessageToOrchestrator, Topics
-from tests.any import AnyDict
+from tests.any import AnyDict, AnyList
 from tests.drain import drain_topics
 
 
@@ -133,6 +133,7 @@ def test_fanout_graph(topics: Topics, checkpointer: BaseCheckpointSaver) -> None
                 "tags": [],
             },
             "input": None,
+            "writes": AnyList(),
             "finally_send": None,
         }
         for c in reversed(history)
@@ -158,6 +159,7 @@ def test_fanout_graph(topics: Topics, checkpointer: BaseCheckpointSaver) -> None
                 "id": t.id,
                 "path": list(t.path),
             },
+            "send_writes": True,
             "finally_send": None,
         }
         for c in reversed(history)
@@ -216,6 +218,7 @@ def test_fanout_graph_w_interrupt(
                 "tags": [],
             },
             "input": None,
+            "writes": AnyList(),
             "finally_send": None,
         }
         for c in reversed(history[1:])  # the last one wasn't executed
@@ -243,6 +246,7 @@ def test_fanout_graph_w_interrupt(
                 "id": t.id,
                 "path": list(t.path),
             },
+            "send_writes": True,
             "finally_send": None,
         }
         for c in reversed(history[1:])  # the last one wasn't executed
@@ -0,0 +1,111 @@
+from typing import NamedTuple
+
+from langgraph.scheduler.kafka.offsets import OffsetTracker
+
+
+class TP(NamedTuple):
+    topic: str
+    partition: int
+
+
+P0 = TP("topic", 0)
+P1 = TP("topic", 1)
+
+
+def test_in_order() -> None:
+    tracker = OffsetTracker()
+    assert tracker.to_commit() == {}
+    tracker.start(P0, 0)
+    tracker.start(P0, 1)
+    assert tracker.in_flight == 2
+    assert tracker.to_commit() == {}
+
+    tracker.finish(P0, 0)
+    assert tracker.to_commit() == {P0: 1}
+    # offsets are only returned once
+    assert tracker.to_commit() == {}
+    tracker.finish(P0, 1)
+    assert tracker.to_commit() == {P0: 2}
+    assert tracker.in_flight == 0
+
+
+def test_out_of_order() -> None:
+    tracker = OffsetTracker()
+    for offset in range(4):
+        tracker.start(P0, offset)
+
+    # finished records behind an unfinished one aren't committed
+    tracker.finish(P0, 2)
+    tracker.finish(P0, 1)
+    assert tracker.to_commit() == {}
+    assert tracker.in_flight == 2
+
+    # finishing the oldest record commits every finished record after it
+    tracker.finish(P0, 0)
+    assert tracker.to_commit() == {P0: 3}
+    tracker.finish(P0, 3)
+    assert tracker.to_commit() == {P0: 4}
+    assert tracker.in_flight == 0
+
+
+def test_gaps() -> None:
+    # offsets may skip values, eg. in compacted or transactional topics
+    tracker = OffsetTracker()
+    tracker.start(P0, 10)
+    tracker.start(P0, 15)
+    tracker.start(P0, 20)
+
+    tracker.finish(P0, 15)
+    assert tracker.to_commit() == {}
+    tracker.finish(P0, 10)
+    # the next offset to consume is the oldest unfinished record
+    assert tracker.to_commit() == {P0: 20}
+    tracker.finish(P0, 20)
+    assert tracker.to_commit() == {P0: 21}
+
+    # records fetched after a commit continue from there
+    tracker.start(P0, 30)
+    tracker.finish(P0, 30)
+    assert tracker.to_commit() == {P0: 31}
+
+
+def test_partitions() -> None:
+    tracker = OffsetTracker()
+    tracker.start(P0, 0)
+    tracker.start(P0, 1)
+    tracker.start(P1, 5)
+    tracker.start(P1, 6)
+
+    # each partition is committed independently
+    tracker.finish(P1, 5)
+    tracker.finish(P0, 1)
+    assert tracker.to_commit() == {P1: 6}
+    tracker.finish(P0, 0)
+    tracker.finish(P1, 6)
+    assert tracker.to_commit() == {P0: 2, P1: 7}
+    assert tracker.in_flight == 0
+
+
+def test_metrics() -> None:
+    tracker = OffsetTracker()
+    tracker.start(P0, 0)
+    tracker.start(P0, 1)
+    tracker.start(P0, 2)
+    tracker.start(P1, 7)
+    tracker.finish(P0, 0)
+    tracker.finish(P0, 2)
+    tracker.finish(P1, 7)
+
+    assert tracker.metrics() == {
+        "in_flight": 1,
+        "partitions": {
+            "topic:0": {"in_flight": 1, "fetched": 3, "committed": 1},
+            "topic:1": {"in_flight": 0, "fetched": 8, "committed": 8},
+        },
+    }
+    # lag is measured from the oldest unfinished record
+    highwater = {P0: 10, P1: 8}
+    assert tracker.metrics(highwater.get)["partitions"] == {
+        "topic:0": {"in_flight": 1, "fetched": 3, "committed": 1, "lag": 9},
+        "topic:1": {"in_flight": 0, "fetched": 8, "committed": 8, "lag": 0},
+    }
@@ -15,7 +15,7 @@ from langgraph.graph.state import CompiledStateGraph, StateGraph
 from langgraph.scheduler.kafka import serde
 from langgraph.scheduler.kafka.types import MessageToOrchestrator, Topics
 from langgraph.types import Command, Send
-from tests.any import AnyDict
+from tests.any import AnyDict, AnyList
 from tests.drain import drain_topics_async
 
 pytestmark = pytest.mark.anyio
@@ -131,6 +131,7 @@ async def test_push_graph(topics: Topics, acheckpointer: BaseCheckpointSaver) ->
                 "tags": [],
             },
             "input": None,
+            "writes": AnyList(),
             "finally_send": None,
         }
         for c in reversed(history)
@@ -156,6 +157,7 @@ async def test_push_graph(topics: Topics, acheckpointer: BaseCheckpointSaver) ->
                 "id": t.id,
                 "path": _convert_path(t.path),
             },
+            "send_writes": True,
             "finally_send": None,
         }
         for c in reversed(history)
@@ -15,7 +15,7 @@ from langgraph.scheduler.kafka import serde
 from langgraph.scheduler.kafka.default_sync import DefaultProducer
 from langgraph.scheduler.kafka.types import MessageToOrchestrator, Topics
 from langgraph.types import Command, Send
-from tests.any import AnyDict
+from tests.any import AnyDict, AnyList
 from tests.drain import drain_topics
 
 pytestmark = pytest.mark.anyio
@@ -132,6 +132,7 @@ def test_push_graph(topics: Topics, acheckpointer: BaseCheckpointSaver) -> None:
                 "tags": [],
             },
             "input": None,
+            "writes": AnyList(),
             "finally_send": None,
         }
         for c in reversed(history)
@@ -157,6 +158,7 @@ def test_push_graph(topics: Topics, acheckpointer: BaseCheckpointSaver) -> None:
                 "id": t.id,
                 "path": _convert_path(t.path),
             },
+            "send_writes": True,
             "finally_send": None,
         }
         for c in reversed(history)
@@ -0,0 +1,102 @@
+import sys
+from datetime import datetime, timezone
+
+import orjson
+import pytest
+
+from langgraph.scheduler.kafka import serde
+from langgraph.scheduler.kafka.serde import MAGIC, WireFormat
+
+MESSAGE = {
+    "input": {"messages": ["hello"] * 3},
+    "config": {"configurable": {"thread_id": "1", "checkpoint_ns": ""}},
+    "finally_send": None,
+}
+# large enough to be compressed with the default compress_min_bytes
+LARGE = {"input": {"text": "lorem ipsum " * 1000}, "config": {}}
+
+
+def test_json() -> None:
+    # plain JSON is sent without the binary envelope
+    data = serde.dumps(MESSAGE)
+    assert data == orjson.dumps(MESSAGE)
+    assert serde.loads(data) == MESSAGE
+    assert serde.dumps(LARGE, WireFormat(compress_min_bytes=0)) == orjson.dumps(LARGE)
+    # things that can't be serialized are dropped
+    assert serde.loads(serde.dumps({"fn": lambda: None})) == {"fn": None}
+
+
+def test_legacy_json() -> None:
+    # messages sent by producers of previous versions
+    assert serde.loads(b'{"input":null,"config":{}}') == {"input": None, "config": {}}
+
+
+def test_json_input() -> None:
+    value = {"at": datetime(2024, 1, 1, tzinfo=timezone.utc)}
+    message = {"input": serde.dumps_input(value, serde.JSON), "config": {}}
+    assert serde.loads(serde.dumps(message)) == {"input": value, "config": {}}
+
+
+def test_msgpack() -> None:
+    format = WireFormat(encoding="msgpack")
+    data = serde.dumps(MESSAGE, format)
+    assert data[:4] == MAGIC + bytes((serde.VERSION, 1, 0))
+    assert serde.loads(data) == MESSAGE
+
+    # values are sent as is, using the extension types of the checkpoint serializer
+    value = {"at": datetime(2024, 1, 1, tzinfo=timezone.utc), 1: "int key"}
+    assert serde.dumps_input(value, format) is value
+    assert serde.loads(serde.dumps(value, format)) == value
+
+    # things that can't be serialized raise, instead of being dropped
+    with pytest.raises(TypeError):
+        serde.dumps({"fn": lambda: None}, format)
+
+
+@pytest.mark.parametrize("encoding", ["json", "msgpack"])
+@pytest.mark.parametrize("compression", ["zstd", "lz4"])
+def test_compression(encoding: str, compression: str) -> None:
+    pytest.importorskip("zstandard" if compression == "zstd" else "lz4.frame")
+    format = WireFormat(encoding=encoding, compression=compression)
+    data = serde.dumps(LARGE, format)
+    assert data[:4] == MAGIC + bytes(
+        (
+            serde.VERSION,
+            serde.ENCODINGS.index(encoding),
+            serde.COMPRESSIONS.index(compression),
+        )
+    )
+    assert len(data) < len(orjson.dumps(LARGE))
+    assert serde.loads(data) == LARGE
+
+    # small messages aren't compressed
+    data = serde.dumps(MESSAGE, format)
+    if encoding == "json":
+        assert data == orjson.dumps(MESSAGE)
+    else:
+        assert data[:4] == MAGIC + bytes((serde.VERSION, 1, 0))
+    assert serde.loads(data) == MESSAGE
+
+
+@pytest.mark.parametrize(
+    "compression,module", [("zstd", "zstandard"), ("lz4", "lz4.frame")]
+)
+def test_compression_unavailable(
+    monkeypatch: pytest.MonkeyPatch, compression: str, module: str
+) -> None:
+    monkeypatch.setitem(sys.modules, module, None)
+    format = WireFormat(compression=compression)
+    with pytest.raises(ImportError, match=f"{module.split('.')[0]} is not installed"):
+        serde.dumps(LARGE, format)
+    # messages too small to be compressed don't need it
+    assert serde.loads(serde.dumps(MESSAGE, format)) == MESSAGE
+    # nor do messages sent without compression
+    data = MAGIC + bytes((serde.VERSION, 0, 0)) + orjson.dumps(MESSAGE)
+    assert serde.loads(data) == MESSAGE
+
+
+def test_unsupported_version() -> None:
+    with pytest.raises(ValueError, match="Unsupported message version"):
+        serde.loads(MAGIC + bytes((serde.VERSION + 1, 0, 0)) + b"{}")
+    with pytest.raises(ValueError, match="Unsupported message version"):
+        serde.loads(MAGIC + bytes((serde.VERSION,)))
@@ -15,7 +15,7 @@ from langgraph.graph.state import StateGraph
 from langgraph.pregel import Pregel
 from langgraph.scheduler.kafka import serde
 from langgraph.scheduler.kafka.types import MessageToOrchestrator, Topics
-from tests.any import AnyDict
+from tests.any import AnyDict, AnyList
 from tests.drain import drain_topics_async
 from tests.messages import _AnyIdAIMessage, _AnyIdHumanMessage
 
@@ -174,6 +174,7 @@ async def test_subgraph_w_interrupt(
                         "tags": [],
                     },
                     "input": None,
+                    "writes": AnyList(),
                     "finally_send": None,
                 }
                 for c in reversed(history[1:])  # the last one wasn't executed
@@ -249,6 +250,7 @@ async def test_subgraph_w_interrupt(
                                     "id": history[0].tasks[0].id,
                                     "path": list(history[0].tasks[0].path),
                                 },
+                                "send_writes": True,
                             },
                         }
                     ],
@@ -292,6 +294,7 @@ async def test_subgraph_w_interrupt(
                         "tags": [],
                     },
                     "input": None,
+                    "writes": AnyList(),
                     "finally_send": [
                         {
                             "topic": topics.executor,
@@ -317,6 +320,7 @@ async def test_subgraph_w_interrupt(
                                     "id": history[0].tasks[0].id,
                                     "path": list(history[0].tasks[0].path),
                                 },
+                                "send_writes": True,
                             },
                         }
                     ],
@@ -352,6 +356,7 @@ async def test_subgraph_w_interrupt(
                         "id": t.id,
                         "path": list(t.path),
                     },
+                    "send_writes": True,
                     "finally_send": None,
                 }
                 for c in reversed(history)
@@ -398,6 +403,7 @@ async def test_subgraph_w_interrupt(
                         "id": t.id,
                         "path": list(t.path),
                     },
+                    "send_writes": True,
                     "finally_send": [
                         {
                             "topic": topics.executor,
@@ -423,6 +429,7 @@ async def test_subgraph_w_interrupt(
                                     "id": history[0].tasks[0].id,
                                     "path": list(history[0].tasks[0].path),
                                 },
+                                "send_writes": True,
                             },
                         }
                     ],
@@ -508,6 +515,7 @@ async def test_subgraph_w_interrupt(
                         "tags": [],
                     },
                     "input": None,
+                    "writes": AnyList(),
                     "finally_send": [
                         {
                             "topic": topics.executor,
@@ -533,6 +541,7 @@ async def test_subgraph_w_interrupt(
                                     "id": history[1].tasks[0].id,
                                     "path": list(history[1].tasks[0].path),
                                 },
+                                "send_writes": True,
                             },
                         }
                     ],
@@ -576,6 +585,7 @@ async def test_subgraph_w_interrupt(
                         "tags": [],
                     },
                     "input": None,
+                    "writes": AnyList(),
                     "finally_send": [
                         {
                             "topic": topics.executor,
@@ -601,6 +611,7 @@ async def test_subgraph_w_interrupt(
                                     "id": history[1].tasks[0].id,
                                     "path": list(history[1].tasks[0].path),
                                 },
+                                "send_writes": True,
                             },
                         }
                     ],
@@ -626,6 +637,7 @@ async def test_subgraph_w_interrupt(
                         "tags": [],
                     },
                     "input": None,
+                    "writes": AnyList(),
                     "finally_send": None,
                 }
                 for c in reversed(history[:2])
@@ -657,6 +669,7 @@ async def test_subgraph_w_interrupt(
                         "id": t.id,
                         "path": list(t.path),
                     },
+                    "send_writes": True,
                     "finally_send": None,
                 }
                 for c in reversed(history[:2])
@@ -703,6 +716,7 @@ async def test_subgraph_w_interrupt(
                         "id": t.id,
                         "path": list(t.path),
                     },
+                    "send_writes": True,
                     "finally_send": [
                         {
                             "topic": topics.executor,
@@ -728,6 +742,7 @@ async def test_subgraph_w_interrupt(
                                     "id": history[1].tasks[0].id,
                                     "path": list(history[1].tasks[0].path),
                                 },
+                                "send_writes": True,
                             },
                         }
                     ],
@@ -759,6 +774,7 @@ async def test_subgraph_w_interrupt(
                         "id": history[1].tasks[0].id,
                         "path": list(history[1].tasks[0].path),
                     },
+                    "send_writes": True,
                 }
             ]
         )
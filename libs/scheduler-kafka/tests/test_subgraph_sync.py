@@ -15,7 +15,7 @@ from langgraph.pregel import Pregel
 from langgraph.scheduler.kafka import serde
 from langgraph.scheduler.kafka.default_sync import DefaultProducer
 from langgraph.scheduler.kafka.types import MessageToOrchestrator, Topics
-from tests.any import AnyDict
+from tests.any import AnyDict, AnyList
 from tests.drain import drain_topics
 from tests.messages import _AnyIdAIMessage, _AnyIdHumanMessage
 
@@ -173,6 +173,7 @@ def test_subgraph_w_interrupt(
                         "tags": [],
                     },
                     "input": None,
+                    "writes": AnyList(),
                     "finally_send": None,
                 }
                 for c in reversed(history[1:])  # the last one wasn't executed
@@ -248,6 +249,7 @@ def test_subgraph_w_interrupt(
                                     "id": history[0].tasks[0].id,
                                     "path": list(history[0].tasks[0].path),
                                 },
+                                "send_writes": True,
                             },
                         }
                     ],
@@ -291,6 +293,7 @@ def test_subgraph_w_interrupt(
                         "tags": [],
                     },
                     "input": None,
+                    "writes": AnyList(),
                     "finally_send": [
                         {
                             "topic": topics.executor,
@@ -316,6 +319,7 @@ def test_subgraph_w_interrupt(
                                     "id": history[0].tasks[0].id,
                                     "path": list(history[0].tasks[0].path),
                                 },
+                                "send_writes": True,
                             },
                         }
                     ],
@@ -351,6 +355,7 @@ def test_subgraph_w_interrupt(
                         "id": t.id,
                         "path": list(t.path),
                     },
+                    "send_writes": True,
                     "finally_send": None,
                 }
                 for c in reversed(history)
@@ -397,6 +402,7 @@ def test_subgraph_w_interrupt(
                         "id": t.id,
                         "path": list(t.path),
                     },
+                    "send_writes": True,
                     "finally_send": [
                         {
                             "topic": topics.executor,
@@ -422,6 +428,7 @@ def test_subgraph_w_interrupt(
                                     "id": history[0].tasks[0].id,
                                     "path": list(history[0].tasks[0].path),
                                 },
+                                "send_writes": True,
                             },
                         }
                     ],
@@ -506,6 +513,7 @@ def test_subgraph_w_interrupt(
                         "tags": [],
                     },
                     "input": None,
+                    "writes": AnyList(),
                     "finally_send": [
                         {
                             "topic": topics.executor,
@@ -531,6 +539,7 @@ def test_subgraph_w_interrupt(
                                     "id": history[1].tasks[0].id,
                                     "path": list(history[1].tasks[0].path),
                                 },
+                                "send_writes": True,
                             },
                         }
                     ],
@@ -574,6 +583,7 @@ def test_subgraph_w_interrupt(
                         "tags": [],
                     },
                     "input": None,
+                    "writes": AnyList(),
                     "finally_send": [
                         {
                             "topic": topics.executor,
@@ -599,6 +609,7 @@ def test_subgraph_w_interrupt(
                                     "id": history[1].tasks[0].id,
                                     "path": list(history[1].tasks[0].path),
                                 },
+                                "send_writes": True,
                             },
                         }
                     ],
@@ -624,6 +635,7 @@ def test_subgraph_w_interrupt(
                         "tags": [],
                     },
                     "input": None,
+                    "writes": AnyList(),
                     "finally_send": None,
                 }
                 for c in reversed(history[:2])
@@ -655,6 +667,7 @@ def test_subgraph_w_interrupt(
                         "id": t.id,
                         "path": list(t.path),
                     },
+                    "send_writes": True,
                     "finally_send": None,
                 }
                 for c in reversed(history[:2])
@@ -701,6 +714,7 @@ def test_subgraph_w_interrupt(
                         "id": t.id,
                         "path": list(t.path),
                     },
+                    "send_writes": True,
                     "finally_send": [
                         {
                             "topic": topics.executor,
@@ -726,6 +740,7 @@ def test_subgraph_w_interrupt(
                                     "id": history[1].tasks[0].id,
                                     "path": list(history[1].tasks[0].path),
                                 },
+                                "send_writes": True,
                             },
                         }
                     ],
@@ -757,6 +772,7 @@ def test_subgraph_w_interrupt(
                         "id": history[1].tasks[0].id,
                         "path": list(history[1].tasks[0].path),
                     },
+                    "send_writes": True,
                 }
             ]
         )
@@ -0,0 +1,101 @@
+"""Micro-benchmarks for the overhead of the SDK around each request.
+
+Requests are served by an in-memory transport returning canned responses, so
+only the client side is measured: building the request, encoding the body and
+decoding the response. Run with `python bench/__main__.py`.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Coroutine
+
+import httpx
+import orjson
+
+from langgraph_sdk import client as client_module
+from langgraph_sdk.client import LangGraphClient
+
+THREAD_ID = "2f7c3c36-6a9e-4b6d-9f4e-1f6f6a0c7a2e"
+RUN_ID = "1ef2d0f2-3f60-6a0e-8000-8a8e0d6c3a55"
+CALLS = 2000
+CONCURRENCY = 50
+
+
+def state(messages: int) -> dict[str, Any]:
+    return {
+        "values": {
+            "messages": [
+                {"type": "human", "content": "hi?" * 20, "id": str(i)}
+                for i in range(messages)
+            ]
+        },
+        "next": [],
+        "tasks": [],
+        "metadata": {"step": 1},
+        "created_at": "2024-01-01T00:00:00+00:00",
+        "checkpoint": {"thread_id": THREAD_ID, "checkpoint_ns": ""},
+        "parent_checkpoint": None,
+    }
+
+
+def run() -> dict[str, Any]:
+    return {
+        "run_id": RUN_ID,
+        "thread_id": THREAD_ID,
+        "assistant_id": "agent",
+        "status": "pending",
+        "metadata": {},
+        "created_at": "2024-01-01T00:00:00+00:00",
+        "updated_at": "2024-01-01T00:00:00+00:00",
+        "multitask_strategy": "reject",
+    }
+
+
+def get_client(response: dict[str, Any]) -> LangGraphClient:
+    body = orjson.dumps(response)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, content=body, headers={"Content-Type": "application/json"}
+        )
+
+    return LangGraphClient(
+        httpx.AsyncClient(base_url="http://api", transport=httpx.MockTransport(handler))
+    )
+
+
+async def measure(call: Callable[[], Coroutine[Any, Any, Any]]) -> float:
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def bounded() -> None:
+        async with semaphore:
+            await call()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(bounded() for _ in range(CALLS)))
+    return (time.perf_counter() - start) / CALLS * 1e6
+
+
+async def main() -> None:
+    small = get_client(state(2))
+    large = get_client(state(2000))
+    runs = get_client(run())
+    input = {"messages": [{"role": "user", "content": "hi?"}]}
+    benchmarks = {
+        "threads.get_state (small)": lambda: small.threads.get_state(THREAD_ID),
+        "threads.get_state (large)": lambda: large.threads.get_state(THREAD_ID),
+        "runs.create": lambda: runs.runs.create(THREAD_ID, "agent", input=input),
+    }
+    threshold = client_module.JSON_OFFLOAD_THRESHOLD
+    print(f"{'benchmark':<28}{'always offload':>16}{'size-aware':>14}")
+    for name, call in benchmarks.items():
+        await call()  # warm up
+        client_module.JSON_OFFLOAD_THRESHOLD = -1
+        offload = await measure(call)
+        client_module.JSON_OFFLOAD_THRESHOLD = threshold
+        inline = await measure(call)
+        print(f"{name:<28}{offload:>13.1f} us{inline:>11.1f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
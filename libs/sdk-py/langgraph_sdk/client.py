@@ -9,9 +9,14 @@ document Store.
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import datetime
 import logging
 import os
 import sys
+import threading
+import time
+import uuid
 from typing import (
     Any,
     AsyncIterator,
@@ -19,6 +24,7 @@ from typing import (
     Iterator,
     List,
     Literal,
+    NamedTuple,
     Optional,
     Sequence,
     Union,
@@ -195,6 +201,51 @@ class LangGraphClient:
         self.store = StoreClient(self.http)
 
 
+# errors after which a stream is resumed, if the request has a reconnect policy
+RECONNECT_ERRORS = (
+    httpx.NetworkError,
+    httpx.TimeoutException,
+    httpx.RemoteProtocolError,
+)
+
+
+class StreamReconnectPolicy(NamedTuple):
+    """How to resume the stream of a run after the connection drops.
+
+    Once reconnected, the server replays the output produced since the last event
+    received, which is sent to it with the `Last-Event-ID` header."""
+
+    max_attempts: int = 5
+    """Maximum number of consecutive attempts, reset once an event is received."""
+    initial_interval: float = 0.5
+    """Seconds to wait before the first attempt."""
+    backoff_factor: float = 2.0
+    """Multiplier for the interval after each attempt."""
+    max_interval: float = 10.0
+    """Maximum number of seconds to wait between attempts."""
+
+    def interval(self, attempt: int, reconnection_time: Optional[int] = None) -> float:
+        """Seconds to wait before `attempt`, at least the reconnection time
+        (in milliseconds) requested by the server, if any."""
+        interval = min(
+            self.max_interval,
+            self.initial_interval * self.backoff_factor ** (attempt - 1),
+        )
+        if reconnection_time is not None:
+            interval = max(interval, reconnection_time / 1000)
+        return interval
+
+
+def _is_replayed(event_id: str, previous_id: Optional[str], seen: set[str]) -> bool:
+    # events without an id keep the id of the previous event
+    if not event_id or event_id == previous_id:
+        return False
+    elif event_id in seen:
+        return True
+    seen.add(event_id)
+    return False
+
+
 class HttpClient:
     """Handle async requests to the LangGraph API.
 
@@ -290,50 +341,174 @@ class HttpClient:
         *,
         json: Optional[dict] = None,
         params: Optional[QueryParamTypes] = None,
+        headers: Optional[dict[str, str]] = None,
+        reconnect: Optional[StreamReconnectPolicy] = None,
     ) -> AsyncIterator[StreamPart]:
-        """Stream results using SSE."""
-        headers, content = await aencode_json(json)
-        headers["Accept"] = "text/event-stream"
-        headers["Cache-Control"] = "no-store"
-
-        async with self.client.stream(
-            method, path, headers=headers, content=content, params=params
-        ) as res:
-            # check status
+        """Stream results using SSE.
+
+        With `reconnect`, a stream interrupted by a network error is resumed
+        from the `Location` sent by the server (or `path` for GET requests),
+        skipping the events already received."""
+        request_headers, content = await aencode_json(json)
+        request_headers["Accept"] = "text/event-stream"
+        request_headers["Cache-Control"] = "no-store"
+        if headers:
+            request_headers.update(headers)
+        reconnect_path = path if method == "GET" else None
+        reconnection_time: Optional[int] = None
+        seen: set[str] = set()
+        attempt = 0
+
+        while True:
+            decoder = SSEDecoder()
+            previous_id = None
             try:
-                res.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                body = (await res.aread()).decode()
-                if sys.version_info >= (3, 11):
-                    e.add_note(body)
-                else:
-                    logger.error(f"Error from langgraph-api: {body}", exc_info=e)
-                raise e
-            # check content type
-            content_type = res.headers.get("content-type", "").partition(";")[0]
-            if "text/event-stream" not in content_type:
-                raise httpx.TransportError(
-                    "Expected response header Content-Type to contain 'text/event-stream', "
-                    f"got {content_type!r}"
+                async with self.client.stream(
+                    method,
+                    path,
+                    headers=request_headers,
+                    content=content,
+                    params=params,
+                ) as res:
+                    # check status
+                    try:
+                        res.raise_for_status()
+                    except httpx.HTTPStatusError as e:
+                        body = (await res.aread()).decode()
+                        if sys.version_info >= (3, 11):
+                            e.add_note(body)
+                        else:
+                            logger.error(
+                                f"Error from langgraph-api: {body}", exc_info=e
+                            )
+                        raise e
+                    # check content type
+                    content_type = res.headers.get("content-type", "").partition(";")[0]
+                    if "text/event-stream" not in content_type:
+                        raise httpx.TransportError(
+                            "Expected response header Content-Type to contain 'text/event-stream', "
+                            f"got {content_type!r}"
+                        )
+                    reconnect_path = res.headers.get("location", reconnect_path)
+                    # parse SSE
+                    async for line in aiter_lines_raw(res):
+                        sse = decoder.decode(line=line.rstrip(b"\n"))
+                        if sse is None:
+                            continue
+                        attempt = 0
+                        if reconnect is not None and _is_replayed(
+                            decoder.last_event_id, previous_id, seen
+                        ):
+                            continue
+                        previous_id = decoder.last_event_id
+                        yield sse
+                return
+            except RECONNECT_ERRORS:
+                if (
+                    reconnect is None
+                    or reconnect_path is None
+                    or attempt >= reconnect.max_attempts
+                ):
+                    raise
+                attempt += 1
+                reconnection_time = decoder.reconnection_time or reconnection_time
+                logger.warning(
+                    f"Stream from {path} interrupted, reconnecting to {reconnect_path}"
+                    f" (attempt {attempt} of {reconnect.max_attempts})",
+                    exc_info=True,
                 )
-            # parse SSE
-            decoder = SSEDecoder()
-            async for line in aiter_lines_raw(res):
-                sse = decoder.decode(line=line.rstrip(b"\n"))
-                if sse is not None:
-                    yield sse
+                await asyncio.sleep(reconnect.interval(attempt, reconnection_time))
+                if reconnect_path != path:
+                    method, path, params, content = "GET", reconnect_path, None, None
+                    request_headers.pop("Content-Length", None)
+                    request_headers.pop("Content-Type", None)
+                if decoder.last_event_id:
+                    request_headers["Last-Event-ID"] = decoder.last_event_id
+
+
+# JSON bodies larger than this (in bytes) are encoded and decoded in a thread,
+# smaller ones on the event loop, as for them a thread hop costs more than the
+# work itself
+JSON_OFFLOAD_THRESHOLD = int(
+    os.getenv("LANGGRAPH_SDK_JSON_OFFLOAD_THRESHOLD", str(64 * 1024))
+)
+# bodies with more values than this are encoded in a thread, whatever their size,
+# so that sizing a body on the event loop stays cheaper than encoding it
+JSON_OFFLOAD_MAX_VALUES = 64
+# number of threads, shared by all clients, encoding and decoding large bodies
+JSON_MAX_WORKERS = 4
+
+_json_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_json_executor_lock = threading.Lock()
+
+
+def _get_json_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _json_executor
+    with _json_executor_lock:
+        if _json_executor is None:
+            _json_executor = concurrent.futures.ThreadPoolExecutor(
+                JSON_MAX_WORKERS, thread_name_prefix="langgraph-sdk-json"
+            )
+        return _json_executor
+
+
+# values whose JSON encoding is small, whatever the value
+_JSON_SCALARS = (int, float, type(None), datetime.date, datetime.time, uuid.UUID)
+
+
+def _json_size_exceeds(
+    obj: Any, limit: int, max_values: int = JSON_OFFLOAD_MAX_VALUES
+) -> bool:
+    """Whether the JSON encoding of `obj` is likely larger than `limit` bytes,
+    walking only as much of it as needed to tell. Values with more than
+    `max_values` nested values are assumed to be larger."""
+    size = 0
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        max_values -= 1
+        if max_values < 0:
+            return True
+        if isinstance(value, (str, bytes)):
+            size += len(value) + 3
+        elif isinstance(value, dict):
+            size += 2 + len(value)
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            size += 2 + len(value)
+            stack.extend(value)
+        elif isinstance(value, _JSON_SCALARS):
+            size += 32
+        elif isinstance(nbytes := getattr(value, "nbytes", None), int):
+            # numpy arrays, which encode to at least one byte per byte of data
+            size += nbytes
+        else:
+            # sets, dataclasses, models converted by orjson_default, etc.
+            # of unknown size
+            return True
+        if size > limit:
+            return True
+    return False
 
 
 async def aencode_json(json: Any) -> tuple[dict[str, str], bytes]:
     if json is None:
         return {}, None
-    body = await asyncio.get_running_loop().run_in_executor(
-        None,
-        orjson.dumps,
-        json,
-        orjson_default,
-        orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
-    )
+    if _json_size_exceeds(json, JSON_OFFLOAD_THRESHOLD):
+        body = await asyncio.get_running_loop().run_in_executor(
+            _get_json_executor(),
+            orjson.dumps,
+            json,
+            orjson_default,
+            orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    else:
+        body = orjson.dumps(
+            json,
+            orjson_default,
+            orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
     content_length = str(len(body))
     content_type = "application/json"
     headers = {"Content-Length": content_length, "Content-Type": content_type}
@@ -342,11 +517,14 @@ async def aencode_json(json: Any) -> tuple[dict[str, str], bytes]:
 
 async def adecode_json(r: httpx.Response) -> Any:
     body = await r.aread()
-    return (
-        await asyncio.get_running_loop().run_in_executor(None, orjson.loads, body)
-        if body
-        else None
-    )
+    if not body:
+        return None
+    elif len(body) > JSON_OFFLOAD_THRESHOLD:
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_json_executor(), orjson.loads, body
+        )
+    else:
+        return orjson.loads(body)
 
 
 class AssistantsClient:
@@ -1182,6 +1360,78 @@ class ThreadsClient:
             payload["checkpoint"] = checkpoint
         return await self.http.post(f"/threads/{thread_id}/history", json=payload)
 
+    async def iter_history(
+        self,
+        thread_id: str,
+        *,
+        page_size: int = 100,
+        limit: Optional[int] = None,
+        before: Optional[str | Checkpoint] = None,
+        metadata: Optional[dict] = None,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> AsyncIterator[ThreadState]:
+        """Iterate over the state history of a thread, most recent first.
+
+        States are fetched in pages of `page_size`, using the last state of each
+        page as the `before` cursor of the next one, which is requested while the
+        current page is being consumed.
+
+        Args:
+            thread_id: The ID of the thread to get the state history for.
+            page_size: The number of states to fetch per request.
+            limit: The maximum number of states to return. Defaults to all of them.
+            before: Return states before this checkpoint.
+            metadata: Filter states by metadata key-value pairs.
+            checkpoint: Return states for this subgraph. If empty defaults to root.
+
+        Returns:
+            AsyncIterator[ThreadState]: the state history of the thread.
+
+        Example Usage:
+
+            async for thread_state in client.threads.iter_history(
+                thread_id="my_thread_id",
+                metadata={"source": "loop"},
+            ):
+                print(thread_state["checkpoint"])
+
+        """  # noqa: E501
+        remaining = limit
+        if remaining is not None and remaining <= 0:
+            return
+        size = page_size if remaining is None else min(page_size, remaining)
+        next_page: Optional[asyncio.Future[list[ThreadState]]] = asyncio.ensure_future(
+            self.get_history(
+                thread_id,
+                limit=size,
+                before=before,
+                metadata=metadata,
+                checkpoint=checkpoint,
+            )
+        )
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                if remaining is not None:
+                    remaining -= len(page)
+                if len(page) == size and (remaining is None or remaining > 0):
+                    size = page_size if remaining is None else min(page_size, remaining)
+                    next_page = asyncio.ensure_future(
+                        self.get_history(
+                            thread_id,
+                            limit=size,
+                            before=page[-1]["checkpoint"],
+                            metadata=metadata,
+                            checkpoint=checkpoint,
+                        )
+                    )
+                for state in page:
+                    yield state
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
 
 class RunsClient:
     """Client for managing runs in LangGraph.
@@ -1220,6 +1470,7 @@ class RunsClient:
         multitask_strategy: Optional[MultitaskStrategy] = None,
         if_not_exists: Optional[IfNotExists] = None,
         after_seconds: Optional[int] = None,
+        reconnect: Optional[StreamReconnectPolicy] = StreamReconnectPolicy(),
     ) -> AsyncIterator[StreamPart]: ...
 
     @overload
@@ -1242,6 +1493,7 @@ class RunsClient:
         if_not_exists: Optional[IfNotExists] = None,
         webhook: Optional[str] = None,
         after_seconds: Optional[int] = None,
+        reconnect: Optional[StreamReconnectPolicy] = StreamReconnectPolicy(),
     ) -> AsyncIterator[StreamPart]: ...
 
     def stream(
@@ -1266,6 +1518,7 @@ class RunsClient:
         multitask_strategy: Optional[MultitaskStrategy] = None,
         if_not_exists: Optional[IfNotExists] = None,
         after_seconds: Optional[int] = None,
+        reconnect: Optional[StreamReconnectPolicy] = StreamReconnectPolicy(),
     ) -> AsyncIterator[StreamPart]:
         """Create a run and stream the results.
 
@@ -1295,6 +1548,8 @@ class RunsClient:
                 Must be either 'reject' (raise error if missing), or 'create' (create new thread).
             after_seconds: The number of seconds to wait before starting the run.
                 Use to schedule future runs.
+            reconnect: How to resume the stream if the connection drops before
+                the run is done. Set to None to raise the error instead.
 
         Returns:
             AsyncIterator[StreamPart]: Asynchronous iterator of stream results.
@@ -1352,7 +1607,10 @@ class RunsClient:
             else "/runs/stream"
         )
         return self.http.stream(
-            endpoint, "POST", json={k: v for k, v in payload.items() if v is not None}
+            endpoint,
+            "POST",
+            json={k: v for k, v in payload.items() if v is not None},
+            reconnect=reconnect,
         )
 
     @overload
@@ -1837,10 +2095,12 @@ class RunsClient:
         *,
         cancel_on_disconnect: bool = False,
         stream_mode: Optional[Union[StreamMode, Sequence[StreamMode]]] = None,
+        last_event_id: Optional[str] = None,
+        reconnect: Optional[StreamReconnectPolicy] = StreamReconnectPolicy(),
     ) -> AsyncIterator[StreamPart]:
         """Stream output from a run in real-time, until the run is done.
         Output is not buffered, so any output produced before this call will
-        not be received here.
+        not be received here, unless `last_event_id` is passed.
 
         Args:
             thread_id: The thread ID to join.
@@ -1849,6 +2109,10 @@ class RunsClient:
             stream_mode: The stream mode(s) to use. Must be a subset of the stream modes passed
                 when creating the run. Background runs default to having the union of all
                 stream modes.
+            last_event_id: The id of the last event received from a previous stream of
+                this run, to receive the output produced after it.
+            reconnect: How to resume the stream if the connection drops before
+                the run is done. Set to None to raise the error instead.
 
         Returns:
             None
@@ -1869,6 +2133,8 @@ class RunsClient:
                 "cancel_on_disconnect": cancel_on_disconnect,
                 "stream_mode": stream_mode,
             },
+            headers={"Last-Event-ID": last_event_id} if last_event_id else None,
+            reconnect=reconnect,
         )
 
     async def delete(self, thread_id: str, run_id: str) -> None:
@@ -2506,35 +2772,87 @@ class SyncHttpClient:
         *,
         json: Optional[dict] = None,
         params: Optional[QueryParamTypes] = None,
+        headers: Optional[dict[str, str]] = None,
+        reconnect: Optional[StreamReconnectPolicy] = None,
     ) -> Iterator[StreamPart]:
-        """Stream the results of a request using SSE."""
-        headers, content = encode_json(json)
-        with self.client.stream(
-            method, path, headers=headers, content=content, params=params
-        ) as res:
-            # check status
+        """Stream the results of a request using SSE.
+
+        With `reconnect`, a stream interrupted by a network error is resumed
+        from the `Location` sent by the server (or `path` for GET requests),
+        skipping the events already received."""
+        request_headers, content = encode_json(json)
+        if headers:
+            request_headers.update(headers)
+        reconnect_path = path if method == "GET" else None
+        reconnection_time: Optional[int] = None
+        seen: set[str] = set()
+        attempt = 0
+
+        while True:
+            decoder = SSEDecoder()
+            previous_id = None
             try:
-                res.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                body = (res.read()).decode()
-                if sys.version_info >= (3, 11):
-                    e.add_note(body)
-                else:
-                    logger.error(f"Error from langgraph-api: {body}", exc_info=e)
-                raise e
-            # check content type
-            content_type = res.headers.get("content-type", "").partition(";")[0]
-            if "text/event-stream" not in content_type:
-                raise httpx.TransportError(
-                    "Expected response header Content-Type to contain 'text/event-stream', "
-                    f"got {content_type!r}"
+                with self.client.stream(
+                    method,
+                    path,
+                    headers=request_headers,
+                    content=content,
+                    params=params,
+                ) as res:
+                    # check status
+                    try:
+                        res.raise_for_status()
+                    except httpx.HTTPStatusError as e:
+                        body = (res.read()).decode()
+                        if sys.version_info >= (3, 11):
+                            e.add_note(body)
+                        else:
+                            logger.error(
+                                f"Error from langgraph-api: {body}", exc_info=e
+                            )
+                        raise e
+                    # check content type
+                    content_type = res.headers.get("content-type", "").partition(";")[0]
+                    if "text/event-stream" not in content_type:
+                        raise httpx.TransportError(
+                            "Expected response header Content-Type to contain 'text/event-stream', "
+                            f"got {content_type!r}"
+                        )
+                    reconnect_path = res.headers.get("location", reconnect_path)
+                    # parse SSE
+                    for line in iter_lines_raw(res):
+                        sse = decoder.decode(line.rstrip(b"\n"))
+                        if sse is None:
+                            continue
+                        attempt = 0
+                        if reconnect is not None and _is_replayed(
+                            decoder.last_event_id, previous_id, seen
+                        ):
+                            continue
+                        previous_id = decoder.last_event_id
+                        yield sse
+                return
+            except RECONNECT_ERRORS:
+                if (
+                    reconnect is None
+                    or reconnect_path is None
+                    or attempt >= reconnect.max_attempts
+                ):
+                    raise
+                attempt += 1
+                reconnection_time = decoder.reconnection_time or reconnection_time
+                logger.warning(
+                    f"Stream from {path} interrupted, reconnecting to {reconnect_path}"
+                    f" (attempt {attempt} of {reconnect.max_attempts})",
+                    exc_info=True,
                 )
-            # parse SSE
-            decoder = SSEDecoder()
-            for line in iter_lines_raw(res):
-                sse = decoder.decode(line.rstrip(b"\n"))
-                if sse is not None:
-                    yield sse
+                time.sleep(reconnect.interval(attempt, reconnection_time))
+                if reconnect_path != path:
+                    method, path, params, content = "GET", reconnect_path, None, None
+                    request_headers.pop("Content-Length", None)
+                    request_headers.pop("Content-Type", None)
+                if decoder.last_event_id:
+                    request_headers["Last-Event-ID"] = decoder.last_event_id
 
 
 def encode_json(json: Any) -> tuple[dict[str, str], bytes]:
@@ -3379,6 +3697,79 @@ class SyncThreadsClient:
             payload["checkpoint"] = checkpoint
         return self.http.post(f"/threads/{thread_id}/history", json=payload)
 
+    def iter_history(
+        self,
+        thread_id: str,
+        *,
+        page_size: int = 100,
+        limit: Optional[int] = None,
+        before: Optional[str | Checkpoint] = None,
+        metadata: Optional[dict] = None,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> Iterator[ThreadState]:
+        """Iterate over the state history of a thread, most recent first.
+
+        States are fetched in pages of `page_size`, using the last state of each
+        page as the `before` cursor of the next one, which is requested in a
+        background thread while the current page is being consumed.
+
+        Args:
+            thread_id: The ID of the thread to get the state history for.
+            page_size: The number of states to fetch per request.
+            limit: The maximum number of states to return. Defaults to all of them.
+            before: Return states before this checkpoint.
+            metadata: Filter states by metadata key-value pairs.
+            checkpoint: Return states for this subgraph. If empty defaults to root.
+
+        Returns:
+            Iterator[ThreadState]: the state history of the thread.
+
+        Example Usage:
+
+            for thread_state in client.threads.iter_history(
+                thread_id="my_thread_id",
+                metadata={"source": "loop"},
+            ):
+                print(thread_state["checkpoint"])
+
+        """  # noqa: E501
+        remaining = limit
+        if remaining is not None and remaining <= 0:
+            return
+        size = page_size if remaining is None else min(page_size, remaining)
+        executor = concurrent.futures.ThreadPoolExecutor(
+            1, thread_name_prefix="langgraph-sdk-history"
+        )
+        next_page: Optional[concurrent.futures.Future[list[ThreadState]]] = (
+            executor.submit(
+                self.get_history,
+                thread_id,
+                limit=size,
+                before=before,
+                metadata=metadata,
+                checkpoint=checkpoint,
+            )
+        )
+        try:
+            while next_page is not None:
+                page = next_page.result()
+                next_page = None
+                if remaining is not None:
+                    remaining -= len(page)
+                if len(page) == size and (remaining is None or remaining > 0):
+                    size = page_size if remaining is None else min(page_size, remaining)
+                    next_page = executor.submit(
+                        self.get_history,
+                        thread_id,
+                        limit=size,
+                        before=page[-1]["checkpoint"],
+                        metadata=metadata,
+                        checkpoint=checkpoint,
+                    )
+                yield from page
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
 
 class SyncRunsClient:
     """Synchronous client for managing runs in LangGraph.
@@ -3417,6 +3808,7 @@ class SyncRunsClient:
         multitask_strategy: Optional[MultitaskStrategy] = None,
         if_not_exists: Optional[IfNotExists] = None,
         after_seconds: Optional[int] = None,
+        reconnect: Optional[StreamReconnectPolicy] = StreamReconnectPolicy(),
     ) -> Iterator[StreamPart]: ...
 
     @overload
@@ -3439,6 +3831,7 @@ class SyncRunsClient:
         if_not_exists: Optional[IfNotExists] = None,
         webhook: Optional[str] = None,
         after_seconds: Optional[int] = None,
+        reconnect: Optional[StreamReconnectPolicy] = StreamReconnectPolicy(),
     ) -> Iterator[StreamPart]: ...
 
     def stream(
@@ -3463,6 +3856,7 @@ class SyncRunsClient:
         multitask_strategy: Optional[MultitaskStrategy] = None,
         if_not_exists: Optional[IfNotExists] = None,
         after_seconds: Optional[int] = None,
+        reconnect: Optional[StreamReconnectPolicy] = StreamReconnectPolicy(),
     ) -> Iterator[StreamPart]:
         """Create a run and stream the results.
 
@@ -3492,6 +3886,8 @@ class SyncRunsClient:
                 Must be either 'reject' (raise error if missing), or 'create' (create new thread).
             after_seconds: The number of seconds to wait before starting the run.
                 Use to schedule future runs.
+            reconnect: How to resume the stream if the connection drops before
+                the run is done. Set to None to raise the error instead.
 
         Returns:
             Iterator[StreamPart]: Iterator of stream results.
@@ -3549,7 +3945,10 @@ class SyncRunsClient:
             else "/runs/stream"
         )
         return self.http.stream(
-            endpoint, "POST", json={k: v for k, v in payload.items() if v is not None}
+            endpoint,
+            "POST",
+            json={k: v for k, v in payload.items() if v is not None},
+            reconnect=reconnect,
         )
 
     @overload
@@ -4007,10 +4406,12 @@ class SyncRunsClient:
         *,
         stream_mode: Optional[Union[StreamMode, Sequence[StreamMode]]] = None,
         cancel_on_disconnect: bool = False,
+        last_event_id: Optional[str] = None,
+        reconnect: Optional[StreamReconnectPolicy] = StreamReconnectPolicy(),
     ) -> Iterator[StreamPart]:
         """Stream output from a run in real-time, until the run is done.
         Output is not buffered, so any output produced before this call will
-        not be received here.
+        not be received here, unless `last_event_id` is passed.
 
         Args:
             thread_id: The thread ID to join.
@@ -4019,6 +4420,10 @@ class SyncRunsClient:
                 when creating the run. Background runs default to having the union of all
                 stream modes.
             cancel_on_disconnect: Whether to cancel the run when the stream is disconnected.
+            last_event_id: The id of the last event received from a previous stream of
+                this run, to receive the output produced after it.
+            reconnect: How to resume the stream if the connection drops before
+                the run is done. Set to None to raise the error instead.
 
         Returns:
             None
@@ -4039,6 +4444,8 @@ class SyncRunsClient:
                 "stream_mode": stream_mode,
                 "cancel_on_disconnect": cancel_on_disconnect,
             },
+            headers={"Last-Event-ID": last_event_id} if last_event_id else None,
+            reconnect=reconnect,
         )
 
     def delete(self, thread_id: str, run_id: str) -> None:
@@ -76,7 +76,21 @@ class SSEDecoder:
         self._event = ""
         self._data = bytearray()
         self._last_event_id = ""
+        self._dispatched_event_id = ""
         self._retry: Optional[int] = None
+        self._reconnection_time: Optional[int] = None
+
+    @property
+    def last_event_id(self) -> str:
+        """The id of the last event returned by `decode`, sent back to the server
+        with the `Last-Event-ID` header when reconnecting. An id read for an event
+        that wasn't completed isn't included, so the event is replayed."""
+        return self._dispatched_event_id
+
+    @property
+    def reconnection_time(self) -> Optional[int]:
+        """The time to wait before reconnecting set by the server, in milliseconds."""
+        return self._reconnection_time
 
     def decode(self, line: bytes) -> Optional[StreamPart]:
         # See: https://html.spec.whatwg.org/multipage/server-sent-events.html#event-stream-interpretation  # noqa: E501
@@ -96,6 +110,7 @@ class SSEDecoder:
             )
 
             # NOTE: as per the SSE spec, do not reset last_event_id.
+            self._dispatched_event_id = self._last_event_id
             self._event = ""
             self._data = bytearray()
             self._retry = None
@@ -121,7 +136,7 @@ class SSEDecoder:
                 self._last_event_id = value.decode()
         elif fieldname == b"retry":
             try:
-                self._retry = int(value)
+                self._retry = self._reconnection_time = int(value)
             except (TypeError, ValueError):
                 pass
         else: